@@ -0,0 +1,4 @@
+"""
+Benchmarks for the bh_engine data structures
+Run from the repository root, e.g. python -m benchmarks.case_stream
+"""
@@ -0,0 +1,103 @@
+"""
+Alternative parts benchmark
+Builds a synthetic catalog of N parts (default 100k) over the real
+categories and aircraft types, stocks some of them at the six hubs, and times
+finding the top 3 in-stock alternatives for random parts with the category
+and aircraft bitset indexes against a scan of the whole catalog that looks
+up each candidate's inventory, checking both return the same parts
+
+    python -m benchmarks.alternative_parts [N]
+"""
+
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from bh_engine.alternatives import AlternativePartsIndex
+from bh_engine.inventory import HUBS, NO_ARRIVAL, InventoryMatrix
+from bh_engine.part_search import PartSearchIndex, aircraft_family
+
+CATALOG_FILE = Path("BH_Worldwide_Logistics/Operations/Parts_Database/aircraft_parts_catalog.json")
+QUERIES = 200
+
+
+def synthetic_catalog(count, seed=3):
+    rng = random.Random(seed)
+    with open(CATALOG_FILE) as f:
+        catalog = json.load(f)
+    categories = sorted({part["category"] for part in catalog})
+    aircraft = sorted({a for part in catalog for a in part["compatible_aircraft_types"]})
+    return [
+        {
+            "part_number": f"SYN-{i:07d}",
+            "description": f"{rng.choice(categories)} part {i}",
+            "category": rng.choice(categories),
+            "compatible_aircraft_types": rng.sample(aircraft, 3),
+        }
+        for i in range(count)
+    ]
+
+
+def synthetic_inventory(catalog, seed=4):
+    """Most parts out of stock everywhere, the rest with a few units at some hubs"""
+    rng = np.random.default_rng(seed)
+    shape = (len(catalog), len(HUBS))
+    stock = np.where(rng.random(shape) < 0.05, rng.integers(1, 8, shape), 0).astype(np.int32)
+    reserved = np.zeros(shape, dtype=np.int32)
+    return InventoryMatrix([part["part_number"] for part in catalog], HUBS, stock, reserved,
+                           np.zeros(shape, dtype=np.int32), np.full(shape, NO_ARRIVAL, dtype=np.int32))
+
+
+def scan(catalog, matrix, part_number, k=3):
+    """Reference: every catalog part checked in turn, with a per-candidate inventory lookup"""
+    primary = next(part for part in catalog if part["part_number"] == part_number)
+    families = {aircraft_family(aircraft) for aircraft in primary["compatible_aircraft_types"]}
+    found = []
+    for part in catalog:
+        if (part["category"] == primary["category"] and part["part_number"] != part_number
+                and families & {aircraft_family(aircraft) for aircraft in part["compatible_aircraft_types"]}):
+            metrics = matrix.part_metrics(part["part_number"])
+            if metrics and metrics["total_available"] > 0:
+                found.append((-metrics["total_available"], len(found), part["part_number"]))
+    return [part_number for _, _, part_number in sorted(found)[:k]]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 100_000
+    catalog = synthetic_catalog(count)
+    matrix = synthetic_inventory(catalog)
+
+    start = time.perf_counter()
+    index = AlternativePartsIndex.from_catalog(catalog, PartSearchIndex.from_catalog(catalog), matrix)
+    print(f"📦 {count:,} parts, {len(index.categories)} categories, {len(index.families)} aircraft families, "
+          f"indexed in {time.perf_counter() - start:.1f} s")
+
+    queries = random.Random(9).sample([part["part_number"] for part in catalog], QUERIES)
+    times = []
+    for part_number in queries:
+        start = time.perf_counter()
+        index.find(part_number, matrix)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    print(f"indexes        median {statistics.median(times) * 1000:8.3f} ms   "
+          f"p95 {times[int(len(times) * 0.95)] * 1000:8.3f} ms")
+
+    # The scan is slow, so it only times and checks the first few queries
+    times = []
+    for part_number in queries[:5]:
+        start = time.perf_counter()
+        expected = scan(catalog, matrix, part_number)
+        times.append(time.perf_counter() - start)
+        assert [alternative.part["part_number"] for alternative in index.find(part_number, matrix)] == expected
+    print(f"full scan      median {statistics.median(times) * 1000:8.3f} ms   (same alternatives)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
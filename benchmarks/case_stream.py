@@ -0,0 +1,83 @@
+"""
+Streaming case ingestion benchmark
+Writes a synthetic case export of N records and compares time and peak
+memory of json.load against the batched streaming reader, for aggregating
+the cases and for loading every record into the store (which parses files
+up to STREAM_ABOVE_BYTES whole and streams larger ones)
+
+    python -m benchmarks.case_stream [N] [--jsonl]
+"""
+
+import json
+import math
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from bh_engine.cases import CASES_KEY, STREAM_ABOVE_BYTES, CaseAggregates, read_case_document
+
+SAMPLE_FILE = Path("BH_Worldwide_Logistics/Operations/AOG_Center/extended_aog_cases.json")
+
+
+def write_cases(path, count, jsonl=False):
+    """Write count cases cycled from the sample file, one record at a time"""
+    with open(SAMPLE_FILE) as f:
+        samples = json.load(f)[CASES_KEY]
+    with open(path, "w") as f:
+        if not jsonl:
+            f.write('{"%s": [\n' % CASES_KEY)
+        for i in range(count):
+            case = dict(samples[i % len(samples)], case_id=f"AOG-ARCHIVE-{i:08d}")
+            if jsonl:
+                f.write(json.dumps(case) + "\n")
+            else:
+                f.write(("," if i else "") + json.dumps(case) + "\n")
+        if not jsonl:
+            f.write("]}\n")
+
+
+def measure(label, fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {elapsed:8.2f} s   peak {peak / 1024 / 1024:9.1f} MB")
+    return result
+
+
+def load_and_aggregate(path):
+    with open(path) as f:
+        return CaseAggregates.from_cases(json.load(f)[CASES_KEY])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    jsonl = "--jsonl" in argv
+    numbers = [arg for arg in argv if not arg.startswith("--")]
+    count = int(numbers[0]) if numbers else 200_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ("cases.jsonl" if jsonl else "cases.json")
+        write_cases(path, count, jsonl=jsonl)
+        print(f"📦 {count:,} cases, {path.stat().st_size / 1024 / 1024:.1f} MB ({path.suffix})")
+
+        streamed = measure("streaming batches", lambda: CaseAggregates.from_file(path))
+        if not jsonl:
+            loaded = measure("json.load + list", lambda: load_and_aggregate(path))
+            assert loaded.by_urgency == streamed.by_urgency
+
+            whole = measure("load records, whole", lambda: read_case_document(path, stream_above=math.inf))
+            parts = measure("load records, streamed", lambda: read_case_document(path, stream_above=0))
+            assert whole == parts
+            chosen = "streamed" if path.stat().st_size > STREAM_ABOVE_BYTES else "whole"
+            print(f"the store loads this file {chosen} (streams above {STREAM_ABOVE_BYTES / 1024 / 1024:.0f} MB)")
+        print(f"✅ {streamed.total_cases:,} cases aggregated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
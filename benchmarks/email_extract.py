@@ -0,0 +1,88 @@
+"""
+AOG email extraction throughput benchmark
+Writes N synthetic AOG request emails (default 20k) to a temporary mbox file
+and Maildir directory, then extracts line items, aircraft, tail, location,
+deadline and loss rate from them in memory and streamed from each mailbox,
+and reports emails per second
+
+    python -m benchmarks.email_extract [N]
+"""
+
+import mailbox
+import random
+import sys
+import tempfile
+import time
+from email.message import EmailMessage
+from pathlib import Path
+
+from bh_engine import DataStore
+
+DATA = "BH_Worldwide_Logistics"
+
+AIRCRAFT = ["Boeing 777-300ER", "Boeing 787-9", "Airbus A320", "Airbus A350-900", "Airbus A380", "Embraer E190"]
+AIRPORTS = ["LHR", "FRA", "DXB", "SIN", "JFK", "CDG", "AMS", "DUB"]
+VENDORS = ["Honeywell", "Parker", "Goodrich", "Rockwell", "Hamilton", "Kidde", "Thales", "Safran"]
+
+
+def synthetic_emails(store, count, seed=11):
+    """(subject, body) pairs in the AOG email format, line items drawn from the catalog"""
+    rng = random.Random(seed)
+    descriptions = [part["description"] for part in store.parts_catalog] or ["Hydraulic pump"]
+    emails = []
+    for i in range(count):
+        aircraft, airport = rng.choice(AIRCRAFT), rng.choice(AIRPORTS)
+        tail = f"G-{''.join(rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(4))}"
+        items = "\n".join(
+            f"- {rng.choice(descriptions)} ({rng.choice(VENDORS)} PN: {rng.randint(1000, 99999)}-{rng.randint(1, 9)})"
+            f" - Qty: {rng.randint(1, 12)}"
+            for _ in range(rng.randint(1, 15))
+        )
+        body = (f"URGENT AOG - {aircraft} {tail} at {airport}. Need following parts immediately:\n\n{items}\n\n"
+                f"Required by {rng.randint(6, 22):02d}00 tomorrow. "
+                f"Cost of delay: £{rng.randint(5, 150) * 1000:,}/hour.\n\nOperations Control")
+        emails.append((f"AOG {aircraft} {tail} at {airport} #{i}", body))
+    return emails
+
+
+def write_mailboxes(emails, directory):
+    """The emails as an mbox file and a Maildir directory under directory"""
+    mbox_path, maildir_path = Path(directory) / "aog.mbox", Path(directory) / "aog.maildir"
+    mbox, maildir = mailbox.mbox(mbox_path), mailbox.Maildir(maildir_path)
+    for subject, body in emails:
+        message = EmailMessage()
+        message["Subject"] = subject
+        message["From"] = "ops@airline.example"
+        message.set_content(body)
+        mbox.add(message)
+        maildir.add(message)
+    mbox.flush()
+    return mbox_path, maildir_path
+
+
+def main(argv=None):
+    from bh_engine.emails import extract_email, extract_mailbox
+
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 20_000
+    emails = synthetic_emails(DataStore.load(DATA), count)
+    print(f"📧 {count:,} emails, {sum(body.count('Qty:') for _, body in emails):,} line items")
+
+    start = time.perf_counter()
+    extracted = [extract_email(body, subject) for subject, body in emails]
+    in_memory = time.perf_counter() - start
+    assert sum(len(email.line_items) for email in extracted) == sum(body.count("Qty:") for _, body in emails)
+    print(f"in memory      {in_memory:7.2f} s   {count / in_memory:10,.0f} emails/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, path in zip(("mbox", "Maildir"), write_mailboxes(emails, directory)):
+            start = time.perf_counter()
+            streamed = sum(1 for _ in extract_mailbox(path))
+            elapsed = time.perf_counter() - start
+            assert streamed == count
+            print(f"{name:<14} {elapsed:7.2f} s   {count / elapsed:10,.0f} emails/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
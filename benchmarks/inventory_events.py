@@ -0,0 +1,76 @@
+"""
+Incremental inventory aggregates benchmark
+Builds a live inventory state over P synthetic parts (default 100k) at the
+six hubs, applies N random stock, reservation and arrival events (default
+200k) and compares reading the health metrics from the running aggregates
+with recomputing them from the arrays, then checks the two agree
+
+    python -m benchmarks.inventory_events [P] [N]
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from bh_engine.inventory import HUBS, NO_ARRIVAL, InventoryMatrix, InventoryState
+
+
+def synthetic_matrix(count, seed=21):
+    rng = np.random.default_rng(seed)
+    shape = (count, len(HUBS))
+    stock = rng.integers(0, 12, shape, dtype=np.int32)
+    reserved = np.minimum(rng.integers(0, 3, shape, dtype=np.int32), stock)
+    incoming = np.where(rng.random(shape) < 0.2, rng.integers(1, 10, shape), 0).astype(np.int32)
+    arrival = np.where(incoming > 0, 20_300 + rng.integers(0, 60, shape), NO_ARRIVAL).astype(np.int32)
+    return InventoryMatrix([f"SYN-{i:07d}" for i in range(count)], HUBS, stock, reserved, incoming, arrival)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parts = int(argv[0]) if argv else 100_000
+    count = int(argv[1]) if len(argv) > 1 else 200_000
+    matrix = synthetic_matrix(parts)
+
+    start = time.perf_counter()
+    state = InventoryState(matrix)
+    print(f"📦 {parts:,} parts x {len(HUBS)} hubs, state built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rng = random.Random(5)
+    events = [(rng.random(), rng.choice(matrix.part_numbers), rng.choice(HUBS), rng.randint(-3, 4))
+              for _ in range(count)]
+    start = time.perf_counter()
+    rejected = 0
+    for kind, part_number, hub, delta in events:
+        try:
+            if kind < 0.45:
+                state.adjust_stock(part_number, hub, delta)
+            elif kind < 0.9:
+                state.adjust_reserved(part_number, hub, delta)
+            else:
+                state.receive(part_number, hub)
+        except ValueError:
+            rejected += 1
+    elapsed = time.perf_counter() - start
+    print(f"events         {elapsed:7.2f} s   {count / elapsed:10,.0f} events/s   ({rejected:,} rejected)")
+
+    reads = 1_000
+    start = time.perf_counter()
+    for _ in range(reads):
+        state.metrics()
+    running = (time.perf_counter() - start) / reads
+    # verify() is a full recompute plus the comparison
+    start = time.perf_counter()
+    for _ in range(10):
+        mismatches = state.verify()
+    recompute = (time.perf_counter() - start) / 10
+    print(f"metrics read   {running * 1e6:9.1f} µs   recompute {recompute * 1e3:7.2f} ms   "
+          f"({recompute / running:,.0f}x)")
+    assert not mismatches, mismatches
+    print("✅ running aggregates match a full recompute")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
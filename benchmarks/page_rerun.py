@@ -0,0 +1,48 @@
+"""
+Per-interaction latency benchmark
+Drives app.py through Streamlit's AppTest and times the median rerun of
+each page, i.e. what every widget interaction costs
+
+    python -m benchmarks.page_rerun [reruns]
+"""
+
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+APP = Path(__file__).resolve().parent.parent / "app.py"
+VIEWS = sorted(path.relative_to(APP.parent).as_posix() for path in (APP.parent / "views").glob("*.py"))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    reruns = int(argv[0]) if argv else 5
+    # Streamlit logs deprecation warnings on every rerun
+    logging.disable(logging.WARNING)
+
+    at = AppTest.from_file(str(APP), default_timeout=120)
+    at.run()
+    print(f"{'page':<36} {'median rerun':>12}")
+    medians = []
+    for view in VIEWS:
+        at.switch_page(view).run()
+        times = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+        if at.exception:
+            print(f"❌ {view}: {at.exception[0].value}")
+            return 1
+        medians.append(statistics.median(times))
+        print(f"{view:<36} {medians[-1] * 1000:9.0f} ms")
+    print(f"{'mean':<36} {statistics.mean(medians) * 1000:9.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
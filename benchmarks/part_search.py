@@ -0,0 +1,73 @@
+"""
+Part matcher benchmark
+Builds the BM25 part index over N synthetic catalog entries (default 500k)
+and times queries taken from the AOG cases, with and without the aircraft
+filter
+
+    python -m benchmarks.part_search [N]
+"""
+
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from bh_engine.part_search import PartSearchIndex
+
+DATA = Path("BH_Worldwide_Logistics")
+CATALOG_FILE = DATA / "Operations/Parts_Database/aircraft_parts_catalog.json"
+CASES_FILE = DATA / "Operations/AOG_Center/extended_aog_cases.json"
+
+
+def synthetic_catalog(count, seed=7):
+    """Catalog entries mixing real categories, aircraft and case part names"""
+    rng = random.Random(seed)
+    with open(CATALOG_FILE) as f:
+        catalog = json.load(f)
+    with open(CASES_FILE) as f:
+        cases = json.load(f)["active_aog_cases"]
+    categories = sorted({part["category"] for part in catalog})
+    aircraft = sorted({a for part in catalog for a in part["compatible_aircraft_types"]} | {c["aircraft"] for c in cases})
+    names = sorted({c["part_needed"] for c in cases})
+    return [
+        {
+            "part_number": f"SYN-{i:07d}",
+            "description": f"{rng.choice(names)} {rng.choice(categories)} component for {rng.choice(aircraft)}",
+            "category": rng.choice(categories),
+            "compatible_aircraft_types": rng.sample(aircraft, 3),
+        }
+        for i in range(count)
+    ], cases
+
+
+def time_queries(index, cases, aircraft_filter):
+    times = []
+    for case in cases:
+        start = time.perf_counter()
+        index.search(case["part_needed"], k=5, aircraft_type=case["aircraft"] if aircraft_filter else None)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return statistics.median(times) * 1000, times[int(len(times) * 0.95)] * 1000
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 500_000
+    catalog, cases = synthetic_catalog(count)
+
+    start = time.perf_counter()
+    index = PartSearchIndex.from_catalog(catalog)
+    print(f"📦 {count:,} parts, {len(index.terms):,} terms, built in {time.perf_counter() - start:.1f} s")
+
+    # Warm up, then time every case query
+    time_queries(index, cases, True)
+    for label, aircraft_filter in (("aircraft filter", True), ("no filter", False)):
+        median, p95 = time_queries(index, cases, aircraft_filter)
+        print(f"{label:<16} median {median:7.3f} ms   p95 {p95:7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
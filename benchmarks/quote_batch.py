@@ -0,0 +1,57 @@
+"""
+Batch quote throughput benchmark
+Quotes N synthetic pending cases (default 10k) one at a time with
+compute_quote and in one pass with compute_quotes, and reports quotes per
+second for each
+
+    python -m benchmarks.quote_batch [N]
+"""
+
+import random
+import sys
+import time
+
+from bh_engine import DataStore
+
+DATA = "BH_Worldwide_Logistics"
+
+
+def synthetic_cases(store, count, seed=7):
+    """Cases cycled from the real ones, with part numbers drawn from cases, catalog and inventory"""
+    rng = random.Random(seed)
+    samples = store.active_cases["active_aog_cases"]
+    part_numbers = sorted({case["part_number"] for case in samples}
+                          | {part["part_number"] for part in store.parts_catalog}
+                          | set(store.inventory_matrix.row_index))
+    return [
+        dict(samples[i % len(samples)], case_id=f"AOG-BATCH-{i:06d}", part_number=rng.choice(part_numbers))
+        for i in range(count)
+    ]
+
+
+def main(argv=None):
+    from bh_engine.quotes import compute_quote, compute_quotes
+
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 10_000
+    store = DataStore.load(DATA)
+    cases = synthetic_cases(store, count)
+    print(f"🧾 {count:,} cases over {len({case['part_number'] for case in cases}):,} distinct parts")
+
+    start = time.perf_counter()
+    for case in cases:
+        compute_quote(store, case, case["case_id"])
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    quotes = compute_quotes(store, cases)
+    batch = time.perf_counter() - start
+    assert len(quotes) == count and len({quote["quote_id"] for quote in quotes}) == count
+
+    print(f"one at a time  {single:7.2f} s   {count / single:10,.0f} quotes/s")
+    print(f"batch          {batch:7.2f} s   {count / batch:10,.0f} quotes/s   ({single / batch:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Record memory benchmark
+Holds N cases (default 200k) as plain dicts and as compact CaseRecords and
+compares the memory each representation retains. Allocations are traced
+over the first 20k cases only, since tracing makes building several times
+slower, and scaled to N; the build times are untraced, over all N
+
+    python -m benchmarks.record_memory [N]
+"""
+
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from bh_engine.cases import CASES_KEY
+from bh_engine.records import CaseRecord
+
+SAMPLE_FILE = Path("BH_Worldwide_Logistics/Operations/AOG_Center/extended_aog_cases.json")
+# Cases built under tracemalloc to measure the bytes each one retains
+TRACED_CASES = 20_000
+
+
+def case_lines(count):
+    """Serialized cases, so every parsed record gets its own strings like a real export"""
+    with open(SAMPLE_FILE) as f:
+        samples = json.load(f)[CASES_KEY]
+    for i in range(count):
+        yield json.dumps(dict(samples[i % len(samples)], case_id=f"AOG-ARCHIVE-{i:08d}"))
+
+
+def measure(label, build, count):
+    """(first cases built, bytes retained per case), printing memory scaled to count and the build time"""
+    traced = min(count, TRACED_CASES)
+    gc.collect()
+    tracemalloc.start()
+    sample = build(case_lines(traced))
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_case = retained / traced
+
+    del sample
+    gc.collect()
+    start = time.perf_counter()
+    cases = build(case_lines(count))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {per_case * count / 1024 / 1024:9.1f} MB   {per_case:6.0f} B/case   {elapsed:6.1f} s")
+    return cases[:1000], per_case
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 200_000
+    print(f"📦 {count:,} cases, memory traced over {min(count, TRACED_CASES):,}")
+
+    dicts, dict_bytes = measure("dicts", lambda lines: [json.loads(line) for line in lines], count)
+    records, record_bytes = measure(
+        "CaseRecord", lambda lines: [CaseRecord(json.loads(line)) for line in lines], count
+    )
+
+    assert records == dicts
+    print(f"✅ Compact records use {record_bytes / dict_bytes:.0%} of the dict memory")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
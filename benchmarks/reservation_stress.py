@@ -0,0 +1,140 @@
+"""
+Reservation stress test
+Hammers one scarce part from W worker threads (default 32): first raw
+reserve / release / confirm / expire traffic against the reservation
+engine, then W x 8 quotes for the part through the shared quote runner.
+Fails if reserved units ever exceed stock at any hub, if more quotes hold
+a unit than there were units, if the inventory aggregates drift, or if a
+restarted engine does not hold the same units again from the quote store
+
+    python -m benchmarks.reservation_stress [W]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bh_engine import DataStore
+from bh_engine.inventory import InventoryState
+from bh_engine.quote_store import QuoteStore
+from bh_engine.quotes import QuoteJobRunner
+from bh_engine.reservations import ReservationEngine
+
+DATA = "BH_Worldwide_Logistics"
+ROUNDS = 2_000
+
+
+def scarce_part(store):
+    """The stocked part with the fewest available units, at least two"""
+    matrix = store.inventory_matrix
+    totals = matrix.available().sum(axis=1)
+    row = min((row for row in range(len(matrix)) if totals[row] >= 2), key=lambda row: totals[row])
+    return matrix.part_numbers[row], int(totals[row])
+
+
+def oversold(inventory, part_number):
+    """Hubs where more units are reserved than are on hand"""
+    metrics = inventory.part_metrics(part_number)
+    return [hub for hub in inventory.hubs
+            if metrics['reserved_by_location'][hub] > metrics['stock_by_location'][hub]]
+
+
+def hammer(engine, part_number, seed, stop):
+    """Random reserve, release, confirm and short-lived holds; returns holds won"""
+    rng = random.Random(seed)
+    hubs, held, won = list(engine.inventory.hubs), [], 0
+    for _ in range(ROUNDS):
+        if stop.is_set():
+            break
+        rng.shuffle(hubs)
+        action = rng.random()
+        if action < 0.5 or not held:
+            reservation = engine.reserve(part_number, rng.randint(1, 2), hubs, f"worker-{seed}",
+                                         hold_seconds=rng.choice((60, 0.001)))
+            if reservation is not None:
+                held.append(reservation.reservation_id)
+                won += 1
+        elif action < 0.9:
+            engine.release(held.pop(rng.randrange(len(held))))
+        else:
+            engine.confirm(held[-1])
+        if rng.random() < 0.05:
+            engine.expire()
+    for reservation_id in held:
+        engine.release(reservation_id)
+    return won
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    workers = int(argv[0]) if argv else 32
+    store = DataStore.load(DATA)
+    part_number, units = scarce_part(store)
+    print(f"🎯 {part_number}: {units} units available across {len(store.inventory_matrix.hubs)} hubs, "
+          f"{workers} workers")
+
+    # Raw engine traffic, with a watcher checking stock against reservations throughout
+    inventory = InventoryState(store.inventory_matrix)
+    engine = ReservationEngine(inventory)
+    stop, violations = threading.Event(), []
+
+    def watch():
+        while not stop.is_set():
+            hubs = oversold(inventory, part_number)
+            if hubs:
+                violations.append(hubs)
+                stop.set()
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        won = sum(pool.map(lambda seed: hammer(engine, part_number, seed, stop), range(workers)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    watcher.join()
+    time.sleep(0.01)
+    engine.expire()
+    print(f"engine         {elapsed:7.2f} s   {workers * ROUNDS / elapsed:10,.0f} ops/s   {won:,} holds won")
+    assert not violations, f"oversold at {violations[0]}"
+    assert not engine.active(), "reservations left behind"
+    assert inventory.part_metrics(part_number) == store.inventory_matrix.part_metrics(part_number), \
+        "released stock does not match the starting stock"
+    mismatches = inventory.verify()
+    assert not mismatches, mismatches
+
+    # Many sessions quoting the same part at once; only as many quotes as units may hold one
+    quote_store = QuoteStore(os.path.join(tempfile.mkdtemp(), "stress_quotes.sqlite3"))
+    engine = ReservationEngine(InventoryState(store.inventory_matrix), quote_store=quote_store)
+    runner = QuoteJobRunner(max_workers=workers, quote_store=quote_store, reservations=engine)
+    cases = [{'case_id': f"STRESS-{i:04d}", 'part_number': part_number, 'part_needed': part_number,
+              'airline': 'Emirates', 'location': random.choice(("Dubai (DXB)", "Sydney (SYD)", "Oslo (OSL)"))}
+             for i in range(workers * 8)]
+    start = time.perf_counter()
+    jobs = [runner.submit(store, case, case['case_id']) for case in cases]
+    for job in jobs:
+        job.wait()
+    elapsed = time.perf_counter() - start
+    runner.shutdown()
+    assert all(job.error is None for job in jobs), next(job.error for job in jobs if job.error is not None)
+    holding = [job.quote for job in jobs if job.quote['reservation']]
+    print(f"quotes         {elapsed:7.2f} s   {len(jobs):,} quotes, {len(holding)} hold a unit")
+    assert len(holding) == units, f"{len(holding)} quotes hold a unit, {units} units available"
+    assert not oversold(engine.inventory, part_number)
+    assert not any(job.quote['inventory_availability'].startswith("In Stock")
+                   for job in jobs if not job.quote['reservation']), "a quote without a unit claims stock"
+
+    # A restart holds the same units again, for the same quotes
+    restarted = ReservationEngine(InventoryState(store.inventory_matrix), quote_store=quote_store)
+    assert sorted(restarted.active()) == sorted(engine.active()), "holds lost across a restart"
+    assert restarted.inventory.part_metrics(part_number) == engine.inventory.part_metrics(part_number)
+    print("✅ nothing oversold, holds restored after a restart")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
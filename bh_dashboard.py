@@ -0,0 +1,991 @@
+"""
+BH Worldwide AI dashboard core
+The BHWorldwideAI facade, session state setup and data loading shared by
+app.py and every page module in views/
+"""
+
+import streamlit as st
+import pandas as pd
+import datetime
+import time
+import random
+import webbrowser
+import urllib.parse
+from pathlib import Path
+import os
+import folium
+from bh_engine import DataStore, StoreManager, __version__
+from bh_engine.profiler import Profiler, activate, active_profiler, append_jsonl, deactivate, timed
+from bh_engine.pricing import DELIVERY_MODES, EXPEDITE
+from bh_engine.projection import StockProjection
+from bh_engine.quote_store import QUOTE_DB, QuoteStore
+from bh_engine.quotes import QuoteJobRunner, compute_multi_part_quote, price_line
+from bh_engine.rebalancing import RebalancePlan
+from bh_engine.routes import AIRPORT_COORDS, HUB_AIRPORTS, airport_code
+
+# How often a blocking quote refreshes its progress while awaiting the shared runner
+QUOTE_POLL_SECONDS = 0.05
+
+# Initialize session state variables at application startup
+def initialize_session_state():
+    """Initialize all session state variables used throughout the application
+    
+    Session state is the per-user overlay (case statuses, UI flags) on top of
+    the shared, read-only data store returned by load_dashboard_data; quotes
+    persist in the quote store returned by load_quote_store.
+    """
+    if 'case_statuses' not in st.session_state:
+        st.session_state.case_statuses = {}
+    if 'last_update' not in st.session_state:
+        st.session_state.last_update = datetime.datetime.now()
+    if 'cached_critical' not in st.session_state:
+        st.session_state.cached_critical = 2
+    if 'cached_response' not in st.session_state:
+        st.session_state.cached_response = 105
+    if 'cached_status' not in st.session_state:
+        st.session_state.cached_status = "🟢 Online"
+    if 'email_processed' not in st.session_state:
+        st.session_state.email_processed = False
+    if 'selected_email_data' not in st.session_state:
+        st.session_state.selected_email_data = None
+    if 'quote_jobs' not in st.session_state:
+        st.session_state.quote_jobs = {}
+    if 'draft_quote_ids' not in st.session_state:
+        st.session_state.draft_quote_ids = set()
+    if 'quote_errors' not in st.session_state:
+        st.session_state.quote_errors = {}
+
+class BHWorldwideAI:
+    def __init__(self, store: DataStore):
+        # Pinned for the whole rerun, so a reload landing mid-render never mixes data versions
+        self.store = store
+        self.data_path = store.data_path
+        # Session state is now initialized globally before class instantiation
+        
+    def __getattr__(self, name):
+        # Datasets, indexes and the data version live on the shared store
+        store = self.__dict__.get('store')
+        if store is None:
+            raise AttributeError(name)
+        return getattr(store, name)
+    
+    @timed("data")
+    def get_live_status_metrics(self):
+        """Get real-time status metrics with some randomization for demo effect"""
+        active_cases = self.active_cases["active_aog_cases"]
+        
+        # Initialize session state if not exists
+        if 'last_update' not in st.session_state:
+            st.session_state.last_update = datetime.datetime.now()
+        
+        # Add some random variation to make it feel more "live"
+        now = datetime.datetime.now()
+        time_diff = (now - st.session_state.last_update).seconds
+        
+        # Update every 30 seconds for demo effect
+        if time_diff > 30:
+            st.session_state.last_update = now
+            # Add small random variations
+            base_critical = len([case for case in active_cases if case.get("urgency") == "Critical"])
+            critical_cases = max(0, base_critical + random.randint(-1, 2))
+            
+            # Vary response time slightly
+            base_response = 105
+            avg_response_time = base_response + random.randint(-15, 25)
+            
+            # System status based on performance
+            if avg_response_time > 120:
+                system_status = "🔴 Degraded"
+            elif avg_response_time > 100:
+                system_status = "🟡 Warning"
+            else:
+                system_status = "🟢 Online"
+        else:
+            # Use cached values if recent
+            critical_cases = getattr(st.session_state, 'cached_critical', 2)
+            avg_response_time = getattr(st.session_state, 'cached_response', 105)
+            system_status = getattr(st.session_state, 'cached_status', "🟢 Online")
+        
+        # Cache the values
+        st.session_state.cached_critical = critical_cases
+        st.session_state.cached_response = avg_response_time
+        st.session_state.cached_status = system_status
+        
+        quotes_count = len(load_quote_store())
+        
+        return {
+            "critical_cases": critical_cases,
+            "avg_response_time": avg_response_time,
+            "quotes_generated": quotes_count,
+            "system_status": system_status
+        }
+    
+    @timed("data")
+    def get_flight_status_data(self, limit=6):
+        """Generate realistic flight status data based on AOG cases"""
+        active_cases = self.active_cases["active_aog_cases"]
+        flights = []
+        
+        # Take a sample of cases for flight display
+        sample_cases = random.sample(active_cases, min(limit, len(active_cases)))
+        
+        for case in sample_cases:
+            flight_number = f"{case['airline'][:2]}{random.randint(100, 9999)}"
+            status = "🔴 GROUNDED" if case["status"] == "Pricing in progress" else \
+                    "🟡 DELAYED" if case["urgency"] == "High" else "🟢 ON TIME"
+            
+            # Extract location for route
+            location = case.get("location", "Unknown")
+            
+            # Generate realistic routes based on airline
+            routes = {
+                "Ryanair": ["DUB → LHR", "STN → BGY", "BVA → MAD"],
+                "Lufthansa": ["FRA → MUC", "FRA → JFK", "MUC → LAX"],
+                "Emirates": ["DXB → LHR", "DXB → JFK", "DXB → SYD"],
+                "British Airways": ["LHR → CDG", "LHR → JFK", "LHR → SIN"],
+                "KLM": ["AMS → JFK", "AMS → NRT", "AMS → CPT"]
+            }
+            
+            airline_routes = routes.get(case["airline"], ["XXX → YYY"])
+            route = random.choice(airline_routes)
+            
+            flights.append({
+                "flight": flight_number,
+                "airline": case["airline"],
+                "route": route,
+                "status": status,
+                "aog_case": case["case_id"],
+                "delay": case.get("elapsed_time", "Unknown")
+            })
+        
+        # Add some normal flights for context
+        if limit > len(sample_cases):
+            normal_flights = [
+                {"flight": "VS123", "airline": "Virgin Atlantic", "route": "LHR → JFK", 
+                 "status": "🟢 ON TIME", "aog_case": "None", "delay": "On time"},
+                {"flight": "AF456", "airline": "Air France", "route": "CDG → LAX", 
+                 "status": "🟢 DEPARTED", "aog_case": "None", "delay": "+3m"}
+            ]
+            flights.extend(normal_flights[:limit-len(sample_cases)])
+        
+        return flights
+    
+    @timed("data")
+    @st.cache_data
+    def create_global_map(_self, data_version):
+        """Create interactive map showing AOG incidents and real inventory hubs"""
+        m = folium.Map(location=[50.0, 10.0], zoom_start=3, tiles='OpenStreetMap')
+        
+        # Add BH Worldwide inventory hubs to map first
+        for hub, code in HUB_AIRPORTS.items():
+            folium.Marker(
+                location=AIRPORT_COORDS[code],
+                popup=f"<b>BH Worldwide Hub</b><br>{hub} ({code})<br>📦 Parts Inventory Available<br>🚚 Express Logistics Center",
+                icon=folium.Icon(color='green', icon='home', prefix='fa')
+            ).add_to(m)
+        
+        # Use fixed sample to prevent constant changes  
+        fixed_cases = _self.active_cases["active_aog_cases"][:15]
+        
+        for case in fixed_cases:
+            location = case.get("location", "Unknown")
+            coords = AIRPORT_COORDS.get(airport_code(location))
+            
+            if coords:
+                # Color based on urgency and status
+                if case["urgency"] == "Critical":
+                    color = 'red'
+                elif case["status"] == "Lost to competitor":
+                    color = 'orange'
+                elif case["urgency"] == "High":
+                    color = 'darkred'
+                else:
+                    color = 'blue'
+                
+                popup_text = f"""
+                <b>{case['case_id']}</b><br>
+                🏢 {case['airline']}<br>
+                ✈️ {case['aircraft']}<br>
+                📍 {location}<br>
+                💰 Loss: {case.get('total_loss_so_far', 'Unknown')}<br>
+                📊 Status: {case['status']}<br>
+                🔧 Part: {case.get('part_needed', 'Unknown')}<br>
+                ⚡ Urgency: {case['urgency']}
+                """
+                
+                folium.Marker(
+                    coords,
+                    popup=folium.Popup(popup_text, max_width=300),
+                    tooltip=f"{case['airline']} - {case['case_id']}",
+                    icon=folium.Icon(color=color, icon='plane', prefix='fa')
+                ).add_to(m)
+        
+        return m
+            
+    @timed("data")
+    def generate_ai_quote(self, case_details: dict, case_id: str) -> dict:
+        """Generate AI-powered quote using REAL parts catalog and pricing data
+
+        Blocks the script thread with progress tied to the real stages; use
+        submit_quote_job to compute without blocking the page. A quote another
+        session is already computing for the case is awaited, not recomputed.
+        """
+        # Check if quote already exists for this case
+        existing_quote = self.find_quote(case_id)
+        if existing_quote:
+            return existing_quote
+        
+        job = load_quote_runner().submit(self.store, case_details, case_id)
+        if job is None:
+            # Stored by another session since the check above
+            return self.find_quote(case_id)
+        
+        progress_bar = st.progress(0)
+        status_text = st.empty()
+        while not job.wait(QUOTE_POLL_SECONDS):
+            progress_bar.progress(job.progress)
+            status_text.text(job.stage_label)
+        if job.error is not None:
+            status_text.text(job.stage_label)
+            raise job.error
+        
+        progress_bar.progress(1.0)
+        status_text.text("✅ Quote generated successfully using real parts data!")
+        
+        self._mark_quoted([job.quote])
+        return job.quote
+    
+    @timed("data")
+    def generate_ai_quotes(self, cases) -> list:
+        """Quote a list of cases in one pass, sharing part lookups between them
+
+        Cases that already have a stored quote are skipped and cases another
+        session is quoting are awaited; returns the new quotes, already stored
+        in one transaction.
+        """
+        quoted = load_quote_store().quoted_case_ids(case['case_id'] for case in cases)
+        pending = [case for case in cases if case['case_id'] not in quoted]
+        quotes = load_quote_runner().quote_batch(self.store, pending)
+        self._mark_quoted(quotes)
+        return quotes
+    
+    def _mark_quoted(self, quotes):
+        """Mark the quotes' cases quoted and keep the quotes as this session's drafts until sent"""
+        for quote in quotes:
+            st.session_state.case_statuses[quote['case_id']] = "quoted"
+            st.session_state.draft_quote_ids.add(quote['quote_id'])
+    
+    def reprice_quote(self, quote, delivery_option=None, hub=None):
+        """(base, expedite, insurance) for a quote's line at another delivery option or hub
+
+        Served from the shared price cache when the same line was priced before.
+        """
+        pricing = dict(quote.get('pricing') or {})
+        if not pricing:
+            breakdown = quote['breakdown']
+            return breakdown['base_transport'], breakdown['expedite_charges'], breakdown['insurance']
+        if delivery_option:
+            pricing['delivery_mode'] = DELIVERY_MODES.get(delivery_option, pricing['delivery_mode'])
+        if hub:
+            pricing['hub'] = hub
+        case_details = {'part_number': pricing['part_number'], 'airline': quote.get('airline')}
+        matching_part = (self.get_part_record(pricing['part_number']) or {}).get('catalog')
+        unit, _ = price_line(self.store, case_details, matching_part, pricing['hub'],
+                             load_data_manager().price_cache, pricing['quantity'], pricing['delivery_mode'])
+        return unit.costs(pricing['quantity'])
+    
+    def alternative_sources(self, quote, location, limit=3):
+        """The quote repriced from the other hubs, fastest to location first
+
+        Nothing is held or stored: the case keeps its quote and the unit it
+        reserved, and the alternatives only show what another hub would cost.
+        """
+        alternatives = []
+        for hub in self.routes.ranked_hubs(location):
+            if hub == quote.get('recommended_source'):
+                continue
+            total_cost = sum(self.reprice_quote(quote, hub=hub))
+            distance_km, transit_hours = self.routes.route(hub, location)
+            alternatives.append({
+                "hub": hub,
+                "total_cost": total_cost,
+                "difference": total_cost - quote['total_cost'],
+                "distance_km": distance_km,
+                "transit_hours": transit_hours,
+            })
+            if len(alternatives) == limit:
+                break
+        return alternatives
+    
+    def generate_multi_part_quote(self, parsed_email, airline=None, delivery_mode=EXPEDITE) -> dict:
+        """Quote every line item of an extracted AOG request email in one batched pass"""
+        return compute_multi_part_quote(self.store, parsed_email.line_items, parsed_email.aircraft, airline,
+                                        delivery_mode, load_data_manager().price_cache, parsed_email.location)
+    
+    def find_quote(self, case_id):
+        """The latest stored quote for a case, if any"""
+        return load_quote_store().for_case(case_id)
+    
+    def send_quote(self, quote):
+        """Mark a quote sent; its reserved units are then held until it is cancelled"""
+        reservation = quote.get('reservation')
+        if reservation and load_data_manager().reservations.confirm(reservation['reservation_id'], quote['case_id']):
+            return load_quote_store().update(dict(quote, status="Sent", reservation=dict(reservation, expires_at=None)))
+        return load_quote_store().set_status(quote['quote_id'], "Sent")
+    
+    def cancel_quote(self, quote):
+        """Delete a quote and give back the units it reserved"""
+        if quote.get('reservation'):
+            load_data_manager().reservations.release(quote['reservation']['reservation_id'], quote['case_id'])
+        return load_quote_store().delete(quote['quote_id'])
+    
+    def clear_draft_quotes(self):
+        """Delete the quotes this session generated and has not sent; returns how many
+
+        Their reserved units go back into stock. Sent quotes and quotes from
+        other sessions stay in the history.
+        """
+        cleared = 0
+        for quote_id in list(st.session_state.draft_quote_ids):
+            st.session_state.draft_quote_ids.discard(quote_id)
+            quote = load_quote_store().get(quote_id)
+            if quote is None or quote.get('status') == "Sent":
+                continue
+            self.cancel_quote(quote)
+            st.session_state.case_statuses.pop(quote['case_id'], None)
+            st.session_state.quote_jobs.pop(quote['case_id'], None)
+            cleared += 1
+        return cleared
+    
+    def submit_quote_job(self, case_details, case_id):
+        """Start computing a quote in the background; returns the QuoteJob, or None if already quoted"""
+        if self.find_quote(case_id):
+            st.session_state.case_statuses[case_id] = "quoted"
+            return None
+        st.session_state.quote_errors.pop(case_id, None)
+        job = st.session_state.quote_jobs.get(case_id)
+        if job is None or job.error is not None or (job.done and job.quote is None):
+            # Shared with any session already quoting this case
+            job = load_quote_runner().submit(self.store, case_details, case_id)
+            if job is None:
+                st.session_state.case_statuses[case_id] = "quoted"
+                return None
+            st.session_state.quote_jobs[case_id] = job
+        return job
+    
+    def pending_quote_jobs(self):
+        return [job for job in st.session_state.quote_jobs.values() if not job.done]
+    
+    def collect_quote_jobs(self):
+        """Mark cases whose jobs finished as quoted and record why failed ones failed
+
+        Returns the newly finished jobs, failed or not. The runner has already
+        stored the quotes.
+        """
+        finished = []
+        for case_id, job in list(st.session_state.quote_jobs.items()):
+            if not job.done:
+                continue
+            # Collected once; from then on the stored quote or the error stands for the job
+            del st.session_state.quote_jobs[case_id]
+            if job.quote is not None:
+                self._mark_quoted([job.quote])
+            else:
+                st.session_state.quote_errors[case_id] = job.stage_label
+            finished.append(job)
+        return finished
+    
+    def _inventory_state(self):
+        """The live inventory state, if it was started from this store's inventory"""
+        manager = load_data_manager()
+        # Lapsed quote holds go back into stock before anything reads it
+        manager.reservations.expire()
+        state = manager.inventory
+        return state if state.source is self.inventory_matrix else None
+    
+    def get_stock_projection(self):
+        """Days of cover and stock-out projection for every critical part at every hub"""
+        return self._stock_projection(self.projection_version, datetime.date.today())
+    
+    @timed("data")
+    @st.cache_data
+    def _stock_projection(_self, projection_version, today):
+        """Recomputed only when the inventory files or the date change"""
+        inventory = _self.inventory if hasattr(_self.inventory, 'get') else {}
+        return StockProjection.from_inventory(inventory.get('critical_inventory', []), _self.inventory_matrix, today)
+    
+    @timed("data")
+    def get_inventory_status(self, part_number=None):
+        """Get comprehensive inventory status for a specific part or all parts"""
+        if not hasattr(self, 'inventory_matrix') or not len(self.inventory_matrix):
+            return None
+        
+        if part_number:
+            # O(1) row lookup in the parts x hubs matrix
+            state = self._inventory_state()
+            return (state if state is not None else self.inventory_matrix).part_metrics(part_number)
+        else:
+            # Return summary for all parts
+            return self._calculate_global_inventory_metrics()
+    
+    @timed("data")
+    def _calculate_global_inventory_metrics(self):
+        """Global inventory health metrics, read from the live state's running aggregates"""
+        if not hasattr(self, 'inventory_matrix'):
+            return None
+        state = self._inventory_state()
+        return state.metrics() if state is not None else self.inventory_matrix.global_metrics()
+    
+    def get_rebalance_plan(self):
+        """Proposed inter-hub transfers for the live inventory"""
+        state = self._inventory_state()
+        return self._rebalance_plan(self.version, state.events if state is not None else 0, datetime.date.today())
+    
+    @timed("data")
+    @st.cache_data
+    def _rebalance_plan(_self, data_version, inventory_events, today):
+        """Re-solved only when the data reloads, a stock or reservation event lands, or the date changes"""
+        state = _self._inventory_state()
+        matrix = state.snapshot() if state is not None else _self.inventory_matrix
+        locations = [case.get("location") for case in _self.active_cases.get("active_aog_cases", [])]
+        return RebalancePlan.from_inventory(matrix, _self.routes, locations, today)
+    
+    @timed("data")
+    def get_inventory_recommendations(self, part_number, location):
+        """Get AI-powered inventory recommendations for AOG scenarios"""
+        inventory_status = self.get_inventory_status(part_number)
+        
+        if not inventory_status:
+            return {
+                'message': '⚠️ Part not found in inventory system',
+                'recommendation': 'external_sourcing',
+                'alternatives': []
+            }
+        
+        available_hubs = [(hub, qty) for hub, qty in inventory_status['best_hubs'] if qty > 0]
+        
+        if not available_hubs:
+            # No stock available
+            if inventory_status['next_arrival_date']:
+                return {
+                    'message': f'🚨 CRITICAL: No stock available globally. Next delivery: {inventory_status["next_arrival_date"]}',
+                    'recommendation': 'wait_for_restock',
+                    'delivery_date': inventory_status['next_arrival_date'],
+                    'alternatives': self._find_alternative_parts(part_number)
+                }
+            else:
+                return {
+                    'message': '🚨 CRITICAL: No stock available and no incoming shipments',
+                    'recommendation': 'emergency_procurement',
+                    'alternatives': self._find_alternative_parts(part_number)
+                }
+        
+        # Stock available - find best option
+        best_hub, best_qty = available_hubs[0]
+        
+        if best_qty == 1:
+            message = f'⚠️ LAST UNIT: Only 1 unit available in {best_hub}'
+            recommendation = 'expedite_premium'
+        elif best_qty <= 3:
+            message = f'⚡ LOW STOCK: {best_qty} units in {best_hub}'
+            recommendation = 'expedite_standard'
+        else:
+            message = f'✅ AVAILABLE: {best_qty} units in {best_hub}'
+            recommendation = 'standard_delivery'
+        
+        return {
+            'message': message,
+            'recommendation': recommendation,
+            'best_hub': best_hub,
+            'available_quantity': best_qty,
+            'all_hubs': available_hubs,
+            'stock_summary': f"Global: {inventory_status['total_available']} available"
+        }
+    
+    @timed("data")
+    def _find_alternative_parts(self, part_number, k=3):
+        """Same-category parts fitting the part's aircraft, most available stock first"""
+        state = self._inventory_state()
+        return [
+            {
+                'part_number': alternative.part.get('part_number'),
+                'description': alternative.part.get('description'),
+                'available_qty': alternative.available,
+                'best_hub': alternative.best_hub,
+            }
+            for alternative in self.alternatives.find(
+                part_number, state if state is not None else self.inventory_matrix, k)
+        ]
+    
+    def display_quote_card(self, quote):
+        """Display a beautifully formatted quote card with real parts data"""
+        # Show data source indicator
+        data_source_badge = "✅ Real Parts Catalog" if quote.get('real_data_used', False) else "🔄 Simulated Data"
+        
+        st.markdown(f"""
+        <div class="quote-card">
+            <h3>🎯 Quote Generated: {quote['quote_id']} <span style="background: #28a745; padding: 4px 8px; border-radius: 4px; font-size: 12px;">{data_source_badge}</span></h3>
+            <div style="display: grid; grid-template-columns: 1fr 1fr 1fr 1fr; gap: 1rem; margin: 1rem 0;">
+                <div>
+                    <h4>📋 Case Details</h4>
+                    <p><strong>Case ID:</strong> {quote['case_id']}</p>
+                    <p><strong>Airline:</strong> {quote['airline']}</p>
+                    <p><strong>Aircraft:</strong> {quote['aircraft']}</p>
+                </div>
+                <div>
+                    <h4>🔧 Parts Information</h4>
+                    <p><strong>Part Needed:</strong> {quote.get('part_needed', 'N/A')}</p>
+                    <p><strong>Part Number:</strong> {quote.get('part_number', 'N/A')}</p>
+                    <p><strong>Source Hub:</strong> {quote.get('recommended_source', 'London')}{f" ({quote['distance_km']:,} km, ~{quote['transit_hours']}h transit)" if quote.get('distance_km') is not None else ''}</p>
+                    <p><strong>Inventory:</strong> <span style="color: {'#28a745' if 'In Stock' in str(quote.get('inventory_availability', 'Unknown')) else '#dc3545'};">{quote.get('inventory_availability', 'Unknown')}</span></p>
+                    <p><strong>Reserved:</strong> {f"Until {quote['reservation']['expires_at'] or 'cancelled'}" if quote.get('reservation') else 'Not reserved'}</p>
+                </div>
+                <div>
+                    <h4>⚡ Performance</h4>
+                    <p><strong>Response Time:</strong> {quote['response_time']}</p>
+                    <p><strong>Confidence:</strong> {quote['confidence_score']}%</p>
+                    <p><strong>Advantage:</strong> {quote['competitive_advantage']}</p>
+                </div>
+                <div>
+                    <h4>💰 Financial</h4>
+                    <p><strong>Total Cost:</strong> £{quote['total_cost']:,}</p>
+                    <p><strong>Delivery:</strong> {quote['delivery_time']}</p>
+                    <p><strong>Generated:</strong> {quote['timestamp']}</p>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Enhanced breakdown table with real data indicators
+        breakdown_df = pd.DataFrame([
+            {"Component": "Base Transport", "Cost (£)": f"{quote['breakdown']['base_transport']:,}", "Source": "Real Pricing" if quote.get('real_data_used') else "Estimated"},
+            {"Component": "Expedite Charges", "Cost (£)": f"{quote['breakdown']['expedite_charges']:,}", "Source": "Catalog Rate" if quote.get('real_data_used') else "Standard Rate"},
+            {"Component": "Insurance", "Cost (£)": f"{quote['breakdown']['insurance']:,}", "Source": "Policy Rate"},
+            {"Component": "**TOTAL**", "Cost (£)": f"**£{quote['total_cost']:,}**", "Source": "**Integrated Pricing**"}
+        ])
+        
+        st.table(breakdown_df)
+    
+    def display_quote_actions(self, quote):
+        """Display post-quote action buttons with full functionality"""
+        st.markdown(f"""
+        <div class="quote-actions">
+            <h4>📋 Next Actions for {quote['quote_id']}</h4>
+            <p>Choose what to do with this generated quote:</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        # Create safe keys by replacing hyphens with underscores
+        safe_quote_id = quote['quote_id'].replace('-', '_')
+        modify_key = f"modify_{safe_quote_id}"
+        alternative_key = f"alternative_{safe_quote_id}"
+        
+        # Initialize session state for quote modifications
+        if modify_key not in st.session_state:
+            st.session_state[modify_key] = False
+        if alternative_key not in st.session_state:
+            st.session_state[alternative_key] = None
+        
+        with col1:
+            # Send to Customer - Opens email client
+            if st.button(f"📧 Send to Customer", key=f"send_{safe_quote_id}"):
+                # Create professional email content
+                subject = f"AOG Quote - {quote['quote_id']} - {quote['airline']} - {quote.get('aircraft', 'Aircraft')}"
+                
+                email_body = f"""Dear {quote['airline']} Team,
+
+Please find below our quote for your AOG requirements:
+
+=== QUOTE DETAILS ===
+Quote ID: {quote['quote_id']}
+Case ID: {quote['case_id']}
+Aircraft: {quote.get('aircraft', 'N/A')}
+Part Required: {quote.get('part_needed', 'N/A')}
+Location: {quote.get('location', 'N/A')}
+
+=== COST BREAKDOWN ===
+Base Transport: £{quote['breakdown']['base_transport']:,}
+Expedite Charges: £{quote['breakdown']['expedite_charges']:,}
+Insurance: £{quote['breakdown']['insurance']:,}
+------------------------
+TOTAL COST: £{quote['total_cost']:,}
+
+=== DELIVERY TIMELINE ===
+Estimated Delivery: {quote['delivery_time']}
+Response Time: {quote['response_time']}
+Confidence Score: {quote['confidence_score']}%
+
+=== COMPETITIVE ADVANTAGE ===
+{quote['competitive_advantage']}
+
+Please confirm your acceptance of this quote. We are standing by to expedite delivery immediately upon your approval.
+
+For any questions or modifications, please contact us immediately.
+
+Best regards,
+BH Worldwide Logistics AOG Team
+
+This quote is valid for 24 hours and subject to part availability."""
+                
+                # Create mailto link
+                mailto_link = f"mailto:?subject={urllib.parse.quote(subject)}&body={urllib.parse.quote(email_body)}"
+                
+                # Display clickable link and try to open email client
+                st.success("✅ Email prepared! Click the link below to send:")
+                st.markdown(f'<a href="{mailto_link}" target="_blank">📧 Open Email Client</a>', unsafe_allow_html=True)
+                
+                # Try to open default email client programmatically
+                try:
+                    webbrowser.open(mailto_link)
+                except:
+                    st.info("Please click the link above if your email client didn't open automatically.")
+                
+        with col2:
+            # Modify Quote - Inline editing form
+            if st.button(f"📋 Modify Quote", key=f"modify_btn_{safe_quote_id}"):
+                st.session_state[modify_key] = not st.session_state[modify_key]
+        
+        # Show modification form if toggled
+        if st.session_state[modify_key]:
+            with st.expander("🔧 Quote Modification Panel", expanded=True):
+                mod_col1, mod_col2 = st.columns(2)
+                
+                with mod_col1:
+                    # Delivery options
+                    current_delivery = quote.get('delivery_option', 'Next Flight Out')
+                    new_delivery = st.selectbox(
+                        "Delivery Option:", 
+                        ["Next Flight Out", "Same Day", "Express", "Standard"], 
+                        index=["Next Flight Out", "Same Day", "Express", "Standard"].index(current_delivery),
+                        key=f"mod_delivery_{safe_quote_id}"
+                    )
+                    
+                    # Price adjustment slider
+                    price_adjustment = st.slider(
+                        "Price Adjustment:", 
+                        -20, 20, 0, 1, 
+                        format="%d%%",
+                        key=f"mod_price_{safe_quote_id}"
+                    )
+                    
+                    # Reprice the line for the chosen delivery option, then apply the adjustment
+                    original_cost = quote['total_cost']
+                    repriced_breakdown = self.reprice_quote(quote, delivery_option=new_delivery)
+                    repriced_cost = sum(repriced_breakdown)
+                    adjusted_cost = int(repriced_cost * (1 + price_adjustment / 100))
+                    
+                    st.metric("Original Cost", f"£{original_cost:,}")
+                    st.metric("Adjusted Cost", f"£{adjusted_cost:,}", f"{price_adjustment:+}%")
+                
+                with mod_col2:
+                    # Notes text area
+                    notes = st.text_area(
+                        "Modification Notes:", 
+                        placeholder="Enter reasons for modifications, special instructions, etc.",
+                        height=100,
+                        key=f"mod_notes_{safe_quote_id}"
+                    )
+                    
+                    # Delivery time adjustment based on option
+                    delivery_times = {
+                        "Next Flight Out": "2-4 hours",
+                        "Same Day": "4-8 hours", 
+                        "Express": "6-12 hours",
+                        "Standard": "12-24 hours"
+                    }
+                    
+                    st.info(f"New Delivery Time: {delivery_times[new_delivery]}")
+                
+                # Save changes button
+                if st.button("💾 Save Changes", key=f"save_mod_{safe_quote_id}", type="primary"):
+                    # Create modified quote
+                    modified_quote = quote.copy()
+                    modified_quote['total_cost'] = adjusted_cost
+                    modified_quote['delivery_option'] = new_delivery
+                    modified_quote['delivery_time'] = delivery_times[new_delivery]
+                    modified_quote['modification_notes'] = notes
+                    modified_quote['modified'] = True
+                    modified_quote['modification_timestamp'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    
+                    # Scale the repriced breakdown by the adjustment
+                    ratio = adjusted_cost / repriced_cost if repriced_cost else 1
+                    modified_quote['breakdown'] = {
+                        'base_transport': int(repriced_breakdown[0] * ratio),
+                        'expedite_charges': int(repriced_breakdown[1] * ratio),
+                        'insurance': int(repriced_breakdown[2] * ratio)
+                    }
+                    
+                    load_quote_store().update(modified_quote)
+                    st.success(f"✅ Quote {quote['quote_id']} successfully modified!")
+                    st.session_state[modify_key] = False
+                    st.rerun()
+        
+        with col3:
+            # Generate Alternative - Creates comparison
+            if st.button(f"🔄 Generate Alternative", key=f"alt_btn_{safe_quote_id}"):
+                # Generate alternative quote
+                import random
+                
+                # Create alternative with variations
+                base_cost = quote['total_cost']
+                variation = random.uniform(-0.15, 0.15)  # ±15% variation
+                alt_cost = int(base_cost * (1 + variation))
+                
+                alternative_quote = {
+                    'quote_id': f"{quote['quote_id']}_ALT",
+                    'case_id': quote['case_id'],
+                    'airline': quote['airline'],
+                    'total_cost': alt_cost,
+                    'delivery_time': random.choice(["3-5 hours", "4-6 hours", "6-10 hours", "8-12 hours"]),
+                    'delivery_option': random.choice(["Alternative Route", "Direct Express", "Hub Transfer", "Charter Flight"]),
+                    'confidence_score': random.randint(85, 98),
+                    'competitive_advantage': random.choice([
+                        "Alternative routing reduces delivery time",
+                        "Cost-optimized solution with reliable delivery",
+                        "Premium service with enhanced tracking",
+                        "Flexible delivery options available"
+                    ]),
+                    'response_time': quote['response_time'],
+                    'breakdown': {
+                        'base_transport': int(alt_cost * 0.6),
+                        'expedite_charges': int(alt_cost * 0.25),
+                        'insurance': int(alt_cost * 0.15)
+                    },
+                    'timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'routing': random.choice(["Via Frankfurt Hub", "Direct Charter", "Scheduled Carrier", "Road/Air Combo"]),
+                    'carrier': random.choice(["Lufthansa Cargo", "FedEx", "DHL", "Emirates SkyCargo"])
+                }
+                
+                st.session_state[alternative_key] = alternative_quote
+                st.success("✅ Alternative quote generated! See comparison below.")
+        
+        # Display alternative quote comparison if generated
+        if st.session_state[alternative_key]:
+            alt_quote = st.session_state[alternative_key]
+            
+            st.markdown("---")
+            st.subheader("🔄 Quote Comparison")
+            
+            comp_col1, comp_col2 = st.columns(2)
+            
+            with comp_col1:
+                st.markdown("**🔵 Original Quote**")
+                st.metric("Cost", f"£{quote['total_cost']:,}")
+                st.metric("Delivery", quote['delivery_time'])
+                st.metric("Confidence", f"{quote['confidence_score']}%")
+                st.info(f"**Advantage:** {quote['competitive_advantage']}")
+            
+            with comp_col2:
+                st.markdown("**🟢 Alternative Quote**")
+                cost_diff = alt_quote['total_cost'] - quote['total_cost']
+                st.metric("Cost", f"£{alt_quote['total_cost']:,}", f"£{cost_diff:+,}")
+                st.metric("Delivery", alt_quote['delivery_time'])
+                st.metric("Confidence", f"{alt_quote['confidence_score']}%")
+                st.info(f"**Routing:** {alt_quote['routing']}")
+                st.info(f"**Carrier:** {alt_quote['carrier']}")
+                st.info(f"**Advantage:** {alt_quote['competitive_advantage']}")
+            
+            # Alternative selection buttons
+            alt_col1, alt_col2, alt_col3 = st.columns(3)
+            
+            with alt_col1:
+                if st.button("✅ Select Original", key=f"select_orig_{safe_quote_id}"):
+                    st.session_state[alternative_key] = None
+                    st.success("Original quote selected")
+                    st.rerun()
+            
+            with alt_col2:
+                if st.button("🔄 Select Alternative", key=f"select_alt_{safe_quote_id}"):
+                    # Replace original with alternative
+                    load_quote_store().update(dict(alt_quote, quote_id=quote['quote_id'],
+                                                reservation=quote.get('reservation')))
+                    st.session_state[alternative_key] = None
+                    st.success("Alternative quote selected")
+                    st.rerun()
+            
+            with alt_col3:
+                if st.button("❌ Dismiss Comparison", key=f"dismiss_alt_{safe_quote_id}"):
+                    st.session_state[alternative_key] = None
+                    st.rerun()
+        
+        with col4:
+            # Cancel Quote - With confirmation
+            cancel_confirm_key = f"cancel_confirm_{safe_quote_id}"
+            if st.button(f"❌ Cancel Quote", key=f"cancel_btn_{safe_quote_id}"):
+                if cancel_confirm_key not in st.session_state:
+                    st.session_state[cancel_confirm_key] = False
+                st.session_state[cancel_confirm_key] = True
+        
+        # Show confirmation dialog if cancel was clicked
+        if st.session_state.get(f"cancel_confirm_{safe_quote_id}", False):
+            st.warning("⚠️ Are you sure you want to cancel this quote?")
+            conf_col1, conf_col2, conf_col3 = st.columns(3)
+            
+            with conf_col1:
+                if st.button("✅ Yes, Cancel Quote", key=f"confirm_cancel_{safe_quote_id}", type="primary"):
+                    # Remove quote from the store, releasing its stock
+                    self.cancel_quote(quote)
+                    
+                    # Reset case status to need quote
+                    case_id = quote['case_id']
+                    if case_id in st.session_state.case_statuses:
+                        st.session_state.case_statuses[case_id] = "needs quote"
+                    
+                    # Clean up session state - use safe keys for cleanup
+                    keys_to_remove = []
+                    for key in st.session_state.keys():
+                        if safe_quote_id in key or quote['quote_id'] in key:
+                            keys_to_remove.append(key)
+                    
+                    for key in keys_to_remove:
+                        if key in st.session_state:
+                            del st.session_state[key]
+                    
+                    st.error(f"❌ Quote {quote['quote_id']} has been cancelled")
+                    st.info(f"📝 Case {case_id} status reset to 'needs quote'")
+                    time.sleep(2)
+                    st.rerun()
+            
+            with conf_col2:
+                if st.button("❌ No, Keep Quote", key=f"keep_quote_{safe_quote_id}"):
+                    st.session_state[f"cancel_confirm_{safe_quote_id}"] = False
+                    st.rerun()
+            
+            with conf_col3:
+                st.write("")
+
+# Load the data once per process; every session shares the same read-only store
+@st.cache_resource
+def load_data_manager():
+    possible_paths = [
+        "BH_Worldwide_Logistics",
+        "./BH_Worldwide_Logistics"
+    ]
+    
+    for path in possible_paths:
+        if Path(path).exists():
+            try:
+                # Extended files are preferred, falling back to the original ones
+                # Quote holds are recorded with the quotes, so they outlive reloads and restarts
+                manager = StoreManager(path, quote_store=load_quote_store())
+            except Exception as e:
+                st.error(f"Error loading data: {e}")
+                st.info("Make sure you're running this from the correct directory with the BH_Worldwide_Logistics data")
+                st.stop()
+            # Changed files are re-read in the background and swapped in atomically
+            manager.watch(interval=float(os.environ.get("BH_DATA_POLL_SECONDS", 5)))
+            return manager
+    
+    st.error("Cannot find BH_Worldwide_Logistics data directory. Please check the path.")
+    st.stop()
+
+def load_dashboard_data():
+    return BHWorldwideAI(load_data_manager().current)
+
+# One quote worker pool per process, shared by every session
+@st.cache_resource
+def load_quote_runner():
+    manager = load_data_manager()
+    return QuoteJobRunner(price_cache=manager.price_cache, quote_store=load_quote_store(),
+                          reservations=manager.reservations)
+
+
+# Quote history on disk, shared by every session and kept across restarts
+@st.cache_resource
+def load_quote_store():
+    return QuoteStore(os.environ.get("BH_QUOTE_DB", QUOTE_DB))
+
+
+def get_dashboard():
+    """Dashboard pinned by app.py for the current rerun, so pages and sidebar share one data version"""
+    dashboard = st.session_state.get("dashboard")
+    return dashboard if dashboard is not None else load_dashboard_data()
+
+
+# --- render profiler ---------------------------------------------------------
+
+PROFILE_ENV = "BH_PROFILE"
+PROFILE_FILE = os.environ.get("BH_PROFILE_FILE", "bh_profile.jsonl")
+
+
+def profiling_requested():
+    """Profiling is on via the BH_PROFILE environment variable or the sidebar toggle"""
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes") or st.session_state.get("profile_render", False)
+
+
+class _ProfiledTab:
+    """Tab container that times everything rendered inside its with-block"""
+
+    def __init__(self, tab, label):
+        self._tab = tab
+        self._label = label
+        self._span = None
+
+    def __enter__(self):
+        profiler = active_profiler()
+        if profiler is not None:
+            self._span = profiler.start(self._label, "tab")
+        return self._tab.__enter__()
+
+    def __exit__(self, *exc_info):
+        profiler = active_profiler()
+        if profiler is not None and self._span is not None:
+            profiler.stop(self._span)
+            self._span = None
+        return self._tab.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._tab, name)
+
+
+def profiled_tabs(labels):
+    """st.tabs(labels), with each tab's with-block timed as a span while profiling"""
+    tabs = st.tabs(labels)
+    if active_profiler() is None:
+        return tabs
+    return [_ProfiledTab(tab, str(label)) for tab, label in zip(tabs, labels)]
+
+
+def start_profiler(label=None):
+    """Activate a profiler for this rerun if profiling is requested"""
+    if not profiling_requested():
+        return None
+    return activate(Profiler(label))
+
+
+def finish_profiler(page_title, data_version):
+    """Stop this rerun's profiler, append it to the JSONL log and show the collapsible panel"""
+    profiler = deactivate()
+    if profiler is None:
+        return None
+    total_ms = profiler.finish() * 1000
+    record = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "app_version": __version__,
+        "page": page_title,
+        "data_version": data_version,
+        "total_ms": round(total_ms, 3),
+        "spans": profiler.records(),
+    }
+    try:
+        append_jsonl(PROFILE_FILE, record)
+    except OSError as e:
+        st.warning(f"Could not write profile log {PROFILE_FILE}: {e}")
+
+    with st.expander(f"⏱️ Render Profile: {page_title} in {total_ms:,.0f} ms", expanded=False):
+        st.caption(f"Appended to {PROFILE_FILE}")
+        timeline = pd.DataFrame(
+            [{"Span": "\u2003" * r["depth"] + r["name"], "Kind": r["kind"], "ms": r["ms"],
+              "Start (ms)": r["offset_ms"]}
+             for r in record["spans"]]
+        )
+        if not timeline.empty:
+            st.markdown("**Pages, tabs, sections and data calls**")
+            st.dataframe(timeline, hide_index=True, use_container_width=True)
+        data_calls = pd.DataFrame(profiler.totals("data"))
+        if not data_calls.empty:
+            st.markdown("**Slowest data calls**")
+            st.dataframe(data_calls.drop(columns="detail").head(25), hide_index=True, use_container_width=True)
+    return record
@@ -0,0 +1,61 @@
+"""
+BH Worldwide AI engine
+Data structures and computations behind the Streamlit dashboard, kept free
+of Streamlit so they can be reused by scripts and benchmarks
+"""
+
+__version__ = "1.0.0"
+
+from .alternatives import Alternative, AlternativePartsIndex
+from .cases import CaseAggregates, iter_case_batches
+from .datasets import DATASET_SOURCES, load_datasets
+from .inventory import HUBS, InventoryMatrix, InventoryState
+from .part_search import PartMatch, PartSearchIndex
+from .pricing import PriceCache, PriceTable, PricedUnit
+from .projection import StockProjection
+from .rebalancing import RebalancePlan
+from .records import CaseRecord, CustomerRecord, InventoryItemRecord, PartRecord, Record, Vocabulary
+from .reservations import Reservation, ReservationEngine
+from .routes import AIRPORT_COORDS, HUB_AIRPORTS, RouteMatrix
+from .snapshot import Snapshot, compile_snapshot, open_snapshot
+from .store import DataStore, StoreManager
+from .units import FX_RATES_TO_GBP, Money, parse_minutes, parse_money
+
+__all__ = [
+    "AIRPORT_COORDS",
+    "Alternative",
+    "AlternativePartsIndex",
+    "CaseAggregates",
+    "CaseRecord",
+    "CustomerRecord",
+    "DATASET_SOURCES",
+    "DataStore",
+    "FX_RATES_TO_GBP",
+    "HUBS",
+    "HUB_AIRPORTS",
+    "InventoryItemRecord",
+    "InventoryMatrix",
+    "InventoryState",
+    "Money",
+    "PartMatch",
+    "PartRecord",
+    "PartSearchIndex",
+    "PriceCache",
+    "PriceTable",
+    "PricedUnit",
+    "RebalancePlan",
+    "Record",
+    "Reservation",
+    "ReservationEngine",
+    "RouteMatrix",
+    "Snapshot",
+    "StockProjection",
+    "StoreManager",
+    "Vocabulary",
+    "compile_snapshot",
+    "iter_case_batches",
+    "load_datasets",
+    "open_snapshot",
+    "parse_minutes",
+    "parse_money",
+]
@@ -0,0 +1,86 @@
+"""
+Alternative parts by category and aircraft compatibility
+
+AlternativePartsIndex keeps, in catalog order, the parts of every category
+as an id array and the parts fitting every aircraft family as the packed
+bitsets of the part search index. Alternatives for a part are the parts of
+its category that fit one of its aircraft families, found by testing the
+category's ids against the families' bitsets, then ranked by live
+available stock gathered for just those parts.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .part_search import aircraft_family, bitset_contains
+
+
+class Alternative(NamedTuple):
+    part: object
+    available: int
+    best_hub: str
+
+
+class AlternativePartsIndex:
+    """Category and aircraft-family indexes over the parts catalog"""
+
+    def __init__(self, parts, part_ids, categories, families, inventory_rows):
+        self.parts = parts
+        self.part_ids = part_ids  # part number -> catalog id
+        self.categories = categories  # category -> catalog ids, ascending
+        self.families = families  # aircraft family -> packed bitset of catalog ids
+        self.inventory_rows = inventory_rows  # catalog id -> inventory matrix row, -1 if not stocked
+
+    @classmethod
+    def from_catalog(cls, parts, part_search, inventory_matrix):
+        """Build from the catalog, reusing part_search's family bitsets (same part order)"""
+        parts = list(parts) if isinstance(parts, list) else []
+        part_ids, categories = {}, {}
+        for doc, part in enumerate(parts):
+            part_ids.setdefault(part.get("part_number"), doc)
+            categories.setdefault(part.get("category") or "", []).append(doc)
+        categories = {category: np.array(docs, dtype=np.int64) for category, docs in categories.items()}
+        inventory_rows = inventory_matrix.rows(part.get("part_number") for part in parts)
+        return cls(parts, part_ids, categories, part_search.families, inventory_rows)
+
+    def candidates(self, part_number, aircraft_type=None):
+        """Catalog ids sharing the part's category and one of its aircraft families
+
+        With aircraft_type, candidates must fit that aircraft's family instead.
+        """
+        doc = self.part_ids.get(part_number)
+        if doc is None:
+            return np.zeros(0, dtype=np.int64)
+        part = self.parts[doc]
+        ids = self.categories.get(part.get("category") or "", np.zeros(0, dtype=np.int64))
+        ids = ids[ids != doc]
+        if aircraft_type:
+            family_names = {aircraft_family(aircraft_type)}
+        else:
+            family_names = {aircraft_family(aircraft) for aircraft in part.get("compatible_aircraft_types") or []}
+        bitsets = [self.families[family] for family in family_names if family in self.families]
+        if not bitsets or not len(ids):
+            return np.zeros(0, dtype=np.int64)
+        return ids[bitset_contains(np.bitwise_or.reduce(bitsets), ids)]
+
+    def find(self, part_number, inventory, k=3, aircraft_type=None):
+        """Top-k Alternatives with stock, most available first, catalog order breaking ties
+
+        inventory is an InventoryMatrix or the live InventoryState built from it.
+        """
+        ids = self.candidates(part_number, aircraft_type)
+        rows = self.inventory_rows[ids]
+        ids, rows = ids[rows >= 0], rows[rows >= 0]
+        if not len(ids) or k <= 0:
+            return []
+        available = inventory.available_rows(rows)
+        totals = available.sum(axis=1)
+        in_stock = np.flatnonzero(totals > 0)
+        if len(in_stock) > k:
+            # Partition to the k-th largest total, then sort only what survives
+            cutoff = np.partition(totals[in_stock], -k)[-k]
+            in_stock = in_stock[totals[in_stock] >= cutoff]
+        order = in_stock[np.lexsort((ids[in_stock], -totals[in_stock]))][:k]
+        return [Alternative(self.parts[int(ids[i])], int(totals[i]), inventory.hubs[int(available[i].argmax())])
+                for i in order]
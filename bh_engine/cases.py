@@ -0,0 +1,216 @@
+"""
+Streaming reader and aggregates for AOG case files
+
+Case exports can hold millions of records, so they can be read
+incrementally (a JSON array, top-level or under a key, or JSON Lines) and
+handed out as typed records in fixed-size batches, without the raw text of
+the whole file in memory. Aggregates fold the batches as they go and keep
+no cases; loading a file into the store keeps every record, and parses
+files small enough to fit comfortably in one json.load, which is faster.
+"""
+
+import json
+import re
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+
+from .records import CaseRecord
+from .units import FX_RATES_TO_GBP, Money
+
+# Key holding the case array in the AOG_Center files
+CASES_KEY = "active_aog_cases"
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_CHUNK_SIZE = 1 << 16
+# Case files up to this size load with json.load; larger ones are streamed
+STREAM_ABOVE_BYTES = 64 << 20
+CASE_FIELDS = CaseRecord.FIELDS
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonStream:
+    """Incremental JSON tokenizer over a text file, holding one chunk plus one value"""
+
+    def __init__(self, f, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+        # Drop everything already consumed so the buffer never grows with the file
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        """Next non-whitespace character, or '' at end of file"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._fill()
+
+    def expect(self, chars):
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill()
+                continue
+            # A number or literal ending exactly at the buffer edge may be cut short
+            if end == len(self.buffer) and not self.eof:
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(f, key=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the elements of a JSON array one at a time
+
+    The array is either the top-level value or, if key is given, the value
+    of that key in a top-level object; other keys are skipped. Raises
+    KeyError if the object has no such key.
+    """
+    stream = _JsonStream(f, chunk_size)
+    if stream.expect("[{") == "{":
+        if stream.peek() == "}":
+            raise KeyError(key)
+        while True:
+            name = stream.value()
+            stream.expect(":")
+            if name == key:
+                stream.expect("[")
+                break
+            stream.value()
+            if stream.expect(",}") == "}":
+                raise KeyError(key)
+
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value()
+        if stream.expect(",]") == "]":
+            return
+
+
+def iter_json_lines(f):
+    """Yield one value per non-blank line of a JSON Lines file"""
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_case_dicts(path, key=CASES_KEY):
+    """Stream raw case dicts from a .json or .jsonl case file"""
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        if path.suffix == ".jsonl":
+            yield from iter_json_lines(f)
+        else:
+            yield from iter_json_array(f, key=key)
+
+
+def batched(iterable, batch_size=DEFAULT_BATCH_SIZE):
+    """Group an iterable into lists of at most batch_size items"""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_case_batches(path, batch_size=DEFAULT_BATCH_SIZE, key=CASES_KEY):
+    """Stream typed CaseRecord batches from a case file"""
+    for batch in batched(iter_case_dicts(path, key=key), batch_size):
+        yield [CaseRecord.from_dict(data) for data in batch]
+
+
+def read_case_document(path, key=CASES_KEY, stream_above=STREAM_ABOVE_BYTES):
+    """Load a case file into the {key: [CaseRecord]} shape
+
+    A JSON file up to stream_above bytes is parsed whole, which is faster
+    than the incremental tokenizer; larger files and JSON Lines are streamed,
+    so their raw text and dicts are never all held at once. The records
+    themselves are all kept either way.
+    """
+    path = Path(path)
+    if path.suffix != ".jsonl" and path.stat().st_size <= stream_above:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        cases = data if isinstance(data, list) else data[key]
+        return {key: [CaseRecord.from_dict(case) for case in cases]}
+    return {key: [record for batch in iter_case_batches(path, key=key) for record in batch]}
+
+
+class CaseAggregates:
+    """Running counts and totals over case batches, without keeping the cases"""
+
+    def __init__(self):
+        self.total_cases = 0
+        self.by_urgency = Counter()
+        self.by_status = Counter()
+        self.by_location = Counter()
+        self.by_aircraft = Counter()
+        self.by_part = Counter()
+        self.by_airline = Counter()
+        # Summed total_loss_so_far in minor units per currency code
+        self.loss_by_currency = Counter()
+
+    def add(self, records):
+        """Fold one batch of CaseRecords into the aggregates"""
+        for record in records:
+            self.total_cases += 1
+            self.by_urgency[record.urgency or "Unknown"] += 1
+            self.by_status[record.status or "Unknown"] += 1
+            self.by_location[record.location or "Unknown"] += 1
+            self.by_aircraft[record.aircraft or "Unknown"] += 1
+            self.by_part[record.get("part_needed") or "Unknown"] += 1
+            self.by_airline[record.airline or "Unknown"] += 1
+            if record.total_loss is not None:
+                self.loss_by_currency[record.total_loss.currency] += record.total_loss.minor
+        return self
+
+    def total_loss(self, currency="GBP", rates=FX_RATES_TO_GBP):
+        """Total loss across every currency, converted through the FX table"""
+        return Money(
+            sum(Money(minor, code).to(currency, rates).minor for code, minor in self.loss_by_currency.items()),
+            currency,
+        )
+
+    @classmethod
+    def from_batches(cls, batches):
+        aggregates = cls()
+        for batch in batches:
+            aggregates.add(batch)
+        return aggregates
+
+    @classmethod
+    def from_cases(cls, cases, batch_size=DEFAULT_BATCH_SIZE):
+        """Aggregate cases already in memory, as dicts or CaseRecords"""
+        return cls.from_batches(
+            [CaseRecord.from_dict(data) for data in batch] for batch in batched(cases, batch_size)
+        )
+
+    @classmethod
+    def from_file(cls, path, batch_size=DEFAULT_BATCH_SIZE, key=CASES_KEY):
+        """Aggregate a case file of any size in one streaming pass"""
+        return cls.from_batches(iter_case_batches(path, batch_size=batch_size, key=key))
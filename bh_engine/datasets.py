@@ -0,0 +1,260 @@
+"""
+Dataset definitions and loading for the BH_Worldwide_Logistics data tree
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .cases import read_case_document
+from .inventory import INVENTORY_LOCATIONS_FILE, InventoryMatrix
+from .records import CaseRecord, CustomerRecord, InventoryItemRecord, PartRecord, compact_records
+from .snapshot import compile_snapshot, fingerprint, open_snapshot
+
+# Marks a dataset the dashboard cannot run without
+REQUIRED = object()
+
+# (attribute, candidate files tried in order, default when none can be read)
+DATASET_SOURCES = (
+    ("customers", ("Customer_Data/Airlines/extended_customers.json",
+                   "Customer_Data/Airlines/major_customers.json"), REQUIRED),
+    ("active_cases", ("Operations/AOG_Center/extended_aog_cases.json",
+                      "Operations/AOG_Center/active_cases.json"), REQUIRED),
+    ("competitors", ("Business_Intelligence/Competitors/competitor_analysis.json",), REQUIRED),
+    ("lost_opportunities", ("Financial/Lost_Opportunities/historical_analysis.json",
+                            "Financial/Lost_Opportunities/monthly_analysis.json"), REQUIRED),
+    ("pricing_model", ("Operations/Pricing/current_pricing_model.json",), REQUIRED),
+    ("pain_points", ("Business_Intelligence/Pain_Points/current_challenges.json",), REQUIRED),
+    ("inventory", ("Operations/Inventory/extended_inventory.json",
+                   "Operations/Inventory/critical_parts.json"), REQUIRED),
+    ("parts_catalog", ("Operations/Parts_Database/aircraft_parts_catalog.json",), []),
+    ("parts_pricing", ("Operations/Parts_Database/parts_pricing.json",), {}),
+)
+
+# Every file a dataset can come from; changes elsewhere in the tree never trigger a reload
+DATASET_FILES = tuple(sorted(
+    {relpath for _, candidates, _ in DATASET_SOURCES for relpath in candidates}
+    | {INVENTORY_LOCATIONS_FILE}
+))
+
+# Case exports can be very large, so they are streamed rather than json.load-ed
+CASE_FILES = frozenset(next(candidates for attribute, candidates, _ in DATASET_SOURCES
+                            if attribute == "active_cases"))
+
+
+# Record lists kept as compact slotted records: relpath -> (key holding the list, record type)
+COMPACT_RECORDS = {
+    "Customer_Data/Airlines/extended_customers.json": ("major_airline_customers", CustomerRecord),
+    "Customer_Data/Airlines/major_customers.json": ("major_airline_customers", CustomerRecord),
+    "Operations/AOG_Center/extended_aog_cases.json": ("active_aog_cases", CaseRecord),
+    "Operations/AOG_Center/active_cases.json": ("active_aog_cases", CaseRecord),
+    "Operations/Parts_Database/aircraft_parts_catalog.json": (None, PartRecord),
+    "Operations/Inventory/extended_inventory.json": ("critical_inventory", InventoryItemRecord),
+    "Operations/Inventory/critical_parts.json": ("critical_inventory", InventoryItemRecord),
+}
+
+
+def compact_document(relpath, data):
+    """Replace the record list of a known document with compact records"""
+    if relpath not in COMPACT_RECORDS:
+        return data
+    key, record_class = COMPACT_RECORDS[relpath]
+    if key is None:
+        return compact_records(data, record_class)
+    if isinstance(data, dict) and key in data:
+        return dict(data, **{key: compact_records(data[key], record_class)})
+    return data
+
+
+def _read_json(data_path, relpath):
+    if relpath in CASE_FILES:
+        # Already yields CaseRecords, batch by batch
+        return read_case_document(Path(data_path) / relpath)
+    with open(Path(data_path) / relpath) as f:
+        return compact_document(relpath, json.load(f))
+
+
+def parse_files(data_path, relpaths, max_workers=None):
+    """Parse JSON files on a thread pool, returning relpath -> data or the error raised"""
+    relpaths = list(relpaths)
+    if not relpaths:
+        return {}
+
+    def parse(relpath):
+        try:
+            return _read_json(data_path, relpath)
+        except (OSError, ValueError, KeyError) as e:
+            return e
+
+    workers = max_workers or min(len(relpaths), (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bh-parse") as pool:
+        return dict(zip(relpaths, pool.map(parse, relpaths)))
+
+
+def dataset_fingerprints(data_path):
+    """(size, mtime_ns) of every dataset file currently on disk"""
+    fingerprints = {}
+    for relpath in DATASET_FILES:
+        try:
+            entry = fingerprint(data_path, relpath, with_hash=False)
+        except OSError:
+            continue
+        fingerprints[relpath] = (entry["size"], entry["mtime_ns"])
+    return fingerprints
+
+
+def _resolve(attribute, candidates, default, read):
+    """Return the first candidate that can be read, else the default"""
+    error = None
+    for relpath in candidates:
+        try:
+            return read(relpath)
+        except (OSError, ValueError, KeyError) as e:
+            error = e
+    if default is REQUIRED:
+        raise FileNotFoundError(f"No readable source for {attribute}: {error}")
+    # Fresh copy so a mutable default is never shared between loads
+    return type(default)()
+
+
+def _json_reader(data_path, documents):
+    """Reader over already-parsed documents that parses anything missing on demand"""
+    def read(relpath):
+        if relpath not in documents:
+            try:
+                documents[relpath] = _read_json(data_path, relpath)
+            except (OSError, ValueError, KeyError) as e:
+                documents[relpath] = e
+        value = documents[relpath]
+        if isinstance(value, Exception):
+            raise value
+        return value
+    return read
+
+
+def _build_datasets(read, matrix=None):
+    """Resolve every dataset through read, building the inventory matrix unless given"""
+    datasets = {
+        attribute: _resolve(attribute, candidates, default, read)
+        for attribute, candidates, default in DATASET_SOURCES
+    }
+    if matrix is None:
+        try:
+            inventory_locations = read(INVENTORY_LOCATIONS_FILE)
+        except (OSError, ValueError, KeyError):
+            inventory_locations = []
+        matrix = InventoryMatrix.from_records(inventory_locations)
+    datasets["inventory_matrix"] = matrix
+    return datasets
+
+
+def load_datasets(data_path, use_snapshot=True):
+    """Load every dataset plus the inventory matrix, as a dict keyed by attribute
+
+    With use_snapshot, datasets come from the compiled binary snapshot when
+    it is current; otherwise the JSON files are parsed in parallel and the
+    snapshot is rebuilt for the next start.
+    """
+    data_path = Path(data_path)
+    # Taken before reading, so a file changing mid-load is picked up by the next reload
+    fingerprints = dataset_fingerprints(data_path)
+    snapshot = open_snapshot(data_path) if use_snapshot else None
+
+    if snapshot is not None:
+        documents = {}
+
+        def read(relpath):
+            if relpath not in documents:
+                if not snapshot.has_document(relpath):
+                    raise KeyError(relpath)
+                documents[relpath] = compact_document(relpath, snapshot.document(relpath))
+            return documents[relpath]
+
+        datasets = _build_datasets(read, matrix=(
+            snapshot.inventory_matrix() if snapshot.has_document(INVENTORY_LOCATIONS_FILE)
+            else InventoryMatrix.from_records([])
+        ))
+        datasets["data_source"] = "snapshot"
+    else:
+        # First-choice files are independent, so parse them together; fallbacks only on demand
+        primary = [candidates[0] for _, candidates, _ in DATASET_SOURCES] + [INVENTORY_LOCATIONS_FILE]
+        documents = parse_files(data_path, [relpath for relpath in primary if relpath in fingerprints])
+        datasets = _build_datasets(_json_reader(data_path, documents))
+        datasets["data_source"] = "json"
+
+    datasets["documents"] = documents
+    datasets["fingerprints"] = fingerprints
+    if snapshot is None and use_snapshot:
+        write_snapshot(data_path, datasets)
+    return datasets
+
+
+def changed_files(data_path, fingerprints):
+    """Dataset files added, removed or modified since fingerprints were taken"""
+    current = dataset_fingerprints(data_path)
+    changed = sorted(
+        relpath for relpath in set(current) | set(fingerprints)
+        if current.get(relpath) != fingerprints.get(relpath)
+    )
+    return changed, current
+
+
+def reload_datasets(data_path, previous):
+    """Incrementally reload the datasets behind a previous DataStore
+
+    Only dataset files whose size or mtime changed are parsed again, in
+    parallel; every other dataset and the inventory matrix are reused from
+    the previous store. Returns None when nothing changed. Unlike the first
+    load, a changed file that cannot be parsed (such as an export caught
+    mid-write), or a file the previous store was built from that has gone,
+    raises instead of falling back to another file or an empty default, so
+    the caller keeps the previous store.
+    """
+    data_path = Path(data_path)
+    changed, fingerprints = changed_files(data_path, previous.fingerprints)
+    if not changed:
+        return None
+
+    parsed = parse_files(data_path, [relpath for relpath in changed if relpath in fingerprints])
+    for relpath in changed:
+        error = parsed.get(relpath)
+        if isinstance(error, OSError):
+            raise error
+        if isinstance(error, Exception):
+            raise ValueError(f"Could not parse {relpath}: {error}") from error
+        if relpath not in fingerprints and not isinstance(previous.documents.get(relpath, KeyError()), Exception):
+            raise FileNotFoundError(f"{relpath} was removed")
+
+    documents = {
+        relpath: data for relpath, data in previous.documents.items()
+        if relpath not in changed
+    }
+    documents.update(parsed)
+
+    matrix = None if INVENTORY_LOCATIONS_FILE in changed else previous.inventory_matrix
+    datasets = _build_datasets(_json_reader(data_path, documents), matrix=matrix)
+    datasets["data_source"] = "json"
+    datasets["documents"] = documents
+    datasets["fingerprints"] = fingerprints
+    datasets["changed_files"] = changed
+    return datasets
+
+
+def write_snapshot(data_path, datasets):
+    """Recompile the binary snapshot from already-loaded datasets
+
+    The manifest records the fingerprints taken before the datasets were
+    read, so files changed since then leave the snapshot stale.
+    """
+    documents = {
+        relpath: data for relpath, data in datasets["documents"].items()
+        if not isinstance(data, Exception)
+    }
+    try:
+        compile_snapshot(data_path, documents=documents, matrix=datasets["inventory_matrix"],
+                         fingerprints=datasets["fingerprints"])
+    except OSError:
+        # Read-only deployments keep working from JSON
+        return False
+    return True
@@ -0,0 +1,280 @@
+"""
+AOG request email extraction
+
+AOG emails follow one convention for line items,
+``- Description (Vendor PN: XXX) - Qty: N``, with the vendor and part
+number optional, and name the aircraft, tail, airport, deadline and cost
+of delay in free text. extract_email() pulls all of it out with
+precompiled patterns; extract_mailbox() streams the same extraction over
+a local mbox file or Maildir directory, one message at a time.
+"""
+
+import binascii
+import email
+import email.header
+import re
+from email.policy import compat32
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .units import Money, parse_money
+
+LINE_ITEM = re.compile(
+    r"^[ \t]*[-•*][ \t]*(?P<description>[^(\n-]+(?:-(?![ \t]*Qty)[^(\n-]*)*?)"
+    r"(?:\((?P<source>[^()\n]*)\))?[ \t]*-[ \t]*Qty:[ \t]*(?P<quantity>\d+)",
+    re.MULTILINE | re.IGNORECASE,
+)
+# '(Vendor PN: XXX)' -> vendor, part number
+PART_NUMBER = re.compile(r"[ \t]*PN:[ \t]*", re.IGNORECASE)
+
+# IATA code -> airport name, for the airports AOG mail is sent from
+AIRPORTS = {
+    "LHR": "London Heathrow",
+    "LGW": "London Gatwick",
+    "STN": "London Stansted",
+    "DUB": "Dublin",
+    "FRA": "Frankfurt",
+    "MUC": "Munich",
+    "CDG": "Paris",
+    "AMS": "Amsterdam",
+    "MAD": "Madrid",
+    "FCO": "Rome",
+    "ZRH": "Zurich",
+    "VIE": "Vienna",
+    "DXB": "Dubai",
+    "DOH": "Doha",
+    "SIN": "Singapore",
+    "HKG": "Hong Kong",
+    "NRT": "Tokyo Narita",
+    "SYD": "Sydney",
+    "JFK": "New York JFK",
+    "MIA": "Miami",
+}
+# Place names that stand for an airport when no code is given
+AIRPORT_CITIES = {
+    "Heathrow": "LHR", "London": "LHR", "Gatwick": "LGW", "Stansted": "STN", "Dublin": "DUB",
+    "Frankfurt": "FRA", "Munich": "MUC", "Paris": "CDG", "Amsterdam": "AMS", "Madrid": "MAD",
+    "Rome": "FCO", "Zurich": "ZRH", "Vienna": "VIE", "Dubai": "DXB", "Doha": "DOH",
+    "Singapore": "SIN", "Hong Kong": "HKG", "Tokyo": "NRT", "Sydney": "SYD", "New York": "JFK", "Miami": "MIA",
+}
+
+MANUFACTURERS = {"A": "Airbus", "B": "Boeing", "7": "Boeing", "E": "Embraer", "C": "Bombardier"}
+
+AIRCRAFT = re.compile(
+    r"\b(?:(?P<maker>Boeing|Airbus|Embraer|Bombardier)[ \t]+)?"
+    r"(?P<model>B?7[1-8]7|A3[1-8]0|A220|E1[79]0|E-?Jet|CRJ\d{3})(?P<variant>-[0-9A-Z]+)?\b"
+)
+# Civil registrations: G-VIIA, D-AIUI, A6-EUA, N12345
+TAIL = re.compile(r"\b(?:[A-Z]{1,2}|[A-Z]\d)-[A-Z]{3,4}\b|\bN\d{1,5}[A-Z]{0,2}\b")
+LOCATION = re.compile(
+    r"\b(?P<code>" + "|".join(AIRPORTS) + r")\b"
+    r"|\b(?P<city>" + "|".join(sorted(AIRPORT_CITIES, key=len, reverse=True)) + r")\b"
+)
+DEADLINE = re.compile(
+    r"\b(?:required|needed|need|deliver(?:y|ed)?)\b[^.\n]*?\b(?P<deadline>(?:by|within)[ \t]+[^.,;\n]+?)"
+    r"(?=[ \t]+(?:acceptable|please|if|or|and)\b|[.,;!?\n]|$)",
+    re.IGNORECASE,
+)
+IMMEDIATE = re.compile(r"\b(?:immediate(?:ly)?|asap)\b", re.IGNORECASE)
+LOSS_RATE = re.compile(r"(?P<amount>[£€$][ \t]?[\d,]+(?:\.\d+)?[KM]?)[ \t]*(?:/|per)[ \t]*(?P<unit>hour|hr|day)\b",
+                       re.IGNORECASE)
+LOSS_TOTAL = re.compile(r"\bloss\b[^£€$\n]*(?P<amount>[£€$][ \t]?[\d,]+(?:\.\d+)?[KM]?)", re.IGNORECASE)
+HOURS_DOWN = re.compile(r"\bdown[ \t]+for[ \t]+(?P<hours>\d+)[ \t]*(?:hours|hrs)\b", re.IGNORECASE)
+AOG = re.compile(r"\bAOG\b")
+URGENT = re.compile(r"\b(?:urgent(?:ly)?|emergency|immediate(?:ly)?|asap|grounded)\b", re.IGNORECASE)
+
+HOURS_PER_UNIT = {"hour": 1, "hr": 1, "day": 24}
+
+
+class LineItem(NamedTuple):
+    description: str
+    quantity: int
+    part_number: Optional[str] = None
+    vendor: Optional[str] = None
+
+
+class AOGEmail(NamedTuple):
+    """Fields extracted from one AOG request email"""
+    subject: str
+    line_items: list
+    aircraft: Optional[str]
+    tail: Optional[str]
+    location: Optional[str]  # IATA code
+    deadline: Optional[str]
+    loss_per_hour: Optional[Money]
+    urgency: str
+
+    @property
+    def parts_count(self):
+        return len(self.line_items)
+
+    @property
+    def location_name(self):
+        """'Dubai (DXB)', or None when no airport was found"""
+        return f"{AIRPORTS[self.location]} ({self.location})" if self.location else None
+
+
+def _line_item(match):
+    vendor, *part_number = PART_NUMBER.split(match["source"] or "", maxsplit=1)
+    return LineItem(match["description"].strip(), int(match["quantity"]),
+                    part_number[0].strip() or None if part_number else None, vendor.strip() or None)
+
+
+def parse_line_items(text):
+    """LineItems for every '- Description (Vendor PN: XXX) - Qty: N' line in the text"""
+    return [_line_item(match) for match in LINE_ITEM.finditer(text or "")]
+
+
+def _split_line_items(text):
+    """(line items, the text with the line items cut out) in one pass"""
+    items, prose, end = [], [], 0
+    for match in LINE_ITEM.finditer(text):
+        items.append(_line_item(match))
+        prose.append(text[end:match.start()])
+        end = match.end()
+    prose.append(text[end:])
+    return items, "".join(prose)
+
+
+def _aircraft(text):
+    match = AIRCRAFT.search(text)
+    if not match:
+        return None
+    model = match["model"]
+    maker = match["maker"] or MANUFACTURERS.get(model[0].upper())
+    if maker == "Boeing" and model.startswith("B"):
+        model = model[1:]
+    return " ".join(filter(None, (maker, model + (match["variant"] or ""))))
+
+
+def _location(text):
+    match = LOCATION.search(text)
+    if not match:
+        return None
+    return match["code"] or AIRPORT_CITIES[match["city"]]
+
+
+def _deadline(text):
+    match = DEADLINE.search(text)
+    if match:
+        return match["deadline"]
+    return "Immediate" if IMMEDIATE.search(text) else None
+
+
+def _loss_per_hour(text):
+    """Cost of delay per hour, from an explicit rate or a running loss over the hours down"""
+    match = LOSS_RATE.search(text)
+    if match:
+        money = parse_money(match["amount"].replace(" ", ""))
+        hours = HOURS_PER_UNIT[match["unit"].lower()]
+    else:
+        match, down = LOSS_TOTAL.search(text), HOURS_DOWN.search(text)
+        if not (match and down and int(down["hours"])):
+            return None
+        money = parse_money(match["amount"].replace(" ", ""))
+        hours = int(down["hours"])
+    return Money(round(money.minor / hours), money.currency) if money else None
+
+
+def _urgency(text):
+    if AOG.search(text):
+        return "Critical AOG"
+    if URGENT.search(text):
+        return "Emergency"
+    return "Routine"
+
+
+def extract_email(body, subject=""):
+    """AOGEmail with everything extracted from an email's subject and plain-text body"""
+    body = body or ""
+    # Everything but the line items is read from the prose, so vendor part
+    # numbers and descriptions are not taken for aircraft, tails or urgency
+    line_items, prose = _split_line_items(body)
+    text = f"{subject}\n{prose}" if subject else prose
+    return AOGEmail(
+        subject=subject or "",
+        line_items=line_items,
+        aircraft=_aircraft(text),
+        tail=(TAIL.search(text) or [None])[0],
+        location=_location(text),
+        deadline=_deadline(prose),
+        loss_per_hour=_loss_per_hour(prose),
+        urgency=_urgency(text),
+    )
+
+
+HEADER = re.compile(rb"^(subject|content-type|content-transfer-encoding):[ \t]*(.*(?:\r?\n[ \t].*)*)",
+                    re.MULTILINE | re.IGNORECASE)
+HEADER_END = re.compile(rb"\r?\n\r?\n")
+CHARSET = re.compile(r'charset="?([\w.:-]+)', re.IGNORECASE)
+# Content-Transfer-Encoding -> body decoder for the fast path
+TRANSFER_DECODERS = {
+    "": bytes, "7bit": bytes, "8bit": bytes, "binary": bytes,
+    "quoted-printable": binascii.a2b_qp, "base64": binascii.a2b_base64,
+}
+
+
+def _subject_and_body(raw):
+    """(subject, plain-text body) of one raw RFC 822 message
+
+    Single-part plain-text messages, nearly all AOG mail, are split without
+    building a Message; anything encoded or multipart goes through the email
+    package.
+    """
+    end = HEADER_END.search(raw)
+    header_block = raw[:end.start()] if end else raw
+    headers = {name.lower(): re.sub(rb"\r?\n[ \t]+", b" ", value).strip().decode("utf-8", "replace")
+               for name, value in HEADER.findall(header_block)}
+    content_type = headers.get(b"content-type", "text/plain")
+    subject = headers.get(b"subject", "")
+    decode = TRANSFER_DECODERS.get(headers.get(b"content-transfer-encoding", "").lower())
+    if content_type.lower().startswith("text/plain") and "=?" not in subject and decode is not None:
+        charset = CHARSET.search(content_type)
+        body = decode(raw[end.end():] if end else b"")
+        return subject, body.decode(charset[1] if charset else "utf-8", "replace")
+
+    message = email.message_from_bytes(raw, policy=compat32)
+    part = next((part for part in message.walk() if part.get_content_type() == "text/plain"), None)
+    payload = part.get_payload(decode=True) if part is not None else None
+    charset = (part.get_content_charset() if part is not None else None) or "utf-8"
+    body = payload.decode(charset, "replace") if payload else ""
+    subject = str(email.header.make_header(email.header.decode_header(message.get("Subject", ""))))
+    return subject, body
+
+
+def iter_mailbox(path):
+    """(subject, body) of every message in an mbox file or Maildir directory, streamed"""
+    path = Path(path)
+    if path.is_dir():
+        for folder in ("new", "cur"):
+            if (path / folder).is_dir():
+                for message_file in sorted((path / folder).iterdir()):
+                    yield _subject_and_body(message_file.read_bytes())
+        return
+
+    with open(path, "rb") as handle:
+        lines = None
+        for line in handle:
+            if line.startswith(b"From "):
+                if lines:
+                    yield _subject_and_body(_mbox_message(lines))
+                lines = []
+            elif lines is not None:
+                lines.append(line)
+        if lines:
+            yield _subject_and_body(_mbox_message(lines))
+
+
+def _mbox_message(lines):
+    """Raw message from its mbox lines, without the separating blank line and '>From ' quoting"""
+    if lines[-1] in (b"\n", b"\r\n"):
+        lines = lines[:-1]
+    # mboxrd quoting: '>From ' in a body was 'From ', '>>From ' was '>From '
+    return b"".join(line[1:] if line.startswith(b">") and line.lstrip(b">").startswith(b"From ") else line
+                    for line in lines)
+
+
+def extract_mailbox(path):
+    """AOGEmail for every message in an mbox file or Maildir directory, one at a time"""
+    for subject, body in iter_mailbox(path):
+        yield extract_email(body, subject)
@@ -0,0 +1,362 @@
+"""
+Dense parts x hubs inventory matrix built from inventory_locations.json,
+and the live inventory state that stock movements are applied to
+"""
+
+import bisect
+import datetime
+import threading
+
+import numpy as np
+
+# Source file, relative to the BH_Worldwide_Logistics data directory
+INVENTORY_LOCATIONS_FILE = "Operations/Parts_Database/inventory_locations.json"
+
+# Real BH Worldwide inventory hubs, in the order the data files list them
+HUBS = ("London", "Frankfurt", "Dubai", "Singapore", "New York", "Hong Kong")
+
+# Status buckets by total available units, worst first
+STATUS_LABELS = ("critical", "low", "medium", "good")
+STATUS_COLORS = ("red", "orange", "yellow", "green")
+LOW_STOCK_THRESHOLD = 3
+MEDIUM_STOCK_THRESHOLD = 10
+OVERSTOCK_THRESHOLD = 50
+
+# Arrival dates are stored as days since 1970-01-01, -1 meaning nothing incoming
+NO_ARRIVAL = -1
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+def date_to_day(value):
+    """Convert an ISO date string to days since 1970-01-01"""
+    return datetime.date.fromisoformat(value[:10]).toordinal() - _EPOCH_ORDINAL
+
+
+def day_to_date(day):
+    """Convert days since 1970-01-01 back to an ISO date string"""
+    return datetime.date.fromordinal(int(day) + _EPOCH_ORDINAL).isoformat()
+
+
+def _status_code(total_available):
+    """status_codes() for one part's total, without building an array"""
+    return bisect.bisect_left((0, LOW_STOCK_THRESHOLD, MEDIUM_STOCK_THRESHOLD), total_available)
+
+
+def _health_metrics(total_parts, status_counts, overstocked_parts, location_totals):
+    critical_parts, low_stock_parts = status_counts[0], status_counts[1]
+    healthy_parts = total_parts - critical_parts - low_stock_parts
+    health_score = (healthy_parts / total_parts) * 100
+    return {
+        'total_parts': total_parts,
+        'critical_parts': critical_parts,
+        'low_stock_parts': low_stock_parts,
+        'overstocked_parts': overstocked_parts,
+        'healthy_parts': healthy_parts,
+        'health_score': health_score,
+        'overall_health': health_score,
+        'location_totals': location_totals
+    }
+
+
+class InventoryMatrix:
+    """Stock, reserved and incoming quantities as int32 arrays shaped parts x hubs"""
+
+    def __init__(self, part_numbers, hubs, stock, reserved, incoming_qty, next_arrival_day):
+        self.part_numbers = list(part_numbers)
+        self.hubs = tuple(hubs)
+        self.stock = stock
+        self.reserved = reserved
+        self.incoming_qty = incoming_qty
+        self.next_arrival_day = next_arrival_day
+        self.row_index = {part_number: row for row, part_number in enumerate(self.part_numbers)}
+        self.hub_index = {hub: col for col, hub in enumerate(self.hubs)}
+
+    @classmethod
+    def from_records(cls, records, hubs=HUBS):
+        """Build the matrix from inventory_locations.json records"""
+        if not isinstance(records, list):
+            records = []
+
+        # Keep the known hub order, appending any extra hub the data mentions
+        hubs = list(hubs)
+        hub_index = {hub: col for col, hub in enumerate(hubs)}
+        for record in records:
+            for hub in record.get("stock_levels_per_location", {}):
+                if hub not in hub_index:
+                    hub_index[hub] = len(hubs)
+                    hubs.append(hub)
+
+        # First record wins for duplicated part numbers, like the old linear scans
+        part_numbers = []
+        unique_records = []
+        seen = set()
+        for record in records:
+            part_number = record.get("part_number")
+            if not part_number or part_number in seen:
+                continue
+            seen.add(part_number)
+            part_numbers.append(part_number)
+            unique_records.append(record)
+
+        shape = (len(part_numbers), len(hubs))
+        stock = np.zeros(shape, dtype=np.int32)
+        reserved = np.zeros(shape, dtype=np.int32)
+        incoming_qty = np.zeros(shape, dtype=np.int32)
+        next_arrival_day = np.full(shape, NO_ARRIVAL, dtype=np.int32)
+
+        for row, record in enumerate(unique_records):
+            for hub, qty in record.get("stock_levels_per_location", {}).items():
+                stock[row, hub_index[hub]] = qty or 0
+            for hub, qty in (record.get("reserved_inventory_per_location") or {}).items():
+                if hub in hub_index:
+                    reserved[row, hub_index[hub]] = qty or 0
+            for hub, schedule in (record.get("incoming_stock_schedules_per_location") or {}).items():
+                if hub in hub_index and schedule and schedule.get("quantity"):
+                    incoming_qty[row, hub_index[hub]] = schedule["quantity"]
+                    next_arrival_day[row, hub_index[hub]] = date_to_day(schedule["arrival_date"])
+
+        return cls(part_numbers, hubs, stock, reserved, incoming_qty, next_arrival_day)
+
+    def __len__(self):
+        return len(self.part_numbers)
+
+    def __contains__(self, part_number):
+        return part_number in self.row_index
+
+    def available(self):
+        """Available units per part and hub (stock minus reserved, floored at zero)"""
+        return np.maximum(self.stock - self.reserved, 0)
+
+    def rows(self, part_numbers):
+        """Matrix row per part number, -1 where the part is not stocked"""
+        return np.array([self.row_index.get(part_number, -1) for part_number in part_numbers], dtype=np.int64)
+
+    def available_rows(self, rows):
+        """Available units shaped len(rows) x hubs, gathered for just those rows; zero where a row is -1"""
+        rows = np.asarray(rows, dtype=np.int64)
+        available = np.zeros((len(rows), len(self.hubs)), dtype=np.int64)
+        stocked = rows >= 0
+        if stocked.any():
+            available[stocked] = np.maximum(self.stock[rows[stocked]] - self.reserved[rows[stocked]], 0)
+        return available
+
+    def available_units(self, part_numbers):
+        """Available units shaped parts x hubs, zero for parts not stocked"""
+        return self.available_rows(self.rows(part_numbers))
+
+    def status_codes(self, total_available=None):
+        """Status bucket per part as an index into STATUS_LABELS"""
+        if total_available is None:
+            total_available = self.available().sum(axis=1)
+        return np.searchsorted(
+            np.array([0, LOW_STOCK_THRESHOLD, MEDIUM_STOCK_THRESHOLD]),
+            total_available,
+            side="left",
+        ).astype(np.int8)
+
+    def global_metrics(self):
+        """Global inventory health metrics computed as array reductions"""
+        if not self.part_numbers:
+            return None
+        total_available = self.available().sum(axis=1)
+        status_counts = np.bincount(self.status_codes(total_available), minlength=len(STATUS_LABELS))
+        return _health_metrics(
+            len(self.part_numbers), status_counts.tolist(),
+            int(np.count_nonzero(total_available > OVERSTOCK_THRESHOLD)),
+            dict(zip(self.hubs, self.stock.sum(axis=0, dtype=np.int64).tolist())),
+        )
+
+    def part_metrics(self, part_number):
+        """Inventory metrics for one part, in the shape the dashboard UI expects"""
+        row = self.row_index.get(part_number)
+        if row is None:
+            return None
+
+        stock = self.stock[row].tolist()
+        reserved = self.reserved[row].tolist()
+        incoming = self.incoming_qty[row].tolist()
+        arrival_days = self.next_arrival_day[row].tolist()
+
+        stock_by_location = dict(zip(self.hubs, stock))
+        reserved_by_location = dict(zip(self.hubs, reserved))
+        available_stock = {hub: max(0, s - r) for hub, s, r in zip(self.hubs, stock, reserved)}
+        total_available = sum(available_stock.values())
+        status_code = int(self.status_codes(np.array([total_available]))[0])
+
+        best_hubs = sorted(
+            [(hub, qty) for hub, qty in available_stock.items() if qty > 0],
+            key=lambda x: x[1], reverse=True
+        )
+
+        incoming_schedules = {}
+        for hub, qty, day in zip(self.hubs, incoming, arrival_days):
+            incoming_schedules[hub] = {'quantity': qty, 'arrival_date': day_to_date(day)} if qty else None
+        scheduled_days = [day for qty, day in zip(incoming, arrival_days) if qty]
+        total_incoming = sum(incoming)
+        next_arrival = day_to_date(min(scheduled_days)) if scheduled_days else None
+
+        return {
+            'part_number': part_number,
+            'total_stock': sum(stock),
+            'total_available': total_available,
+            'total_reserved': sum(reserved),
+            'status': STATUS_LABELS[status_code],
+            'status_color': STATUS_COLORS[status_code],
+            'available_stock': available_stock,
+            'available_by_location': available_stock,
+            'stock_by_location': stock_by_location,
+            'reserved_by_location': reserved_by_location,
+            'best_hubs': best_hubs,
+            'total_incoming': total_incoming,
+            'next_arrival_date': next_arrival,
+            'next_arrival': f"{total_incoming} units arriving on {next_arrival}" if next_arrival else None,
+            'incoming_schedules': incoming_schedules
+        }
+
+
+class InventoryState:
+    """Live inventory, with its global health aggregates kept current per event
+
+    Starts from a copy of a loaded InventoryMatrix, which stays read-only,
+    and applies stock, reservation and arrival deltas to the copy. Each
+    event moves the part's available total, its status bucket count, the
+    overstock count and the hub's stock total by the delta, so metrics() is
+    a read of a few counters rather than a reduction over every part.
+    verify() recomputes everything from the arrays to check the counters.
+    """
+
+    def __init__(self, matrix):
+        # The loaded matrix this state started from, so readers can tell it belongs to their store
+        self.source = matrix
+        self.hubs = matrix.hubs
+        self.events = 0
+        self._matrix = InventoryMatrix(matrix.part_numbers, matrix.hubs, matrix.stock.copy(),
+                                       matrix.reserved.copy(), matrix.incoming_qty.copy(),
+                                       matrix.next_arrival_day.copy())
+        self._lock = threading.Lock()
+        self._total_available = self._matrix.available().sum(axis=1, dtype=np.int64).tolist()
+        self._status_counts = [0] * len(STATUS_LABELS)
+        for total in self._total_available:
+            self._status_counts[_status_code(total)] += 1
+        self._overstocked = sum(total > OVERSTOCK_THRESHOLD for total in self._total_available)
+        self._location_totals = self._matrix.stock.sum(axis=0, dtype=np.int64).tolist()
+
+    def __len__(self):
+        return len(self._matrix)
+
+    def __contains__(self, part_number):
+        return part_number in self._matrix
+
+    def _cell(self, part_number, hub):
+        row, col = self._matrix.row_index.get(part_number), self._matrix.hub_index.get(hub)
+        if row is None or col is None:
+            raise KeyError((part_number, hub))
+        return row, col
+
+    def _apply(self, row, col, stock_delta=0, reserved_delta=0):
+        """Apply one delta to a cell and move the aggregates it touches; call with the lock held"""
+        stock, reserved = self._matrix.stock, self._matrix.reserved
+        old_stock, old_reserved = int(stock[row, col]), int(reserved[row, col])
+        new_stock, new_reserved = old_stock + stock_delta, old_reserved + reserved_delta
+        if new_stock < 0 or new_reserved < 0:
+            raise ValueError(f"{self._matrix.part_numbers[row]} at {self.hubs[col]}: "
+                             f"stock {new_stock} and reserved {new_reserved} cannot be negative")
+        stock[row, col], reserved[row, col] = new_stock, new_reserved
+        self._location_totals[col] += stock_delta
+        self.events += 1
+
+        change = max(new_stock - new_reserved, 0) - max(old_stock - old_reserved, 0)
+        if change:
+            old_total = self._total_available[row]
+            new_total = self._total_available[row] = old_total + change
+            old_code, new_code = _status_code(old_total), _status_code(new_total)
+            if old_code != new_code:
+                self._status_counts[old_code] -= 1
+                self._status_counts[new_code] += 1
+            self._overstocked += (new_total > OVERSTOCK_THRESHOLD) - (old_total > OVERSTOCK_THRESHOLD)
+
+    def adjust_stock(self, part_number, hub, delta):
+        """On-hand stock at a hub moved by delta units (issues negative, receipts positive)"""
+        row, col = self._cell(part_number, hub)
+        with self._lock:
+            self._apply(row, col, stock_delta=delta)
+
+    def adjust_reserved(self, part_number, hub, delta):
+        """Units reserved at a hub moved by delta (reservations positive, releases negative)"""
+        row, col = self._cell(part_number, hub)
+        with self._lock:
+            self._apply(row, col, reserved_delta=delta)
+
+    def receive(self, part_number, hub, quantity=None):
+        """Incoming stock arrived at a hub: all that was scheduled, or quantity units of it"""
+        row, col = self._cell(part_number, hub)
+        with self._lock:
+            incoming = int(self._matrix.incoming_qty[row, col])
+            quantity = incoming if quantity is None else quantity
+            self._apply(row, col, stock_delta=quantity)
+            self._matrix.incoming_qty[row, col] = max(incoming - quantity, 0)
+            if self._matrix.incoming_qty[row, col] == 0:
+                self._matrix.next_arrival_day[row, col] = NO_ARRIVAL
+
+    def hold(self, part_number, allocations):
+        """Reserve {hub: units} of a part all at once, only if every hub has the units available"""
+        cells = [(*self._cell(part_number, hub), units) for hub, units in allocations.items()]
+        with self._lock:
+            stock, reserved = self._matrix.stock, self._matrix.reserved
+            for row, col, units in cells:
+                if units > stock[row, col] - reserved[row, col]:
+                    raise ValueError(f"Only {max(int(stock[row, col] - reserved[row, col]), 0)} of "
+                                     f"{part_number} available at {self.hubs[col]}, {units} requested")
+            for row, col, units in cells:
+                self._apply(row, col, reserved_delta=units)
+
+    def apply(self, deltas):
+        """Apply many (part number, hub, stock delta, reserved delta) events under one lock"""
+        cells = [(*self._cell(part_number, hub), stock_delta, reserved_delta)
+                 for part_number, hub, stock_delta, reserved_delta in deltas]
+        with self._lock:
+            for row, col, stock_delta, reserved_delta in cells:
+                self._apply(row, col, stock_delta, reserved_delta)
+        return len(cells)
+
+    def _metrics(self):
+        if not len(self._matrix):
+            return None
+        return _health_metrics(len(self._matrix), list(self._status_counts), self._overstocked,
+                               dict(zip(self.hubs, self._location_totals)))
+
+    def metrics(self):
+        """Global health metrics from the running aggregates, same shape as InventoryMatrix.global_metrics()"""
+        with self._lock:
+            return self._metrics()
+
+    def part_metrics(self, part_number):
+        with self._lock:
+            return self._matrix.part_metrics(part_number)
+
+    def available_rows(self, rows):
+        """InventoryMatrix.available_rows() on the live arrays"""
+        with self._lock:
+            return self._matrix.available_rows(rows)
+
+    def available_units(self, part_numbers):
+        """Available units shaped parts x hubs, zero for parts not stocked"""
+        return self.available_rows(self._matrix.rows(part_numbers))
+
+    def snapshot(self):
+        """A consistent InventoryMatrix copy of the live arrays, for whole-inventory computations"""
+        with self._lock:
+            matrix = self._matrix
+            return InventoryMatrix(matrix.part_numbers, matrix.hubs, matrix.stock.copy(), matrix.reserved.copy(),
+                                   matrix.incoming_qty.copy(), matrix.next_arrival_day.copy())
+
+    def verify(self):
+        """Metrics whose running value differs from a full recompute, as {name: (running, recomputed)}
+
+        Empty when the aggregates agree with the arrays.
+        """
+        with self._lock:
+            running, recomputed = self._metrics(), self._matrix.global_metrics()
+        if running is None or recomputed is None:
+            return {} if running == recomputed else {'metrics': (running, recomputed)}
+        return {name: (running[name], value) for name, value in recomputed.items() if running[name] != value}
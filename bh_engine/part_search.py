@@ -0,0 +1,198 @@
+"""
+Ranked full-text search over the parts catalog
+
+A BM25 inverted index over part descriptions, categories and compatible
+aircraft types. Postings are stored CSR-style in flat numpy arrays with the
+BM25 weight of every (term, part) pair precomputed, twice: in part order for
+random access, and in descending weight ("impact") order so a query can stop
+reading a posting list once no unseen part can beat the current top k (the
+threshold algorithm). Aircraft-family filters are packed bitsets.
+"""
+
+import re
+from typing import NamedTuple
+
+import numpy as np
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Words that carry no signal for matching a needed part to the catalog
+STOPWORDS = frozenset("""
+a an and as at by for from in into of on or the to with
+unit units assembly assy component components part parts system systems kit set type
+""".split())
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercased alphanumeric tokens without stopwords, with simple plural folding"""
+    if not text:
+        return []
+    tokens = []
+    for token in _TOKEN.findall(str(text).lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def aircraft_family(aircraft_type):
+    """'Boeing 777-300ER' -> 'boeing 777', so variants match their family"""
+    if not aircraft_type:
+        return ""
+    return " ".join(str(aircraft_type).split("-")[0].lower().split())
+
+
+def _bitset(ids, size):
+    bits = np.zeros(size, dtype=bool)
+    bits[ids] = True
+    return np.packbits(bits)
+
+
+def bitset_contains(bitset, ids):
+    """Boolean mask of which ids are set in a packed bitset"""
+    return ((bitset[ids >> 3] >> (7 - (ids & 7))) & 1).astype(bool)
+
+
+class PartMatch(NamedTuple):
+    part: object
+    score: float
+
+
+class PartSearchIndex:
+    """BM25 index over catalog parts, queried with search()"""
+
+    # Postings read per list in the first round; doubled every round after
+    BLOCK = 64
+
+    def __init__(self, parts, terms, offsets, doc_ids, weights, families):
+        self.parts = parts
+        self.terms = terms
+        self.offsets = offsets
+        self.doc_ids = doc_ids
+        self.weights = weights
+        self.families = families
+        # Impact order: each term's postings by descending weight, part order breaking ties
+        term_of = np.repeat(np.arange(len(terms)), np.diff(offsets))
+        impact = np.lexsort((doc_ids, -weights, term_of)) if len(doc_ids) else np.zeros(0, dtype=np.int64)
+        self.impact_ids = doc_ids[impact]
+        self.impact_weights = weights[impact]
+
+    @classmethod
+    def from_catalog(cls, parts):
+        """Build the index from aircraft_parts_catalog.json records"""
+        parts = list(parts) if isinstance(parts, list) else []
+        terms = {}
+        postings = []  # (term id, doc id, term frequency)
+        lengths = np.zeros(len(parts), dtype=np.float32)
+        family_docs = {}
+
+        for doc, part in enumerate(parts):
+            aircraft_types = part.get("compatible_aircraft_types") or []
+            tokens = tokenize(part.get("description"))
+            tokens += tokenize(part.get("category"))
+            for aircraft_type in aircraft_types:
+                tokens += tokenize(aircraft_type)
+                family_docs.setdefault(aircraft_family(aircraft_type), []).append(doc)
+            lengths[doc] = len(tokens)
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                postings.append((terms.setdefault(token, len(terms)), doc, tf))
+
+        if postings:
+            posting_array = np.array(postings, dtype=np.int64)
+            order = np.lexsort((posting_array[:, 1], posting_array[:, 0]))
+            term_ids, doc_ids, tfs = posting_array[order].T
+        else:
+            term_ids = doc_ids = tfs = np.zeros(0, dtype=np.int64)
+
+        doc_freq = np.bincount(term_ids, minlength=len(terms))
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(doc_freq, out=offsets[1:])
+
+        # Precompute each posting's full BM25 contribution
+        n = max(len(parts), 1)
+        idf = np.log1p((n - doc_freq + 0.5) / (doc_freq + 0.5))
+        avg_length = float(lengths.mean()) if len(parts) else 1.0
+        tfs = tfs.astype(np.float32)
+        norm = K1 * (1 - B + B * lengths[doc_ids] / max(avg_length, 1e-9))
+        weights = (idf[term_ids] * tfs * (K1 + 1) / (tfs + norm)).astype(np.float32)
+
+        families = {
+            family: _bitset(np.array(docs, dtype=np.int64), len(parts))
+            for family, docs in family_docs.items()
+        }
+        return cls(parts, terms, offsets, doc_ids.astype(np.int32), weights, families)
+
+    def __len__(self):
+        return len(self.parts)
+
+    def _term_weights(self, term, candidates):
+        """BM25 weight of one term in each candidate part (0 where absent)"""
+        start, end = self.offsets[term], self.offsets[term + 1]
+        ids = self.doc_ids[start:end]
+        pos = np.searchsorted(ids, candidates)
+        pos[pos == len(ids)] = 0
+        hit = ids[pos] == candidates if len(ids) else np.zeros(len(candidates), dtype=bool)
+        return np.where(hit, self.weights[start:end][pos] if len(ids) else 0, 0).astype(np.float32)
+
+    def search(self, query, k=5, aircraft_type=None):
+        """Top-k PartMatch results for a free-text query, best first
+
+        With aircraft_type, only parts compatible with that aircraft family
+        are returned.
+        """
+        query_terms = sorted({self.terms[token] for token in tokenize(query) if token in self.terms})
+        if not query_terms or k <= 0:
+            return []
+        bitset = None
+        if aircraft_type:
+            bitset = self.families.get(aircraft_family(aircraft_type))
+            if bitset is None:
+                return []
+
+        seen = np.zeros(len(self.parts), dtype=bool)
+        top_ids = np.zeros(0, dtype=np.int32)
+        top_scores = np.zeros(0, dtype=np.float32)
+        depth, block = 0, self.BLOCK
+        while True:
+            # Next block of every posting list in impact order
+            heads = []
+            threshold = 0.0
+            exhausted = True
+            for term in query_terms:
+                start, end = self.offsets[term] + depth, self.offsets[term + 1]
+                heads.append(self.impact_ids[start:min(start + block, end)])
+                if start + block < end:
+                    exhausted = False
+                    threshold += float(self.impact_weights[start + block])
+            depth += block
+            block *= 2
+
+            candidates = np.unique(np.concatenate(heads))
+            candidates = candidates[~seen[candidates]]
+            seen[candidates] = True
+            if bitset is not None and len(candidates):
+                candidates = candidates[bitset_contains(bitset, candidates)]
+            if len(candidates):
+                scores = sum(self._term_weights(term, candidates) for term in query_terms)
+                top_ids = np.concatenate((top_ids, candidates))
+                top_scores = np.concatenate((top_scores, scores))
+                if len(top_ids) > k:
+                    keep = np.lexsort((top_ids, -top_scores))[:k]
+                    top_ids, top_scores = top_ids[keep], top_scores[keep]
+
+            # No unseen part can score above the next weights still unread
+            if exhausted or (len(top_ids) == k and top_scores.min() >= threshold):
+                break
+
+        # Highest score first, catalog order breaking ties
+        order = np.lexsort((top_ids, -top_scores))
+        return [PartMatch(self.parts[int(top_ids[i])], float(top_scores[i])) for i in order]
@@ -0,0 +1,272 @@
+"""
+Line-item pricing from parts_pricing.json, with a shared LRU + TTL cache
+
+PriceTable loads the pricing records into dense arrays: unit prices shaped
+parts x hubs x tiers, volume discounts shaped parts x brackets and one
+expedite markup per part, so a line is priced with array lookups and a
+whole multi-line quote with one vectorized call.
+
+A line item is priced per unit at a source hub for a customer tier, volume
+bracket and delivery mode; the quantity only scales the unit price. Priced
+units are cached under (part_number, hub, tier, bracket, delivery mode,
+pricing version), so repeat AOGs for the same part are served from memory
+until parts_pricing.json changes.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+from .inventory import HUBS
+
+PRICING_FILE = "Operations/Parts_Database/parts_pricing.json"
+
+TIERS = ("Tier1", "Tier2", "Tier3")
+# Customer priority level -> customer_specific_pricing_tiers key
+TIER_BY_PRIORITY = {"Diamond": "Tier1", "Platinum": "Tier1", "Gold": "Tier2", "Silver": "Tier3"}
+DEFAULT_TIER = "Tier2"
+
+# (lowest quantity, volume_discounts key), lowest bracket first
+VOLUME_BRACKETS = ((1, "1-5"), (6, "6-10"), (11, "11-20"), (21, "21+"))
+BRACKET_FLOORS = np.array([lowest for lowest, _ in VOLUME_BRACKETS])
+
+EXPEDITE = "expedite"
+STANDARD = "standard"
+# Quote delivery options -> pricing delivery mode
+DELIVERY_MODES = {
+    "Next Flight Out": EXPEDITE,
+    "Same Day": EXPEDITE,
+    "Express": EXPEDITE,
+    "Standard": STANDARD,
+}
+
+DEFAULT_EXPEDITE_MARKUP = 0.35
+INSURANCE_RATE = 0.015
+
+# Cache bounds: entries kept, and seconds before an entry is repriced
+PRICE_CACHE_SIZE = 4096
+PRICE_CACHE_TTL = 300.0
+
+
+def bracket_index(quantities):
+    """Index into VOLUME_BRACKETS for each quantity (quantities below 1 use the first bracket)"""
+    return np.maximum(np.searchsorted(BRACKET_FLOORS, quantities, side="right") - 1, 0)
+
+
+def quantity_bracket(quantity):
+    """volume_discounts key for a quantity"""
+    bracket = VOLUME_BRACKETS[0][1]
+    for lowest, key in VOLUME_BRACKETS:
+        if quantity >= lowest:
+            bracket = key
+    return bracket
+
+
+def customer_tier(priority_level):
+    return TIER_BY_PRIORITY.get(priority_level, DEFAULT_TIER)
+
+
+class PricedUnit(NamedTuple):
+    """Per-unit costs in GBP; estimated when the part has no pricing record"""
+    unit_cost: float
+    expedite_rate: float
+    insurance_rate: float
+    estimated: bool
+
+    def costs(self, quantity=1):
+        """(base, expedite, insurance) whole-pound costs for a quantity"""
+        base = int(self.unit_cost * quantity)
+        return base, int(base * self.expedite_rate), int(base * self.insurance_rate)
+
+
+class PriceTable:
+    """parts_pricing.json as dense arrays, indexed by part number, hub, tier and volume bracket"""
+
+    def __init__(self, part_numbers, hubs, tiers, unit_prices, discounts, expedite_markups):
+        self.part_numbers = list(part_numbers)
+        self.hubs = tuple(hubs)
+        self.tiers = tuple(tiers)
+        self.unit_prices = unit_prices
+        self.discounts = discounts
+        self.expedite_markups = expedite_markups
+        self.row_index = {part_number: row for row, part_number in enumerate(self.part_numbers)}
+        self.hub_index = {hub: col for col, hub in enumerate(self.hubs)}
+        self.tier_index = {tier: col for col, tier in enumerate(self.tiers)}
+        self.bracket_index = {bracket: col for col, (_, bracket) in enumerate(VOLUME_BRACKETS)}
+
+    @classmethod
+    def from_records(cls, records, hubs=HUBS, tiers=TIERS):
+        """Build the table from parts_pricing.json records"""
+        if not isinstance(records, list):
+            records = []
+
+        # First record wins for duplicated part numbers, like the parts index
+        unique_records = {}
+        for record in records:
+            part_number = record.get('part_number')
+            if part_number and part_number not in unique_records:
+                unique_records[part_number] = record
+
+        shape = (len(unique_records), len(hubs), len(tiers))
+        unit_prices = np.zeros(shape, dtype=np.float64)
+        discounts = np.zeros((len(unique_records), len(VOLUME_BRACKETS)), dtype=np.float64)
+        expedite_markups = np.full(len(unique_records), DEFAULT_EXPEDITE_MARKUP, dtype=np.float64)
+        for row, record in enumerate(unique_records.values()):
+            regional = record.get('regional_pricing_variations') or {}
+            base = record.get('base_cost_GBP', 0) or 0
+            hub_prices = np.array([regional.get(hub, base) for hub in hubs], dtype=np.float64)
+            tier_factors = record.get('customer_specific_pricing_tiers') or {}
+            unit_prices[row] = np.outer(hub_prices, [tier_factors.get(tier, 1) for tier in tiers])
+            volume = record.get('volume_discounts') or {}
+            discounts[row] = [volume.get(bracket, 0) for _, bracket in VOLUME_BRACKETS]
+            expedite_markups[row] = record.get('expedite_surcharge_markup', DEFAULT_EXPEDITE_MARKUP)
+        return cls(unique_records, hubs, tiers, unit_prices, discounts, expedite_markups)
+
+    def __len__(self):
+        return len(self.part_numbers)
+
+    def __contains__(self, part_number):
+        return part_number in self.row_index
+
+    def unit(self, part_number, hub, tier=DEFAULT_TIER, bracket="1-5", delivery_mode=EXPEDITE):
+        """PricedUnit for one part, or None when it has no pricing record"""
+        row = self.row_index.get(part_number)
+        if row is None:
+            return None
+        hub_col = self.hub_index.get(hub, 0)
+        tier_col = self.tier_index.get(tier, self.tier_index.get(DEFAULT_TIER, 0))
+        unit_cost = self.unit_prices[row, hub_col, tier_col] * (1 - self.discounts[row, self.bracket_index[bracket]])
+        markup = self.expedite_markups[row] if delivery_mode == EXPEDITE else 0.0
+        return PricedUnit(float(unit_cost), float(markup), INSURANCE_RATE, False)
+
+    def price_lines(self, part_numbers, quantities, hub, tier=DEFAULT_TIER, delivery_mode=EXPEDITE):
+        """Whole-pound costs for many lines in one vectorized pass
+
+        Returns a dict of arrays aligned with part_numbers: priced (False for
+        parts with no pricing record, whose costs are 0), unit_cost, base,
+        expedite and insurance. hub, tier and delivery_mode may be a single
+        value or one per line.
+        """
+        rows = np.array([self.row_index.get(part_number, -1) for part_number in part_numbers], dtype=np.int64)
+        quantities = np.asarray(quantities, dtype=np.int64)
+        priced = rows >= 0
+        safe_rows = np.where(priced, rows, 0)
+
+        hub_cols = self._columns(hub, self.hub_index, 0, len(rows))
+        tier_cols = self._columns(tier, self.tier_index, self.tier_index.get(DEFAULT_TIER, 0), len(rows))
+        expedited = np.broadcast_to(np.asarray(delivery_mode) == EXPEDITE, rows.shape)
+
+        if len(self.part_numbers):
+            unit_cost = self.unit_prices[safe_rows, hub_cols, tier_cols]
+            unit_cost = unit_cost * (1 - self.discounts[safe_rows, bracket_index(quantities)])
+            markups = np.where(expedited, self.expedite_markups[safe_rows], 0.0)
+        else:
+            unit_cost = np.zeros(len(rows))
+            markups = np.zeros(len(rows))
+        unit_cost = np.where(priced, unit_cost, 0.0)
+        base = np.floor(unit_cost * quantities).astype(np.int64)
+        return {
+            "priced": priced,
+            "unit_cost": unit_cost,
+            "base": base,
+            "expedite": np.floor(base * markups).astype(np.int64),
+            "insurance": np.floor(base * INSURANCE_RATE).astype(np.int64),
+        }
+
+    @staticmethod
+    def _columns(values, index, default, count):
+        if isinstance(values, str) or values is None:
+            return np.full(count, index.get(values, default), dtype=np.int64)
+        return np.array([index.get(value, default) for value in values], dtype=np.int64)
+
+
+def estimate_unit(matched, delivery_mode=EXPEDITE):
+    """Randomised unit price for parts without a pricing record"""
+    if matched:
+        unit_cost, markup, insurance = random.randint(15000, 85000), 0.35, 0.015
+    else:
+        unit_cost, markup, insurance = random.randint(25000, 75000), 0.30, 0.012
+    return PricedUnit(unit_cost, markup if delivery_mode == EXPEDITE else 0.0, insurance, True)
+
+
+class PriceCache:
+    """Thread-safe LRU cache of priced units with a time-to-live
+
+    Keys end with the pricing version; invalidate() drops every entry when
+    a reload brings a new version.
+    """
+
+    def __init__(self, maxsize=PRICE_CACHE_SIZE, ttl=PRICE_CACHE_TTL, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.version = None
+        self._entries = OrderedDict()  # key -> (expires at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Cached value, or None on a miss or an expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (self.clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_price(self, key, price):
+        """Cached value for key, calling price() and caching its result on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = price()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, version):
+        """Forget every entry if the pricing version changed; returns True if it did"""
+        with self._lock:
+            if version == self.version:
+                return False
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self.version = version
+            return True
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,171 @@
+"""
+Lightweight span profiler for timing dashboard reruns
+
+A Profiler records nested spans (page, shell, tab, section, data call)
+for one rerun. The active profiler is thread-local, because Streamlit runs
+each session's script on its own thread; with no active profiler every
+hook here is a cheap no-op.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+class Span:
+    __slots__ = ("name", "kind", "detail", "depth", "parent", "start", "end")
+
+    def __init__(self, name, kind, detail, depth, parent, start):
+        self.name = name
+        self.kind = kind
+        self.detail = detail
+        self.depth = depth
+        self.parent = parent
+        self.start = start
+        self.end = None
+
+
+class Profiler:
+    """Nested spans for one rerun; sections end when the next section or their parent starts/ends"""
+
+    def __init__(self, label=None):
+        self.label = label
+        self.spans = []
+        self._stack = []
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def start(self, name, kind, detail=None):
+        """Open a span and return its index"""
+        if kind == "section":
+            # A new heading closes the previous section at the same level
+            if self._stack and self.spans[self._stack[-1]].kind == "section":
+                self.stop(self._stack[-1])
+        parent = self._stack[-1] if self._stack else None
+        self.spans.append(Span(name, kind, detail, len(self._stack), parent, time.perf_counter()))
+        index = len(self.spans) - 1
+        self._stack.append(index)
+        return index
+
+    def stop(self, index):
+        """Close a span, and any section still open inside it"""
+        now = time.perf_counter()
+        while self._stack and index in self._stack:
+            top = self._stack.pop()
+            self.spans[top].end = now
+            if top == index:
+                break
+
+    @contextmanager
+    def span(self, name, kind, detail=None):
+        index = self.start(name, kind, detail)
+        try:
+            yield
+        finally:
+            self.stop(index)
+
+    def finish(self):
+        """Close everything still open and return the total elapsed seconds"""
+        while self._stack:
+            self.stop(self._stack[0])
+        self.finished = time.perf_counter()
+        return self.finished - self.started
+
+    def records(self):
+        """Spans as plain dicts with millisecond offsets and durations"""
+        end_default = self.finished or time.perf_counter()
+        return [
+            {
+                "name": span.name,
+                "kind": span.kind,
+                "detail": span.detail,
+                "depth": span.depth,
+                "parent": span.parent,
+                "offset_ms": round((span.start - self.started) * 1000, 3),
+                "ms": round(((span.end or end_default) - span.start) * 1000, 3),
+            }
+            for span in self.spans
+        ]
+
+    def totals(self, kind):
+        """Summed milliseconds per span name for one kind, slowest first"""
+        totals = {}
+        for record in self.records():
+            if record["kind"] == kind:
+                key = (record["name"], record["detail"])
+                count, ms = totals.get(key, (0, 0.0))
+                totals[key] = (count + 1, ms + record["ms"])
+        return sorted(
+            ({"name": name, "detail": detail, "calls": count, "ms": round(ms, 3)}
+             for (name, detail), (count, ms) in totals.items()),
+            key=lambda row: row["ms"], reverse=True,
+        )
+
+
+def active_profiler():
+    return getattr(_local, "profiler", None)
+
+
+def activate(profiler):
+    _local.profiler = profiler
+    return profiler
+
+
+def deactivate():
+    profiler = active_profiler()
+    _local.profiler = None
+    return profiler
+
+
+@contextmanager
+def profiled(name, kind="section", detail=None):
+    """Time a block under the active profiler, if any"""
+    profiler = active_profiler()
+    if profiler is None:
+        yield
+        return
+    with profiler.span(name, kind, detail):
+        yield
+
+
+def section(name):
+    """Start a named section under the active profiler, if any
+
+    Unlike profiled(), nothing needs indenting: the section runs until the
+    next section at the same level or the span around it ends.
+    """
+    profiler = active_profiler()
+    if profiler is not None:
+        profiler.start(name, "section")
+
+
+def timed(kind="data", name=None):
+    """Decorator timing each call under the active profiler, if any"""
+    def decorator(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = active_profiler()
+            if profiler is None:
+                return fn(*args, **kwargs)
+            with profiler.span(label, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def append_jsonl(path, record):
+    """Append one JSON record as a line, creating the file if needed"""
+    line = json.dumps(record, default=str) + "\n"
+    # One write call per record keeps concurrent sessions from interleaving lines
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode("utf-8"))
+    finally:
+        os.close(fd)
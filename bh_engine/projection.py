@@ -0,0 +1,131 @@
+"""
+Days of cover and stock-out projection
+
+StockProjection turns the extended inventory's per-hub stock, monthly
+demand and lead times, joined with the scheduled arrivals of the inventory
+matrix, into parts x hubs arrays: days of cover, the projected stock-out
+day, whether the next shipment lands before it, and whether a reorder
+placed today would. Everything is one set of array operations over all
+parts and hubs.
+"""
+
+import datetime
+
+import numpy as np
+
+from .datasets import DATASET_SOURCES
+from .inventory import INVENTORY_LOCATIONS_FILE, NO_ARRIVAL, date_to_day, day_to_date
+
+# Files the projection is computed from; it only needs recomputing when one of them changes
+PROJECTION_FILES = next(candidates for attribute, candidates, _ in DATASET_SOURCES
+                        if attribute == "inventory") + (INVENTORY_LOCATIONS_FILE,)
+
+DAYS_PER_MONTH = 365.25 / 12
+# Projected stock-outs are only dated this far ahead; beyond it a cell counts as covered
+HORIZON_DAYS = 365
+
+# Status per part and hub, worst first
+STATUS_LABELS = ("Stocked out", "At risk", "Incoming in time", "Covered", "No demand")
+STOCKED_OUT, AT_RISK, INCOMING_IN_TIME, COVERED, NO_DEMAND = range(len(STATUS_LABELS))
+
+
+class StockProjection:
+    """Days of cover, stock-out day and shipment timing shaped parts x hubs
+
+    Demand is only known per part, so each hub is projected to draw an
+    equal share of it.
+    """
+
+    def __init__(self, part_numbers, hubs, today, stock, monthly_demand, lead_time_days, incoming_qty,
+                 next_arrival_day):
+        self.part_numbers = list(part_numbers)
+        self.hubs = tuple(hubs)
+        self.today = date_to_day(today.isoformat())
+        self.stock = np.asarray(stock, dtype=np.int64)
+        self.lead_time_days = np.asarray(lead_time_days, dtype=np.int64)
+        self.incoming_qty = np.asarray(incoming_qty, dtype=np.int64)
+        self.next_arrival_day = np.asarray(next_arrival_day, dtype=np.int64)
+
+        # Units per day each hub is projected to use
+        self.daily_demand = np.asarray(monthly_demand, dtype=np.float64) / DAYS_PER_MONTH / max(len(self.hubs), 1)
+        demand = np.broadcast_to(self.daily_demand[:, None], self.stock.shape)
+        with np.errstate(divide="ignore"):
+            self.days_of_cover = np.where(demand > 0, self.stock / np.where(demand > 0, demand, 1), np.inf)
+        stocks_out = self.days_of_cover <= HORIZON_DAYS
+        self.stockout_day = np.where(stocks_out, self.today + np.floor(np.where(stocks_out, self.days_of_cover, 0)),
+                                     NO_ARRIVAL).astype(np.int64)
+
+        # A shipment is in time if it lands on or before the stock-out day
+        incoming = (self.incoming_qty > 0) & (self.next_arrival_day != NO_ARRIVAL)
+        self.incoming_in_time = incoming & stocks_out & (self.next_arrival_day <= self.stockout_day)
+        # A reorder placed today lands after the stock-out
+        self.reorder_late = stocks_out & (self.stockout_day < self.today + self.lead_time_days[:, None])
+
+        self.status = np.select(
+            [demand <= 0, self.stock <= 0, self.incoming_in_time, self.reorder_late],
+            [NO_DEMAND, STOCKED_OUT, INCOMING_IN_TIME, AT_RISK],
+            COVERED,
+        ).astype(np.int8)
+
+    @classmethod
+    def from_inventory(cls, items, matrix, today=None):
+        """Projection for extended inventory items, with arrivals from the matching matrix rows"""
+        today = today or datetime.date.today()
+        items = [item for item in items if hasattr(item, "get")]
+        hubs = matrix.hubs
+        hub_index = {hub.lower(): col for col, hub in enumerate(hubs)}
+
+        stock = np.zeros((len(items), len(hubs)), dtype=np.int64)
+        for row, item in enumerate(items):
+            for hub, units in (item.get("current_stock") or {}).items():
+                col = hub_index.get(str(hub).lower())
+                if col is not None:
+                    stock[row, col] = units or 0
+        part_numbers = [item.get("part_number") for item in items]
+        monthly_demand = [item.get("monthly_demand") or 0 for item in items]
+        lead_time_days = [item.get("lead_time_days") or 0 for item in items]
+
+        # Incoming shipments for the parts the inventory matrix also tracks
+        rows = matrix.rows(part_numbers)
+        tracked = rows >= 0
+        incoming_qty = np.zeros(stock.shape, dtype=np.int64)
+        next_arrival_day = np.full(stock.shape, NO_ARRIVAL, dtype=np.int64)
+        incoming_qty[tracked] = matrix.incoming_qty[rows[tracked]]
+        next_arrival_day[tracked] = matrix.next_arrival_day[rows[tracked]]
+        return cls(part_numbers, hubs, today, stock, monthly_demand, lead_time_days, incoming_qty,
+                   next_arrival_day)
+
+    def __len__(self):
+        return len(self.part_numbers)
+
+    def summary(self):
+        """Counts of part-hub cells by status and the earliest projected stock-out"""
+        counts = np.bincount(self.status.ravel(), minlength=len(STATUS_LABELS))
+        dated = self.stockout_day[self.stockout_day != NO_ARRIVAL]
+        return {
+            "cells": int(self.status.size),
+            "status_counts": dict(zip(STATUS_LABELS, counts.tolist())),
+            "parts_at_risk": int(np.count_nonzero((self.status <= AT_RISK).any(axis=1))),
+            "earliest_stockout": day_to_date(dated.min()) if len(dated) else None,
+        }
+
+    def rows(self, statuses=(STOCKED_OUT, AT_RISK, INCOMING_IN_TIME), limit=None):
+        """One dict per part and hub with the given statuses, soonest stock-out first"""
+        parts, cols = np.nonzero(np.isin(self.status, statuses))
+        order = np.lexsort((cols, parts, self.stockout_day[parts, cols]))[:limit]
+        return [
+            {
+                "part_number": self.part_numbers[part],
+                "hub": self.hubs[col],
+                "stock": int(self.stock[part, col]),
+                "daily_demand": round(float(self.daily_demand[part]), 2),
+                "days_of_cover": round(float(self.days_of_cover[part, col]), 1),
+                "stockout_date": day_to_date(self.stockout_day[part, col])
+                if self.stockout_day[part, col] != NO_ARRIVAL else None,
+                "lead_time_days": int(self.lead_time_days[part]),
+                "next_arrival": day_to_date(self.next_arrival_day[part, col])
+                if self.incoming_qty[part, col] else None,
+                "status": STATUS_LABELS[self.status[part, col]],
+            }
+            for part, col in zip(parts[order].tolist(), cols[order].tolist())
+        ]
@@ -0,0 +1,214 @@
+"""
+Persistent quote history in SQLite
+
+Every generated, modified or sent quote is one row keyed by quote_id, with
+the full quote kept as JSON and the columns the dashboard looks up by
+(case, airline, time) indexed. Per-airline totals are kept current by
+triggers, so summaries read a handful of rows instead of every quote, and
+the history survives browser reloads and restarts. The stock the quotes
+hold is kept in the same file, so a restart can hold it again.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+
+from .reservations import Reservation
+
+QUOTE_DB = "bh_quotes.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    quote_id TEXT PRIMARY KEY,
+    case_id TEXT NOT NULL,
+    airline TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL DEFAULT '',
+    total_cost INTEGER NOT NULL DEFAULT 0,
+    confidence_score REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'Generated',
+    quote TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quotes_by_case ON quotes (case_id, timestamp);
+CREATE INDEX IF NOT EXISTS quotes_by_airline ON quotes (airline, timestamp);
+CREATE INDEX IF NOT EXISTS quotes_by_time ON quotes (timestamp);
+
+CREATE TABLE IF NOT EXISTS quote_totals (
+    airline TEXT PRIMARY KEY,
+    quotes INTEGER NOT NULL,
+    total_value INTEGER NOT NULL,
+    confidence_sum REAL NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS quote_added AFTER INSERT ON quotes BEGIN
+    INSERT INTO quote_totals VALUES (NEW.airline, 1, NEW.total_cost, NEW.confidence_score)
+    ON CONFLICT (airline) DO UPDATE SET quotes = quotes + 1, total_value = total_value + NEW.total_cost,
+                                        confidence_sum = confidence_sum + NEW.confidence_score;
+END;
+CREATE TRIGGER IF NOT EXISTS quote_removed AFTER DELETE ON quotes BEGIN
+    UPDATE quote_totals SET quotes = quotes - 1, total_value = total_value - OLD.total_cost,
+                            confidence_sum = confidence_sum - OLD.confidence_score
+    WHERE airline = OLD.airline;
+END;
+CREATE TRIGGER IF NOT EXISTS quote_changed AFTER UPDATE OF airline, total_cost, confidence_score ON quotes BEGIN
+    UPDATE quote_totals SET quotes = quotes - 1, total_value = total_value - OLD.total_cost,
+                            confidence_sum = confidence_sum - OLD.confidence_score
+    WHERE airline = OLD.airline;
+    INSERT INTO quote_totals VALUES (NEW.airline, 1, NEW.total_cost, NEW.confidence_score)
+    ON CONFLICT (airline) DO UPDATE SET quotes = quotes + 1, total_value = total_value + NEW.total_cost,
+                                        confidence_sum = confidence_sum + NEW.confidence_score;
+END;
+
+CREATE TABLE IF NOT EXISTS reservations (
+    reservation_id TEXT PRIMARY KEY,
+    part_number TEXT NOT NULL,
+    allocations TEXT NOT NULL,
+    reference TEXT,
+    expires_at REAL
+);
+"""
+
+# New quotes never replace a stored one: a clashing quote_id fails with sqlite3.IntegrityError
+_INSERT = """
+INSERT INTO quotes (quote_id, case_id, airline, timestamp, total_cost, confidence_score, status, quote)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE = """
+UPDATE quotes SET case_id = ?, airline = ?, timestamp = ?, total_cost = ?, confidence_score = ?, status = ?,
+                  quote = ?
+WHERE quote_id = ?
+"""
+
+
+def _row(quote):
+    return (
+        quote['quote_id'],
+        quote['case_id'],
+        quote.get('airline') or '',
+        quote.get('timestamp') or '',
+        int(quote.get('total_cost') or 0),
+        float(quote.get('confidence_score') or 0),
+        quote.get('status') or 'Generated',
+        json.dumps(quote, default=str),
+    )
+
+
+class QuoteStore:
+    """Thread-safe quote history in one SQLite file, shared by every session of the process"""
+
+    def __init__(self, path=QUOTE_DB):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _quotes(self, sql, params=()):
+        return [json.loads(quote) for quote, in self._query(sql, params)]
+
+    def __len__(self):
+        return self.summary()["quotes"]
+
+    def add(self, quote):
+        """Store a new quote; raises sqlite3.IntegrityError if its quote_id is already stored"""
+        with self._lock, self._conn:
+            self._conn.execute(_INSERT, _row(quote))
+        return quote
+
+    def add_many(self, quotes):
+        """add() for many quotes in one transaction, all or none"""
+        with self._lock, self._conn:
+            self._conn.executemany(_INSERT, [_row(quote) for quote in quotes])
+        return quotes
+
+    def update(self, quote):
+        """Replace a stored quote with a modified copy; returns None if its quote_id is not stored"""
+        quote_id, *values = _row(quote)
+        with self._lock, self._conn:
+            updated = self._conn.execute(_UPDATE, (*values, quote_id)).rowcount
+        return quote if updated else None
+
+    def get(self, quote_id):
+        quotes = self._quotes("SELECT quote FROM quotes WHERE quote_id = ?", (quote_id,))
+        return quotes[0] if quotes else None
+
+    def for_case(self, case_id):
+        """The latest quote for a case, or None"""
+        quotes = self._quotes("SELECT quote FROM quotes WHERE case_id = ? ORDER BY timestamp DESC LIMIT 1",
+                              (case_id,))
+        return quotes[0] if quotes else None
+
+    def quoted_case_ids(self, case_ids):
+        """Which of the given case ids have a quote"""
+        case_ids = list(case_ids)
+        if not case_ids:
+            return set()
+        placeholders = ",".join("?" * len(case_ids))
+        return {case_id for case_id, in self._query(
+            f"SELECT DISTINCT case_id FROM quotes WHERE case_id IN ({placeholders})", case_ids)}
+
+    def recent(self, limit=None, airline=None):
+        """Quotes newest first, optionally for one airline"""
+        where, params = ("WHERE airline = ?", [airline]) if airline is not None else ("", [])
+        sql = f"SELECT quote FROM quotes {where} ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self._quotes(sql, params)
+
+    def set_status(self, quote_id, status):
+        """Update a stored quote's status; returns the updated quote, or None if it is not stored"""
+        with self._lock, self._conn:
+            rows = self._conn.execute("SELECT quote FROM quotes WHERE quote_id = ?", (quote_id,)).fetchall()
+            if not rows:
+                return None
+            quote = dict(json.loads(rows[0][0]), status=status)
+            self._conn.execute("UPDATE quotes SET status = ?, quote = ? WHERE quote_id = ?",
+                               (status, json.dumps(quote, default=str), quote_id))
+        return quote
+
+    def delete(self, quote_id):
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM quotes WHERE quote_id = ?", (quote_id,)).rowcount > 0
+
+    def put_reservation(self, reservation):
+        """Record a stock reservation, replacing its earlier state (e.g. once confirmed or shrunk)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reservations VALUES (?, ?, ?, ?, ?)",
+                (reservation.reservation_id, reservation.part_number, json.dumps(reservation.allocations),
+                 reservation.reference, reservation.expires_at))
+        return reservation
+
+    def delete_reservation(self, reservation_id):
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM reservations WHERE reservation_id = ?",
+                                      (reservation_id,)).rowcount > 0
+
+    def reservations(self):
+        """Every recorded reservation, as Reservations"""
+        return [Reservation(reservation_id, part_number, json.loads(allocations), reference, expires_at)
+                for reservation_id, part_number, allocations, reference, expires_at in self._query(
+                    "SELECT reservation_id, part_number, allocations, reference, expires_at FROM reservations")]
+
+    def summary(self, airline=None):
+        """Quote count, total value and average confidence from the running totals"""
+        where, params = ("WHERE airline = ?", (airline,)) if airline is not None else ("", ())
+        quotes, total_value, confidence_sum = self._query(
+            f"SELECT COALESCE(SUM(quotes), 0), COALESCE(SUM(total_value), 0), COALESCE(SUM(confidence_sum), 0) "
+            f"FROM quote_totals {where}", params)[0]
+        return {
+            "quotes": quotes,
+            "total_value": total_value,
+            "avg_confidence": confidence_sum / quotes if quotes else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,245 @@
+"""
+Inter-hub stock rebalancing
+
+RebalancePlan proposes transfers of available stock between hubs that cut
+the expected cost of AOG requests a hub cannot fill from its own shelf by
+more than they cost to ship. Demand for a part at a hub over the planning
+horizon is Poisson, so one more unit at hub h saves the shortfall cost
+times P(demand at h exceeds its stock), and one unit fewer at hub g adds it
+times P(demand at g reaches its stock). Every round, each part makes its
+single best paying transfer, found with one argmax over all hub pairs for
+all parts at once, and a part drops out once no transfer pays.
+"""
+
+import datetime
+import math
+
+import numpy as np
+
+from .inventory import NO_ARRIVAL, date_to_day
+from .routes import HUB_AIRPORTS
+
+# Transfers are planned against the demand expected over this many days
+REBALANCE_HORIZON_DAYS = 30
+# Expected AOG requests for one part across the whole network over the horizon
+NETWORK_DEMAND_PER_PART = 2.0
+# Cost of a request the hub cannot fill itself: the extra hours down while the part comes from further away
+SHORTFALL_COST_GBP = 25_000.0
+# Consolidated hub-to-hub freight, much cheaper per kilometre than an AOG courier
+TRANSFER_GBP_PER_KM = 0.25
+TRANSFER_HANDLING_GBP = 150.0
+# Every round moves at most one unit per part
+MAX_ROUNDS = 64
+# Transfers must save at least this much to be proposed
+MIN_SAVING_GBP = 1.0
+
+
+def hub_demand_shares(routes, locations):
+    """Share of AOG demand per hub: cases counted at their nearest hub, plus one each so no hub reads as zero"""
+    nearest = routes.nearest_hubs(routes.airport_columns(locations))
+    counts = np.bincount(nearest[nearest >= 0], minlength=len(routes.hubs)) + 1.0
+    return counts / counts.sum()
+
+
+def transfer_costs(routes):
+    """Cost of moving one unit, shaped from hub x to hub; zero on the diagonal"""
+    cols = routes.airport_columns([HUB_AIRPORTS.get(hub) for hub in routes.hubs])
+    distance = np.where(cols >= 0, routes.distance_km[:, np.where(cols >= 0, cols, 0)], np.inf)
+    costs = TRANSFER_HANDLING_GBP + distance.astype(np.float64) * TRANSFER_GBP_PER_KM
+    np.fill_diagonal(costs, 0.0)
+    return costs
+
+
+def poisson_cap(lam):
+    """Units beyond which every cell's Poisson tail is negligible: P(D <= cap) is 1 and P(D = cap) is 0"""
+    lam_max = float(np.max(lam, initial=0.0))
+    return math.ceil(lam_max + 12 * math.sqrt(lam_max) + 20)
+
+
+def poisson_cdf(lam, stock):
+    """(P(D = stock), P(D <= stock)) per cell for Poisson demand lam
+
+    Stock above poisson_cap(lam) is evaluated at the cap, and each step
+    only touches the cells whose stock is still above it, so the work
+    follows the stock actually held, not the largest holding.
+    """
+    lam = np.asarray(lam, dtype=np.float64)
+    stock = np.minimum(np.asarray(stock, dtype=np.int64), poisson_cap(lam))
+    flat_lam, flat_stock = lam.ravel(), stock.ravel()
+    cdf = np.exp(-flat_lam)
+    pmf = np.where(flat_stock == 0, cdf, 0.0)
+    live = np.flatnonzero(flat_stock > 0)
+    term = cdf[live]
+    k = 1
+    while len(live):
+        term = term * flat_lam[live] / k
+        cdf[live] += term
+        held = flat_stock[live]
+        pmf[live[held == k]] = term[held == k]
+        live, term = live[held > k], term[held > k]
+        k += 1
+    return pmf.reshape(lam.shape), cdf.reshape(lam.shape)
+
+
+def expected_shortfall(lam, stock):
+    """E[max(D - stock, 0)] per cell for Poisson demand lam"""
+    lam = np.asarray(lam, dtype=np.float64)
+    # Past the cap every extra unit covers nothing, so the shortfall there is the one at the cap
+    stock = np.minimum(np.asarray(stock, dtype=np.int64), poisson_cap(lam))
+    flat_lam, flat_stock = lam.ravel(), stock.ravel()
+    # E[(D - s)+] = lam - s + E[(s - D)+], and E[(s - D)+] sums P(D <= j) for j below s
+    surplus = np.zeros(flat_lam.shape)
+    live = np.flatnonzero(flat_stock > 0)
+    term = np.exp(-flat_lam[live])
+    cdf = term.copy()
+    k = 1
+    while len(live):
+        surplus[live] += cdf
+        term = term * flat_lam[live] / k
+        cdf = cdf + term
+        keep = flat_stock[live] > k
+        live, term, cdf = live[keep], term[keep], cdf[keep]
+        k += 1
+    return lam - stock + surplus.reshape(lam.shape)
+
+
+class RebalancePlan:
+    """Proposed unit transfers between hubs, solved for every part at once"""
+
+    def __init__(self, part_numbers, hubs, available, incoming, demand, transfer_cost, max_rounds=MAX_ROUNDS):
+        self.part_numbers = list(part_numbers)
+        self.hubs = tuple(hubs)
+        self.available = np.asarray(available, dtype=np.int64)
+        self.demand = np.broadcast_to(np.asarray(demand, dtype=np.float64), self.available.shape)
+        self.transfer_cost = np.asarray(transfer_cost, dtype=np.float64)
+
+        # Incoming units count towards a hub's position but cannot be moved
+        self.position_before = self.available + np.asarray(incoming, dtype=np.int64)
+        self.position_after, moves = self._solve(max_rounds)
+        self.parts, self.from_hub, self.to_hub, self.units, self.saving = moves
+        self.shortfall_before = expected_shortfall(self.demand, self.position_before).sum(axis=0)
+        self.shortfall_after = expected_shortfall(self.demand, self.position_after).sum(axis=0)
+
+    @classmethod
+    def from_inventory(cls, matrix, routes, locations, today=None, part_demand=NETWORK_DEMAND_PER_PART):
+        """Plan for an InventoryMatrix, with demand split across hubs by where AOG cases happen"""
+        today = date_to_day((today or datetime.date.today()).isoformat())
+        shares = hub_demand_shares(routes, locations)
+        arriving = (matrix.next_arrival_day != NO_ARRIVAL) & (matrix.next_arrival_day <= today + REBALANCE_HORIZON_DAYS)
+        return cls(matrix.part_numbers, matrix.hubs, matrix.available(), np.where(arriving, matrix.incoming_qty, 0),
+                   np.multiply.outer(np.broadcast_to(part_demand, len(matrix)), shares), transfer_costs(routes))
+
+    def _solve(self, max_rounds):
+        position = self.position_before.copy()
+        movable = self.available.copy()
+        lam = np.ascontiguousarray(self.demand)
+        pmf, cdf = poisson_cdf(lam, position)
+        # Cells above the cap keep the cap's terms, which is what they are to within the tail
+        cap = poisson_cap(lam)
+        from_hub, to_hub = np.nonzero(~np.eye(len(self.hubs), dtype=bool))
+        pair_cost = self.transfer_cost[from_hub, to_hub]
+
+        active = np.arange(len(position))
+        moves = []
+        for _ in range(max_rounds):
+            if not len(active):
+                break
+            # Value of one more unit at each hub, and of the last unit at each hub that can give one
+            gain = SHORTFALL_COST_GBP * (1.0 - cdf[active])
+            loss = np.where(movable[active] > 0, SHORTFALL_COST_GBP * (1.0 - cdf[active] + pmf[active]), np.inf)
+            net = gain[:, to_hub] - loss[:, from_hub] - pair_cost
+            best = net.argmax(axis=1)
+            saving = net[np.arange(len(active)), best]
+            # A part that cannot improve now never will, since only its own moves change its values
+            paying = saving >= MIN_SAVING_GBP
+            active, best, saving = active[paying], best[paying], saving[paying]
+            if not len(active):
+                break
+            source, target = from_hub[best], to_hub[best]
+            moves.append((active, source, target, saving))
+
+            # Step the Poisson terms one unit down at the source and one unit up at the target, below the cap
+            s = position[active, source]
+            lam_source = lam[active, source]
+            step = s <= cap
+            with np.errstate(divide="ignore", invalid="ignore"):
+                stepped = np.where(lam_source > 0, pmf[active, source] * s / lam_source, (s == 1).astype(np.float64))
+            cdf[active, source] -= np.where(step, pmf[active, source], 0.0)
+            pmf[active, source] = np.where(step, stepped, pmf[active, source])
+            position[active, source] = s - 1
+            movable[active, source] -= 1
+
+            s = position[active, target]
+            step = s < cap
+            stepped = pmf[active, target] * lam[active, target] / (s + 1)
+            pmf[active, target] = np.where(step, stepped, pmf[active, target])
+            cdf[active, target] += np.where(step, stepped, 0.0)
+            position[active, target] = s + 1
+
+        if not moves:
+            empty = np.zeros(0, dtype=np.int64)
+            return position, (empty, empty, empty, empty, np.zeros(0))
+        parts, source, target, saving = (np.concatenate(column) for column in zip(*moves))
+        # One row per part and hub pair, however many rounds moved units along it
+        key = (parts * len(self.hubs) + source) * len(self.hubs) + target
+        keys, inverse, units = np.unique(key, return_inverse=True, return_counts=True)
+        total_saving = np.bincount(inverse, weights=saving)
+        parts, pair = np.divmod(keys, len(self.hubs) ** 2)
+        source, target = np.divmod(pair, len(self.hubs))
+        return position, (parts, source, target, units, total_saving)
+
+    def __len__(self):
+        return len(self.parts)
+
+    def flows(self):
+        """Units moved, shaped from hub x to hub"""
+        hubs = len(self.hubs)
+        return np.bincount(self.from_hub * hubs + self.to_hub, weights=self.units,
+                           minlength=hubs * hubs).reshape(hubs, hubs).astype(np.int64)
+
+    def summary(self):
+        """Units moved, freight spent and expected shortfall cost saved, net of freight"""
+        freight = float((self.transfer_cost[self.from_hub, self.to_hub] * self.units).sum())
+        return {
+            "transfers": len(self),
+            "units_moved": int(self.units.sum()),
+            "parts_moved": int(len(np.unique(self.parts))),
+            "transfer_cost": round(freight, 2),
+            "shortfall_before": round(float(self.shortfall_before.sum()), 2),
+            "shortfall_after": round(float(self.shortfall_after.sum()), 2),
+            "net_saving": round(float(self.saving.sum()), 2),
+        }
+
+    def hub_rows(self):
+        """One dict per hub: available units now and after the transfers, and expected shortfall"""
+        flows = self.flows()
+        available_after = self.available.sum(axis=0) + flows.sum(axis=0) - flows.sum(axis=1)
+        return [
+            {
+                "hub": hub,
+                "available": int(self.available[:, col].sum()),
+                "transfers_in": int(flows[:, col].sum()),
+                "transfers_out": int(flows[col].sum()),
+                "available_after": int(available_after[col]),
+                "shortfall_before": round(float(self.shortfall_before[col]), 2),
+                "shortfall_after": round(float(self.shortfall_after[col]), 2),
+            }
+            for col, hub in enumerate(self.hubs)
+        ]
+
+    def transfers(self, limit=None):
+        """One dict per proposed transfer, biggest saving first"""
+        order = np.argsort(-self.saving, kind="stable")[:limit]
+        return [
+            {
+                "part_number": self.part_numbers[part],
+                "from_hub": self.hubs[source],
+                "to_hub": self.hubs[target],
+                "units": int(units),
+                "transfer_cost": round(float(self.transfer_cost[source, target] * units), 2),
+                "net_saving": round(float(saving), 2),
+            }
+            for part, source, target, units, saving in zip(
+                self.parts[order].tolist(), self.from_hub[order].tolist(), self.to_hub[order].tolist(),
+                self.units[order].tolist(), self.saving[order].tolist())
+        ]
@@ -0,0 +1,211 @@
+"""
+Compact slotted record types for the large record lists in the data tree
+
+Cases, catalog parts and customers used to be plain dicts, each repeating
+every key string and every enumerated value. Records keep fields in
+__slots__ and store enumerated fields (urgency, status, category, ...) as
+small integer codes into a shared Vocabulary. Money and duration strings are
+also parsed once into derived attributes (Money, integer minutes or hours)
+that sit beside the original strings. Records are read-only Mappings,
+so page code written against the dicts (``case["urgency"]``,
+``part.get("category")``) works unchanged.
+"""
+
+import threading
+from collections.abc import Mapping
+
+from .units import parse_hours, parse_minutes, parse_money
+
+# Slot value for a field the source record did not have
+_ABSENT = object()
+
+
+class Vocabulary:
+    """Interned values of one enumerated field, each mapped to a small int code"""
+
+    def __init__(self, name, values=()):
+        self.name = name
+        self.values = []
+        self._codes = {}
+        self._lock = threading.Lock()
+        for value in values:
+            self.code(value)
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            # Several loader threads may meet a new value at once
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    code = self._codes[value] = len(self.values)
+                    self.values.append(value)
+        return code
+
+    def value(self, code):
+        return self.values[code]
+
+    def get_code(self, value, default=None):
+        """Code of an already-seen value without adding it"""
+        return self._codes.get(value, default)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f"Vocabulary({self.name!r}, {len(self.values)} values)"
+
+
+class Record(Mapping):
+    """Read-only, dict-like record backed by __slots__; subclasses come from record_type"""
+
+    __slots__ = ()
+    FIELDS = ()
+    VOCABULARIES = {}
+    # field -> (slot name, Vocabulary or None)
+    _LAYOUT = {}
+    # derived attribute -> (source field, parser); not part of the mapping
+    DERIVED = {}
+
+    def __init__(self, data):
+        extra = None
+        for key, value in data.items():
+            layout = self._LAYOUT.get(key)
+            if layout is None or (layout[1] is not None and not isinstance(value, str)):
+                # Unknown fields, and enumerated fields holding anything but a string, stay as-is
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+                continue
+            slot, vocabulary = layout
+            object.__setattr__(self, slot, value if vocabulary is None else vocabulary.code(value))
+        object.__setattr__(self, "extra", extra)
+        for attribute, (field, parse) in self.DERIVED.items():
+            value = data.get(field)
+            object.__setattr__(self, attribute, None if value is None else parse(value))
+
+    @classmethod
+    def from_dict(cls, data):
+        return data if isinstance(data, cls) else cls(data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key):
+        layout = self._LAYOUT.get(key)
+        if layout is not None:
+            slot, vocabulary = layout
+            value = getattr(self, slot, _ABSENT)
+            if value is not _ABSENT:
+                return value if vocabulary is None else vocabulary.values[value]
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        for field, (slot, _) in self._LAYOUT.items():
+            if hasattr(self, slot):
+                yield field
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def code(self, field):
+        """Integer code of an enumerated field, or -1 if absent"""
+        return getattr(self, self._LAYOUT[field][0], -1)
+
+    def as_dict(self):
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def __reduce__(self):
+        return (type(self), (self.as_dict(),))
+
+
+def record_type(name, fields, coded=(), derived=None, doc=None):
+    """Create a Record subclass with one slot per field
+
+    Fields in coded are stored as int codes into a per-type Vocabulary and
+    exposed as decoded properties; other fields are stored as-is. derived
+    maps extra attribute names to (source field, parser), computed once
+    when the record is built.
+    """
+    derived = dict(derived or {})
+    vocabularies = {field: Vocabulary(f"{name}.{field}") for field in coded}
+    layout = {
+        field: (f"_{field}" if field in vocabularies else field, vocabularies.get(field))
+        for field in fields
+    }
+    namespace = {
+        "__slots__": tuple(slot for slot, _ in layout.values()) + ("extra",) + tuple(derived),
+        "__doc__": doc,
+        "__module__": __name__,
+        "FIELDS": tuple(fields),
+        "VOCABULARIES": vocabularies,
+        "_LAYOUT": layout,
+        "DERIVED": derived,
+    }
+    for field, vocabulary in vocabularies.items():
+        namespace[field] = property(
+            lambda self, slot=layout[field][0], values=vocabulary.values:
+                values[getattr(self, slot)] if hasattr(self, slot) else None,
+            doc=f"Decoded {field}",
+        )
+    return type(name, (Record,), namespace)
+
+
+CaseRecord = record_type(
+    "CaseRecord",
+    ("case_id", "aircraft", "tail_number", "airline", "location", "part_needed", "part_number",
+     "urgency", "grounded_since", "estimated_loss_per_hour", "total_loss_so_far",
+     "quote_requested", "quote_deadline", "status", "elapsed_time"),
+    coded=("aircraft", "airline", "location", "urgency", "status"),
+    derived={
+        "loss_per_hour": ("estimated_loss_per_hour", parse_money),
+        "total_loss": ("total_loss_so_far", parse_money),
+        "elapsed_minutes": ("elapsed_time", parse_minutes),
+    },
+    doc="One AOG case",
+)
+
+PartRecord = record_type(
+    "PartRecord",
+    ("part_number", "description", "compatible_aircraft_types", "category", "criticality_level",
+     "lead_time", "weight_kg", "dimensions_m"),
+    coded=("category", "criticality_level"),
+    derived={"lead_time_hours": ("lead_time", parse_hours)},
+    doc="One aircraft_parts_catalog.json part",
+)
+
+CustomerRecord = record_type(
+    "CustomerRecord",
+    ("customer_id", "name", "iata_code", "headquarters", "fleet_size", "annual_aog_volume",
+     "response_time_sla", "payment_terms", "priority_level", "typical_parts", "main_hubs", "contact"),
+    coded=("payment_terms", "priority_level"),
+    derived={
+        "annual_volume": ("annual_aog_volume", parse_money),
+        "sla_minutes": ("response_time_sla", parse_minutes),
+    },
+    doc="One airline customer",
+)
+
+InventoryItemRecord = record_type(
+    "InventoryItemRecord",
+    ("part_number", "description", "category", "aircraft_types", "current_stock", "unit_cost",
+     "lead_time_days", "criticality", "monthly_demand", "suppliers", "weight_kg",
+     "shelf_life_months", "certification"),
+    coded=("category", "criticality", "certification"),
+    derived={"unit_cost_money": ("unit_cost", parse_money)},
+    doc="One critical_inventory item from the Inventory files",
+)
+
+
+def compact_records(records, record_class):
+    """Convert a list of dicts into records, leaving anything else untouched"""
+    if not isinstance(records, list) or not all(isinstance(r, Mapping) for r in records):
+        return records
+    return [record_class.from_dict(record) for record in records]
@@ -0,0 +1,253 @@
+"""
+Stock reservations held by open quotes
+
+ReservationEngine reserves units of a part at one or more hubs against an
+InventoryState, all or nothing, and gives them back on release or when the
+hold expires. Each part has its own lock, so concurrent quotes for the
+same scarce part queue up and can never promise the same unit twice, while
+quotes for different parts proceed in parallel. With a quote store the
+holds are recorded next to the quotes, and whenever the engine starts or
+the inventory reloads they are held again against the new stock.
+"""
+
+import heapq
+import logging
+import threading
+import time
+import uuid
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# How long a quote holds its units, matching the 24 hour quote validity
+RESERVATION_HOLD_SECONDS = 24 * 60 * 60
+# Parts share this many locks, picked by hash, so the lock table stays small
+LOCK_STRIPES = 256
+
+
+class Reservation(NamedTuple):
+    reservation_id: str
+    part_number: str
+    allocations: dict  # hub -> units
+    reference: Optional[str]  # case or quote the units are held for
+    expires_at: Optional[float]  # epoch seconds, None once confirmed
+
+    @property
+    def quantity(self):
+        return sum(self.allocations.values())
+
+    @property
+    def hub(self):
+        """The first hub units are held at"""
+        return next(iter(self.allocations))
+
+
+def new_reservation_id():
+    """RSV-<12 random hex digits>, unique across processes and restarts"""
+    return f"RSV-{uuid.uuid4().hex[:12].upper()}"
+
+
+class ReservationEngine:
+    """Atomic reserve, release, confirm and expiry of stock, thread-safe
+
+    quote_store, if given, is anything with put_reservation,
+    delete_reservation and reservations (such as QuoteStore); the holds it
+    recorded are taken again on construction.
+    """
+
+    def __init__(self, inventory, hold_seconds=RESERVATION_HOLD_SECONDS, clock=time.time, quote_store=None):
+        self.inventory = inventory
+        self.hold_seconds = hold_seconds
+        self.clock = clock
+        self.quote_store = quote_store
+        self._part_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        # Guards the book and the expiry heap; never held while waiting for a part lock
+        self._book_lock = threading.Lock()
+        self._active = {}
+        self._expiries = []  # (expires at, reservation id)
+        # Reservations of parts missing from the current inventory: kept as recorded, holding no units
+        self._detached = set()
+        if quote_store is not None:
+            self._restore(quote_store.reservations())
+
+    def _part_lock(self, part_number):
+        return self._part_locks[hash(part_number) % LOCK_STRIPES]
+
+    def __len__(self):
+        return len(self._active)
+
+    def get(self, reservation_id):
+        return self._active.get(reservation_id)
+
+    def active(self, part_number=None):
+        """Reservations not yet released or expired, optionally for one part"""
+        with self._book_lock:
+            return [reservation for reservation in self._active.values()
+                    if part_number is None or reservation.part_number == part_number]
+
+    def reserve(self, part_number, quantity=1, hubs=None, reference=None, hold_seconds=None):
+        """Hold quantity units of a part, taken from hubs in the order given (default all hubs)
+
+        Returns the Reservation, or None when the hubs cannot cover the
+        quantity between them; nothing is held unless all of it is.
+        """
+        self.expire()
+        hubs = [hub for hub in dict.fromkeys(hubs or self.inventory.hubs) if hub in self.inventory.hubs]
+        if quantity <= 0 or part_number not in self.inventory:
+            return None
+        with self._part_lock(part_number):
+            available = dict(zip(self.inventory.hubs, self.inventory.available_units([part_number])[0].tolist()))
+            allocations, remaining = {}, quantity
+            for hub in hubs:
+                units = min(available[hub], remaining)
+                if units > 0:
+                    allocations[hub] = units
+                    remaining -= units
+                if not remaining:
+                    break
+            if remaining:
+                return None
+            try:
+                self.inventory.hold(part_number, allocations)
+            except ValueError:
+                # Stock moved outside the engine since it was read
+                return None
+            hold_seconds = self.hold_seconds if hold_seconds is None else hold_seconds
+            reservation = Reservation(new_reservation_id(), part_number, allocations, reference,
+                                      self.clock() + hold_seconds)
+            self._book(reservation)
+        return reservation
+
+    def _book(self, reservation):
+        """Add a held reservation to the book and the quote store; call with its part lock held"""
+        with self._book_lock:
+            self._active[reservation.reservation_id] = reservation
+            if reservation.expires_at is not None:
+                heapq.heappush(self._expiries, (reservation.expires_at, reservation.reservation_id))
+        if self.quote_store is not None:
+            self.quote_store.put_reservation(reservation)
+
+    def _restore(self, reservations):
+        """Hold reservations again on the current inventory
+
+        A reservation the stock no longer covers is shrunk to what is
+        available, and dropped when nothing is; both are logged. A
+        reservation of a part the inventory no longer lists at all is kept
+        as recorded without holding units, and held again by the next
+        reset whose inventory lists the part.
+        """
+        now = self.clock()
+        for reservation in reservations:
+            if reservation.expires_at is not None and reservation.expires_at <= now:
+                self._forget(reservation.reservation_id)
+                continue
+            part_number = reservation.part_number
+            with self._part_lock(part_number):
+                if part_number not in self.inventory:
+                    logger.warning("%s is missing from the inventory; reservation %s for %s keeps %s unheld",
+                                   part_number, reservation.reservation_id, reservation.reference,
+                                   reservation.allocations)
+                    with self._book_lock:
+                        self._detached.add(reservation.reservation_id)
+                    self._book(reservation)
+                    continue
+                available = dict(zip(self.inventory.hubs,
+                                     self.inventory.available_units([part_number])[0].tolist()))
+                allocations = {hub: min(units, available.get(hub, 0))
+                               for hub, units in reservation.allocations.items()}
+                allocations = {hub: units for hub, units in allocations.items() if units > 0}
+                if allocations != reservation.allocations:
+                    logger.warning("Stock of %s shrank under reservation %s for %s: holding %s of %s",
+                                   part_number, reservation.reservation_id, reservation.reference,
+                                   allocations or "nothing", reservation.allocations)
+                if not allocations:
+                    self._forget(reservation.reservation_id)
+                    continue
+                self.inventory.hold(part_number, allocations)
+                self._book(reservation._replace(allocations=allocations))
+
+    def _forget(self, reservation_id):
+        if self.quote_store is not None:
+            self.quote_store.delete_reservation(reservation_id)
+
+    def release(self, reservation_id, reference=None):
+        """Give a reservation's units back; False if it was already released or expired
+
+        With reference, only a reservation held for that reference is released.
+        """
+        return self._release(reservation_id, reference=reference)
+
+    def _release(self, reservation_id, due_at=None, reference=None):
+        """Release a reservation, only if it still expires at due_at when that is given"""
+        reservation = self._active.get(reservation_id)
+        if reservation is None:
+            return False
+        with self._part_lock(reservation.part_number):
+            with self._book_lock:
+                reservation = self._active.get(reservation_id)
+                # A reservation confirmed since it came due is kept
+                if reservation is None or (due_at is not None and reservation.expires_at != due_at):
+                    return False
+                if reference is not None and reservation.reference != reference:
+                    logger.warning("Reservation %s is held for %s, not %s; kept", reservation_id,
+                                   reservation.reference, reference)
+                    return False
+                del self._active[reservation_id]
+                held = reservation_id not in self._detached
+                self._detached.discard(reservation_id)
+            if held:
+                self.inventory.apply((reservation.part_number, hub, 0, -units)
+                                     for hub, units in reservation.allocations.items())
+            self._forget(reservation_id)
+        return True
+
+    def confirm(self, reservation_id, reference=None):
+        """Keep a reservation until it is released, e.g. once its quote is sent
+
+        With reference, only a reservation held for that reference is confirmed.
+        """
+        reservation = self._active.get(reservation_id)
+        if reservation is None:
+            return None
+        # Under the part lock, so a release racing the confirm cannot be undone by its record
+        with self._part_lock(reservation.part_number):
+            with self._book_lock:
+                reservation = self._active.get(reservation_id)
+                if reservation is None or (reference is not None and reservation.reference != reference):
+                    return None
+                reservation = self._active[reservation_id] = reservation._replace(expires_at=None)
+            if self.quote_store is not None:
+                self.quote_store.put_reservation(reservation)
+        return reservation
+
+    def expire(self, now=None):
+        """Release every reservation whose hold has run out; returns how many were released"""
+        now = self.clock() if now is None else now
+        due = []
+        with self._book_lock:
+            while self._expiries and self._expiries[0][0] <= now:
+                expires_at, reservation_id = heapq.heappop(self._expiries)
+                reservation = self._active.get(reservation_id)
+                # Confirmed reservations keep their heap entry but no longer expire
+                if reservation is not None and reservation.expires_at == expires_at:
+                    due.append((reservation_id, expires_at))
+        released = sum(self._release(reservation_id, expires_at) for reservation_id, expires_at in due)
+        if released:
+            logger.info("Expired %d stock reservations", released)
+        return released
+
+    def reset(self, inventory):
+        """Move every hold onto a reloaded inventory, shrinking those its stock no longer covers
+
+        Holds on parts the reloaded inventory does not list are kept unheld, not dropped.
+        """
+        self.expire()
+        with self._book_lock:
+            held = list(self._active.values())
+            self.inventory = inventory
+            self._active.clear()
+            self._expiries.clear()
+            self._detached.clear()
+        self._restore(held)
+        if held:
+            logger.info("Inventory reloaded, %d of %d stock reservations held again", len(self._active), len(held))
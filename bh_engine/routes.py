@@ -0,0 +1,170 @@
+"""
+Hub -> airport great-circle distances and transit times
+
+RouteMatrix precomputes, for every inventory hub and every airport AOG
+cases come from, the great-circle distance, an estimated door-to-door
+transit time and the freight cost, so choosing where to ship a part from is
+one masked argmin over the hubs holding enough stock, for one case or a
+whole batch.
+"""
+
+import re
+
+import numpy as np
+
+from .inventory import HUBS
+
+# Inventory hub -> the airport it ships from
+HUB_AIRPORTS = {
+    "London": "LHR",
+    "Frankfurt": "FRA",
+    "Dubai": "DXB",
+    "Singapore": "SIN",
+    "New York": "JFK",
+    "Hong Kong": "HKG",
+}
+
+# (latitude, longitude) of the hub airports and every airport AOG cases and emails come from
+AIRPORT_COORDS = {
+    "LHR": (51.4700, -0.4543),
+    "LGW": (51.1537, -0.1821),
+    "STN": (51.8860, 0.2389),
+    "DUB": (53.4213, -6.2701),
+    "FRA": (50.0379, 8.5622),
+    "MUC": (48.3537, 11.7751),
+    "CDG": (49.0097, 2.5479),
+    "AMS": (52.3105, 4.7683),
+    "BRU": (50.9010, 4.4844),
+    "MAD": (40.4839, -3.5680),
+    "BCN": (41.2974, 2.0833),
+    "FCO": (41.8003, 12.2389),
+    "ZRH": (47.4647, 8.5492),
+    "VIE": (48.1103, 16.5697),
+    "PRG": (50.1008, 14.2600),
+    "BUD": (47.4398, 19.2618),
+    "WAW": (52.1657, 20.9671),
+    "ATH": (37.9364, 23.9445),
+    "CPH": (55.6180, 12.6508),
+    "OSL": (60.1976, 11.1004),
+    "ARN": (59.6498, 17.9238),
+    "HEL": (60.3172, 24.9633),
+    "DXB": (25.2532, 55.3657),
+    "DOH": (25.2731, 51.6081),
+    "JNB": (-26.1367, 28.2411),
+    "LOS": (6.5774, 3.3212),
+    "SIN": (1.3644, 103.9915),
+    "HKG": (22.3080, 113.9185),
+    "NRT": (35.7720, 140.3929),
+    "ICN": (37.4602, 126.4407),
+    "SYD": (-33.9399, 151.1753),
+    "JFK": (40.6413, -73.7781),
+    "MIA": (25.7959, -80.2870),
+    "LAX": (33.9416, -118.4085),
+    "YYZ": (43.6777, -79.6248),
+    "YVR": (49.1967, -123.1815),
+    "MEX": (19.4361, -99.0719),
+    "GRU": (-23.4356, -46.4731),
+    "GIG": (-22.8090, -43.2506),
+}
+
+EARTH_RADIUS_KM = 6371.0
+# Block speed of a next-flight-out shipment, climb and descent included
+CRUISE_SPEED_KMH = 800.0
+# Pick, pack, export and import handling at both ends
+HANDLING_HOURS = 3.0
+# Courier freight cost per great-circle kilometre for one AOG shipment
+FREIGHT_GBP_PER_KM = 0.9
+
+ETA = "eta"
+COST = "cost"
+
+_IATA = re.compile(r"\(([A-Z]{3})\)|^([A-Z]{3})$")
+
+
+def airport_code(location):
+    """'London Heathrow (LHR)' or 'LHR' -> 'LHR'; None when there is no code"""
+    match = _IATA.search(str(location or "").strip())
+    return (match[1] or match[2]) if match else None
+
+
+def great_circle_km(lat1, lon1, lat2, lon2):
+    """Haversine distance in km; arguments broadcast like numpy arrays"""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(value, dtype=np.float64)) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+class RouteMatrix:
+    """Distance, transit hours and freight cost shaped hubs x airports"""
+
+    def __init__(self, hubs, hub_coords, airports, airport_coords):
+        self.hubs = tuple(hubs)
+        self.airports = list(airports)
+        self.airport_index = {airport: col for col, airport in enumerate(self.airports)}
+        hub_coords = np.asarray(hub_coords, dtype=np.float64).reshape(-1, 2)
+        airport_coords = np.asarray(airport_coords, dtype=np.float64).reshape(-1, 2)
+        distance = great_circle_km(hub_coords[:, :1], hub_coords[:, 1:], airport_coords[:, 0], airport_coords[:, 1])
+        # Hubs without coordinates can still ship, but are never the closest
+        self.distance_km = np.where(np.isnan(distance), np.inf, distance).astype(np.float32)
+        self.transit_hours = (HANDLING_HOURS + self.distance_km / CRUISE_SPEED_KMH).astype(np.float32)
+        self.freight_cost = (self.distance_km * FREIGHT_GBP_PER_KM).astype(np.float32)
+
+    @classmethod
+    def for_hubs(cls, hubs=HUBS, airport_coords=None):
+        """Matrix for inventory hubs, in their order, against every known airport"""
+        airport_coords = airport_coords or AIRPORT_COORDS
+        hub_coords = [airport_coords.get(HUB_AIRPORTS.get(hub), (np.nan, np.nan)) for hub in hubs]
+        return cls(hubs, hub_coords, list(airport_coords), list(airport_coords.values()))
+
+    def airport_columns(self, locations):
+        """Column per location ('Dubai (DXB)' or 'DXB'), -1 where the airport is unknown"""
+        return np.array([self.airport_index.get(airport_code(location), -1) for location in locations],
+                        dtype=np.int64)
+
+    def select_hubs(self, airport_cols, available, quantities=1, objective=ETA, hub_costs=None):
+        """(hub column, transit hours) per line: the best hub holding the quantity
+
+        available is shaped lines x hubs. objective ETA picks the fastest hub;
+        COST picks the cheapest, adding hub_costs (lines x hubs, e.g. regional
+        part prices) to freight. Lines at an unknown airport take the hub with
+        the most stock, and their transit hours are NaN. The hub column is -1
+        where no hub holds the quantity.
+        """
+        airport_cols = np.asarray(airport_cols, dtype=np.int64)
+        available = np.asarray(available)
+        lines = np.arange(len(airport_cols))
+        quantities = np.broadcast_to(np.asarray(quantities), airport_cols.shape)
+        feasible = available >= quantities[:, None]
+        known = airport_cols >= 0
+        cols = np.where(known, airport_cols, 0)
+
+        transit = self.transit_hours.T[cols]
+        score = transit if objective == ETA else self.freight_cost.T[cols]
+        if objective == COST and hub_costs is not None:
+            score = score + hub_costs
+        if not known.all():
+            score = np.where(known[:, None], score, -available)
+        best = np.where(feasible, score, np.inf).argmin(axis=1)
+        shippable = feasible.any(axis=1)
+        hours = np.where(known & shippable, transit[lines, best], np.nan)
+        return np.where(shippable, best, -1), hours
+
+    def nearest_hubs(self, airport_cols):
+        """Closest hub column per airport column, -1 for unknown airports"""
+        airport_cols = np.asarray(airport_cols, dtype=np.int64)
+        nearest = self.distance_km.argmin(axis=0)
+        return np.where(airport_cols >= 0, nearest[np.where(airport_cols >= 0, airport_cols, 0)], -1)
+
+    def ranked_hubs(self, location):
+        """Hub names fastest first for a location's airport, in matrix order when it is unknown"""
+        col = self.airport_index.get(airport_code(location))
+        if col is None:
+            return list(self.hubs)
+        return [self.hubs[hub] for hub in np.argsort(self.transit_hours[:, col], kind="stable")]
+
+    def route(self, hub, location):
+        """(distance km, transit hours) from a hub to a location's airport, Nones when unknown"""
+        row, col = self.hubs.index(hub) if hub in self.hubs else None, self.airport_index.get(airport_code(location))
+        if row is None or col is None or not np.isfinite(self.distance_km[row, col]):
+            return None, None
+        return round(float(self.distance_km[row, col])), round(float(self.transit_hours[row, col]), 1)
@@ -0,0 +1,547 @@
+"""
+Compiled binary snapshot of the BH_Worldwide_Logistics data tree
+
+Every JSON file under the data directory is compiled into one file that is
+memory-mapped on load instead of parsed:
+
+    MAGIC | header length | JSON header | 64-byte aligned sections
+
+Lists of records are stored as typed columns (int64/float64/uint8 arrays,
+string columns as int32 codes into a string table), and
+inventory_locations.json is stored directly as the parts x hubs arrays of
+InventoryMatrix. The header keeps a manifest of every source file (size,
+mtime, sha256) so a stale snapshot is detected and rebuilt automatically.
+
+Build it ahead of deployment with:
+
+    python build_snapshot.py BH_Worldwide_Logistics
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+from .inventory import INVENTORY_LOCATIONS_FILE, InventoryMatrix
+
+MAGIC = b"BHSNAP\x00\x01"
+SNAPSHOT_NAME = ".bh_snapshot.bin"
+ALIGN = 64
+
+# Column value markers: present, JSON null, key absent from the record
+_PRESENT, _NULL, _MISSING = 0, 1, 2
+_NULL_CODE, _MISSING_CODE = -1, -2
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+def snapshot_path_for(data_path):
+    """Default snapshot location inside the data directory"""
+    return Path(data_path) / SNAPSHOT_NAME
+
+
+def source_files(data_path):
+    """All JSON sources under the data directory, as sorted relative paths"""
+    data_path = Path(data_path)
+    return sorted(p.relative_to(data_path).as_posix() for p in data_path.rglob("*.json"))
+
+
+def file_sha256(path):
+    """Hex sha256 of a file, read in 1 MB blocks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(data_path, relpath, with_hash=True):
+    """Size, mtime and (optionally) content hash of one source file"""
+    path = Path(data_path) / relpath
+    stat = path.stat()
+    entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        entry["sha256"] = file_sha256(path)
+    return entry
+
+
+# --- string tables -----------------------------------------------------------
+
+class StringTable:
+    """Read-only table of strings stored as one NUL-separated UTF-8 blob"""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        start, end = int(self.offsets[i]), int(self.offsets[i + 1]) - 1
+        return bytes(self.blob[start:end]).decode("utf-8")
+
+    def tolist(self):
+        if len(self) == 0:
+            return []
+        return bytes(self.blob[:-1]).decode("utf-8").split("\0")
+
+
+def _encode_strings(values):
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(b) + 1 for b in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(b + b"\0" for b in encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+# --- columnar record tables --------------------------------------------------
+
+def _flatten(record, prefix, out):
+    """Flatten nested dicts into (path, leaf value) pairs"""
+    for key, value in record.items():
+        path = prefix + (key,)
+        if isinstance(value, dict) and value:
+            _flatten(value, path, out)
+        else:
+            out.append((path, value))
+
+
+def _column_kind(values):
+    kinds = set()
+    for value in values:
+        if value is None or value is MISSING:
+            continue
+        if isinstance(value, bool):
+            kinds.add("bool")
+        elif isinstance(value, int):
+            kinds.add("int" if -2**63 <= value < 2**63 else "json")
+        elif isinstance(value, float):
+            kinds.add("float")
+        elif isinstance(value, str):
+            # String tables are NUL-separated, so such values go through JSON
+            kinds.add("json" if "\0" in value else "str")
+        else:
+            kinds.add("json")
+    if not kinds:
+        return "str"
+    if len(kinds) == 1:
+        return kinds.pop()
+    if kinds == {"int", "float"}:
+        return "float"
+    return "json"
+
+
+def is_record_list(value):
+    """True for a non-empty list made only of dicts (or dict-like records)"""
+    return isinstance(value, list) and bool(value) and all(isinstance(v, Mapping) for v in value)
+
+
+class _Writer:
+    """Collects aligned sections and writes the snapshot file"""
+
+    def __init__(self):
+        self.sections = {}
+        self.buffers = []
+        self.size = 0
+
+    def add(self, name, array):
+        array = np.ascontiguousarray(array)
+        self.size += -self.size % ALIGN
+        self.sections[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": self.size,
+        }
+        self.buffers.append((self.size, array))
+        self.size += array.nbytes
+        return name
+
+    def add_strings(self, name, values):
+        blob, offsets = _encode_strings(values)
+        self.add(name + ".blob", blob)
+        self.add(name + ".offsets", offsets)
+        return name
+
+    def add_table(self, name, records):
+        rows = len(records)
+        columns = {}
+        for row, record in enumerate(records):
+            flat = []
+            _flatten(record, (), flat)
+            for path, value in flat:
+                column = columns.get(path)
+                if column is None:
+                    column = columns[path] = [MISSING] * rows
+                column[row] = value
+
+        specs = []
+        for i, (path, values) in enumerate(columns.items()):
+            kind = _column_kind(values)
+            section = f"{name}.c{i}"
+            spec = {
+                "path": list(path),
+                "kind": kind,
+                "values": section,
+                "mask": None,
+                "missing": any(v is MISSING for v in values),
+            }
+            if kind in ("str", "json"):
+                lookup = {}
+                codes = np.empty(rows, dtype=np.int32)
+                for row, value in enumerate(values):
+                    if value is MISSING:
+                        codes[row] = _MISSING_CODE
+                    elif value is None:
+                        codes[row] = _NULL_CODE
+                    else:
+                        key = value if kind == "str" else json.dumps(value)
+                        codes[row] = lookup.setdefault(key, len(lookup))
+                self.add(section, codes)
+                spec["strings"] = self.add_strings(section + ".s", list(lookup))
+            else:
+                mask = np.array(
+                    [_MISSING if v is MISSING else _NULL if v is None else _PRESENT for v in values],
+                    dtype=np.uint8,
+                )
+                dtype = {"int": np.int64, "float": np.float64, "bool": np.uint8}[kind]
+                data = np.array([v if mask[row] == _PRESENT else 0 for row, v in enumerate(values)], dtype=dtype)
+                self.add(section, data)
+                if mask.any():
+                    spec["mask"] = self.add(section + ".mask", mask)
+                if kind == "float":
+                    int_mask = np.array([type(v) is int for v in values], dtype=np.uint8)
+                    if int_mask.any():
+                        spec["int_mask"] = self.add(section + ".int", int_mask)
+            specs.append(spec)
+        return {"rows": rows, "columns": specs}
+
+    def add_matrix(self, name, matrix):
+        self.add(name + ".stock", matrix.stock)
+        self.add(name + ".reserved", matrix.reserved)
+        self.add(name + ".incoming_qty", matrix.incoming_qty)
+        self.add(name + ".next_arrival_day", matrix.next_arrival_day)
+        self.add_strings(name + ".part_numbers", matrix.part_numbers)
+        return {"name": name, "hubs": list(matrix.hubs)}
+
+    def write(self, path, header):
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        data_start = len(MAGIC) + 8 + len(header_bytes)
+        data_start += -data_start % ALIGN
+
+        path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(prefix=path.name, suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(MAGIC)
+                f.write(len(header_bytes).to_bytes(8, "little"))
+                f.write(header_bytes)
+                f.write(b"\0" * (data_start - f.tell()))
+                for offset, array in self.buffers:
+                    f.write(b"\0" * (data_start + offset - f.tell()))
+                    f.write(array.tobytes())
+            os.chmod(tmp_name, 0o644)
+            # Readers keep their old mapping; new readers see the new file
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+
+def _encode_document(writer, name, data):
+    """Split a document into record tables and a small JSON skeleton"""
+    if is_record_list(data):
+        return {"table": writer.add_table(name, data)}
+    if isinstance(data, dict):
+        tables = {}
+        skeleton = {}
+        for i, (key, value) in enumerate(data.items()):
+            if is_record_list(value):
+                tables[key] = writer.add_table(f"{name}.t{i}", value)
+            else:
+                skeleton[key] = value
+        return {"tables": tables, "skeleton": skeleton, "keys": list(data)}
+    return {"skeleton": data}
+
+
+def _manifest_entry(data_path, relpath, size, mtime_ns):
+    """Manifest entry for a file read when it had this size and mtime
+
+    The content hash is only recorded if the file still has them after
+    hashing; otherwise it is left out, so the entry can never match the
+    file on disk and the snapshot reads as stale.
+    """
+    entry = {"size": size, "mtime_ns": mtime_ns, "sha256": None}
+    try:
+        if fingerprint(data_path, relpath, with_hash=False) == {"size": size, "mtime_ns": mtime_ns}:
+            sha256 = file_sha256(Path(data_path) / relpath)
+            if fingerprint(data_path, relpath, with_hash=False) == {"size": size, "mtime_ns": mtime_ns}:
+                entry["sha256"] = sha256
+    except OSError:
+        pass
+    return entry
+
+
+def compile_snapshot(data_path, snapshot_path=None, documents=None, matrix=None, fingerprints=None):
+    """Compile every JSON file under data_path into one binary snapshot
+
+    documents may pass already-parsed files (relative path -> data) and
+    matrix an already-built InventoryMatrix, so a loader that just parsed
+    the tree does not parse it twice. fingerprints gives the (size,
+    mtime_ns) each passed document was read at; the manifest records those,
+    not the file as it is now, so a file changed since it was parsed leaves
+    the snapshot stale. Documents passed without a fingerprint are re-read.
+    """
+    data_path = Path(data_path)
+    snapshot_path = Path(snapshot_path) if snapshot_path else snapshot_path_for(data_path)
+    fingerprints = fingerprints or {}
+    documents = {relpath: data for relpath, data in (documents or {}).items() if relpath in fingerprints}
+    if INVENTORY_LOCATIONS_FILE not in documents:
+        matrix = None
+
+    writer = _Writer()
+    manifest = {}
+    encoded = {}
+    for i, relpath in enumerate(source_files(data_path)):
+        if relpath in documents:
+            size, mtime_ns = fingerprints[relpath]
+        else:
+            # Taken before reading, like the loaders' fingerprints
+            try:
+                current = fingerprint(data_path, relpath, with_hash=False)
+            except OSError:
+                continue
+            size, mtime_ns = current["size"], current["mtime_ns"]
+        manifest[relpath] = _manifest_entry(data_path, relpath, size, mtime_ns)
+        if relpath not in documents:
+            try:
+                with open(data_path / relpath) as f:
+                    documents[relpath] = json.load(f)
+            except ValueError:
+                # Keep invalid files in the manifest so fixing them invalidates the snapshot
+                encoded[relpath] = {"invalid": True}
+                continue
+        if relpath == INVENTORY_LOCATIONS_FILE:
+            if matrix is None:
+                matrix = InventoryMatrix.from_records(documents[relpath])
+            encoded[relpath] = {"matrix": writer.add_matrix(f"d{i}", matrix)}
+        else:
+            encoded[relpath] = _encode_document(writer, f"d{i}", documents[relpath])
+
+    header = {
+        "version": 1,
+        "manifest": manifest,
+        "documents": encoded,
+        "sections": writer.sections,
+    }
+    writer.write(snapshot_path, header)
+    return snapshot_path
+
+
+# --- loading -----------------------------------------------------------------
+
+class Snapshot:
+    """Memory-mapped snapshot; arrays are read-only views into the file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a BH data snapshot")
+        header_len = int.from_bytes(self._mmap[len(MAGIC):len(MAGIC) + 8], "little")
+        header_start = len(MAGIC) + 8
+        self.header = json.loads(self._mmap[header_start:header_start + header_len])
+        self._data_start = header_start + header_len + (-(header_start + header_len) % ALIGN)
+        self.manifest = self.header["manifest"]
+
+    def array(self, name):
+        section = self.header["sections"][name]
+        dtype = np.dtype(section["dtype"])
+        count = int(np.prod(section["shape"], dtype=np.int64))
+        array = np.frombuffer(self._mmap, dtype=dtype, count=count,
+                              offset=self._data_start + section["offset"])
+        return array.reshape(section["shape"])
+
+    def strings(self, name):
+        return StringTable(self.array(name + ".blob"), self.array(name + ".offsets"))
+
+    def is_current(self, data_path, verify=False):
+        """True if no source file was added, removed or changed since compiling
+
+        Files whose size and mtime match are trusted unless verify is set;
+        files whose mtime moved are re-hashed, so a touch alone does not
+        invalidate the snapshot.
+        """
+        data_path = Path(data_path)
+        if source_files(data_path) != sorted(self.manifest):
+            return False
+        for relpath, expected in self.manifest.items():
+            try:
+                current = fingerprint(data_path, relpath, with_hash=False)
+            except OSError:
+                return False
+            unchanged = current["size"] == expected["size"] and current["mtime_ns"] == expected["mtime_ns"]
+            if unchanged and not verify:
+                continue
+            if current["size"] != expected["size"] or file_sha256(data_path / relpath) != expected["sha256"]:
+                return False
+        return True
+
+    def has_document(self, relpath):
+        entry = self.header["documents"].get(relpath)
+        return entry is not None and not entry.get("invalid")
+
+    def inventory_matrix(self, relpath=INVENTORY_LOCATIONS_FILE):
+        """InventoryMatrix backed directly by the mapped arrays"""
+        spec = self.header["documents"][relpath]["matrix"]
+        name = spec["name"]
+        return InventoryMatrix(
+            self.strings(name + ".part_numbers").tolist(),
+            spec["hubs"],
+            self.array(name + ".stock"),
+            self.array(name + ".reserved"),
+            self.array(name + ".incoming_qty"),
+            self.array(name + ".next_arrival_day"),
+        )
+
+    def document(self, relpath):
+        """Rebuild a document as plain Python data from its columns"""
+        entry = self.header["documents"].get(relpath)
+        if entry is None or entry.get("invalid"):
+            raise KeyError(relpath)
+        if "matrix" in entry:
+            raise KeyError(f"{relpath} is stored as an inventory matrix")
+        if "table" in entry:
+            return self._decode_table(entry["table"])
+        if "tables" in entry:
+            return {
+                key: self._decode_table(entry["tables"][key]) if key in entry["tables"] else entry["skeleton"][key]
+                for key in entry["keys"]
+            }
+        return entry["skeleton"]
+
+    def _column_values(self, spec):
+        kind = spec["kind"]
+        if kind in ("str", "json"):
+            lookup = self.strings(spec["strings"]).tolist()
+            if kind == "json":
+                # Decoded once per distinct value; rows share the resulting objects
+                lookup = [json.loads(v) for v in lookup]
+            # Negative codes index the trailing markers: -1 -> None, -2 -> MISSING
+            lookup.extend((MISSING, None))
+            return [lookup[code] for code in self.array(spec["values"]).tolist()]
+
+        values = self.array(spec["values"])
+        if kind == "bool":
+            values = values.astype(bool)
+        values = values.tolist()
+        if spec.get("int_mask"):
+            for row in np.flatnonzero(self.array(spec["int_mask"])).tolist():
+                values[row] = int(values[row])
+        if spec["mask"]:
+            mask = self.array(spec["mask"])
+            for row in np.flatnonzero(mask == _NULL).tolist():
+                values[row] = None
+            for row in np.flatnonzero(mask == _MISSING).tolist():
+                values[row] = MISSING
+        return values
+
+    def _decode_table(self, table):
+        rows = table["rows"]
+        tree = {}
+        for spec in table["columns"]:
+            node = tree
+            for key in spec["path"]:
+                node = node.setdefault(key, {"leaf": None, "children": {}})
+                last = node
+                node = node["children"]
+            last["leaf"] = spec
+        return _assemble(self, tree, rows, root=True)
+
+    def close(self):
+        self._mmap.close()
+
+
+def _assemble(snapshot, children, rows, root=False):
+    """Zip child columns back into one dict per row, dropping MISSING values
+
+    Returns the per-row values and whether any of them may be MISSING.
+    """
+    keys = list(children)
+    columns = []
+    flags = []
+    for key in keys:
+        node = children[key]
+        leaf = snapshot._column_values(node["leaf"]) if node["leaf"] else None
+        leaf_missing = node["leaf"]["missing"] if node["leaf"] else True
+        if node["children"]:
+            nested, nested_missing = _assemble(snapshot, node["children"], rows)
+            if leaf is not None:
+                nested = [n if l is MISSING else l for n, l in zip(nested, leaf)]
+            columns.append(nested)
+            flags.append(nested_missing and leaf_missing)
+        else:
+            columns.append(leaf)
+            flags.append(leaf_missing)
+
+    if not keys:
+        records = [{} for _ in range(rows)]
+    elif not any(flags):
+        records = [dict(zip(keys, values)) for values in zip(*columns)]
+    else:
+        records = [
+            {k: v for k, v in zip(keys, values) if v is not MISSING}
+            for values in zip(*columns)
+        ]
+    if root:
+        return records
+    if all(flags):
+        # A nested dict that is empty for a row did not exist in that record
+        return [r if r else MISSING for r in records], True
+    return records, False
+
+
+def open_snapshot(data_path, snapshot_path=None, verify=False):
+    """Open the snapshot for data_path, or None if it is missing, corrupt or stale"""
+    snapshot_path = Path(snapshot_path) if snapshot_path else snapshot_path_for(data_path)
+    if not snapshot_path.exists():
+        return None
+    try:
+        snapshot = Snapshot(snapshot_path)
+    except (OSError, ValueError, KeyError):
+        return None
+    if not snapshot.is_current(data_path, verify=verify):
+        snapshot.close()
+        return None
+    return snapshot
+
+
+def main(argv=None):
+    """Command-line entry point used by build_snapshot.py"""
+    argv = sys.argv[1:] if argv is None else argv
+    data_path = Path(argv[0] if argv else "BH_Worldwide_Logistics")
+    if not data_path.is_dir():
+        print(f"❌ Data directory not found: {data_path}")
+        return 1
+    path = compile_snapshot(data_path)
+    size = path.stat().st_size / 1024
+    print(f"✅ Compiled {len(source_files(data_path))} files into {path} ({size:.1f} KB)")
+    return 0
+
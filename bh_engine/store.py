@@ -0,0 +1,232 @@
+"""
+Process-wide, read-only data store shared by every dashboard session
+"""
+
+import datetime
+import itertools
+import logging
+import threading
+from pathlib import Path
+
+from .alternatives import AlternativePartsIndex
+from .cases import CaseAggregates
+from .datasets import DATASET_SOURCES, load_datasets, reload_datasets, write_snapshot
+from .inventory import InventoryState
+from .part_search import PartSearchIndex
+from .pricing import PRICING_FILE, PriceCache, PriceTable
+from .projection import PROJECTION_FILES
+from .reservations import ReservationEngine
+from .routes import RouteMatrix
+
+logger = logging.getLogger(__name__)
+
+# Monotonic across the process, so a new load never reuses a version number
+_versions = itertools.count(1)
+_versions_lock = threading.Lock()
+
+
+def next_version():
+    with _versions_lock:
+        return next(_versions)
+
+
+class DataStore:
+    """Immutable set of loaded datasets plus the indexes derived from them
+
+    One instance is shared by all browser sessions, so nothing may mutate
+    it after construction: per-session state belongs in st.session_state,
+    and a data refresh builds a new store with a new version.
+    """
+
+    def __init__(self, data_path, datasets, version=None):
+        self.data_path = Path(data_path)
+        self.version = version if version is not None else next_version()
+        self.loaded_at = datetime.datetime.now()
+        self.data_source = datasets.get("data_source", "json")
+        # Parsed source documents and their fingerprints, reused by incremental reloads
+        self.documents = datasets.get("documents", {})
+        self.fingerprints = datasets.get("fingerprints", {})
+        self.changed_files = datasets.get("changed_files", [])
+
+        for attribute, _, _ in DATASET_SOURCES:
+            setattr(self, attribute, datasets[attribute])
+        self.inventory_matrix = datasets["inventory_matrix"]
+
+        # Shared arrays must never be written in place by a session
+        for array in (self.inventory_matrix.stock, self.inventory_matrix.reserved,
+                      self.inventory_matrix.incoming_qty, self.inventory_matrix.next_arrival_day):
+            array.flags.writeable = False
+        # Hub -> airport distances and transit times, in the matrix's hub order
+        self.routes = RouteMatrix.for_hubs(self.inventory_matrix.hubs)
+
+        # Analytics counts over the cases, computed once per data version
+        self.case_aggregates = CaseAggregates.from_cases(self.active_cases.get("active_aog_cases", []))
+
+        # Join catalog, pricing and inventory into one record per part
+        self.parts_index = self._build_parts_index()
+        # Ranked full-text matching for cases without an exact part number hit
+        self.part_search = PartSearchIndex.from_catalog(self.parts_catalog)
+        # Same-category, same-aircraft substitutes, ranked by stock at lookup time
+        self.alternatives = AlternativePartsIndex.from_catalog(self.parts_catalog, self.part_search,
+                                                               self.inventory_matrix)
+        # The stock projection only needs recomputing when one of its files changes
+        self.projection_version = (tuple(self.fingerprints.get(relpath) for relpath in PROJECTION_FILES)
+                                   if self.fingerprints else self.version)
+
+        # Inputs to line-item pricing; the version only changes when parts_pricing.json does
+        customers = self.customers.get('major_airline_customers', []) if hasattr(self.customers, 'get') else []
+        self.customer_priority = {customer.get('name'): customer.get('priority_level') for customer in customers}
+        self.pricing_version = self.fingerprints.get(PRICING_FILE)
+        # Dense parts x hubs x tiers prices, so line items price with array lookups
+        self.price_table = PriceTable.from_records(self.parts_pricing)
+
+    @classmethod
+    def load(cls, data_path, use_snapshot=True):
+        """Load the data tree into a new store"""
+        return cls(data_path, load_datasets(data_path, use_snapshot=use_snapshot))
+
+    def _build_parts_index(self):
+        """Build a part_number-keyed index joining catalog, pricing and inventory records"""
+        parts_index = {}
+
+        def entry_for(part_number):
+            entry = parts_index.get(part_number)
+            if entry is None:
+                entry = parts_index[part_number] = {
+                    'part_number': part_number,
+                    'catalog': None,
+                    'pricing': None,
+                    'inventory_row': None
+                }
+            return entry
+
+        def join(records, field):
+            # Pricing may be missing or loaded as an empty dict fallback
+            if not isinstance(records, list):
+                return
+            for record in records:
+                part_number = record.get('part_number')
+                if not part_number:
+                    continue
+                entry = entry_for(part_number)
+                # Keep the first record per part, matching the old linear scans
+                if entry[field] is None:
+                    entry[field] = record
+
+        join(self.parts_catalog, 'catalog')
+        join(self.parts_pricing, 'pricing')
+
+        # Inventory is joined by its row in the parts x hubs matrix
+        for part_number, row in self.inventory_matrix.row_index.items():
+            entry_for(part_number)['inventory_row'] = row
+        return parts_index
+
+    def get_part_record(self, part_number):
+        """O(1) lookup of the joined catalog/pricing/inventory record for a part"""
+        if not part_number:
+            return None
+        return self.parts_index.get(part_number)
+
+
+class StoreManager:
+    """Owns the current DataStore and atomically swaps in reloaded ones
+
+    Readers take ``manager.current`` once and keep using that store, so a
+    reload finishing mid-render never mixes two data versions; the new
+    store only becomes visible after it is fully built. The manager also
+    owns the price cache, cleared whenever a reload changes the pricing,
+    and the live inventory state with the reservations held against it;
+    when a reload changes the inventory the state restarts from the file
+    and the reservations are held again on it. With a quote_store (see
+    ReservationEngine) reservations also survive restarts.
+    """
+
+    def __init__(self, data_path, use_snapshot=True, quote_store=None):
+        self.data_path = Path(data_path)
+        self.use_snapshot = use_snapshot
+        self.current = DataStore.load(self.data_path, use_snapshot=use_snapshot)
+        self.price_cache = PriceCache()
+        self.price_cache.invalidate(self.current.pricing_version)
+        self.inventory = InventoryState(self.current.inventory_matrix)
+        self.reservations = ReservationEngine(self.inventory, quote_store=quote_store)
+        self.last_error = None
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+        # At most one snapshot writer, always writing the newest load it has been given
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_due = None
+        self._snapshot_writer = None
+
+    def refresh(self):
+        """Reload changed files into a new store; returns True if the store was swapped"""
+        with self._reload_lock:
+            previous = self.current
+            try:
+                datasets = reload_datasets(self.data_path, previous)
+            except (OSError, ValueError) as e:
+                # Keep serving the last good store until the data is fixed
+                self.last_error = e
+                logger.warning("Data reload failed: %s", e)
+                return False
+            self.last_error = None
+            if datasets is None:
+                return False
+            self.current = DataStore(self.data_path, datasets)
+            if self.price_cache.invalidate(self.current.pricing_version):
+                logger.info("Pricing changed, cleared the price cache")
+            if self.current.inventory_matrix is not previous.inventory_matrix:
+                self.inventory = InventoryState(self.current.inventory_matrix)
+                self.reservations.reset(self.inventory)
+            logger.info("Reloaded %s as data version %s", ", ".join(datasets["changed_files"]),
+                        self.current.version)
+
+        if self.use_snapshot:
+            # Refresh the snapshot off the request path for the next cold start
+            self._queue_snapshot(datasets)
+        return True
+
+    def _queue_snapshot(self, datasets):
+        """Have the snapshot rewritten from datasets, replacing any load still waiting to be written"""
+        with self._snapshot_lock:
+            self._snapshot_due = datasets
+            if self._snapshot_writer is None:
+                self._snapshot_writer = threading.Thread(target=self._write_snapshots, name="bh-snapshot",
+                                                         daemon=True)
+                self._snapshot_writer.start()
+
+    def _write_snapshots(self):
+        while True:
+            with self._snapshot_lock:
+                datasets, self._snapshot_due = self._snapshot_due, None
+                if datasets is None:
+                    self._snapshot_writer = None
+                    return
+            try:
+                write_snapshot(self.data_path, datasets)
+            except Exception:
+                logger.exception("Snapshot write failed")
+
+    def watch(self, interval=5.0):
+        """Poll the data directory in a daemon thread, reloading whenever files change"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return self._watcher
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception("Data watcher failed")
+
+        self._stop.clear()
+        self._watcher = threading.Thread(target=run, name="bh-data-watcher", daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def stop(self):
+        """Stop the watcher thread"""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
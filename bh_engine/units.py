@@ -0,0 +1,98 @@
+"""
+Money and duration values parsed once from the display strings in the data
+
+Money is held as integer minor units (pence, cents) plus an ISO currency
+code, durations as integer minutes, so aggregates never re-parse strings.
+"""
+
+import re
+from decimal import ROUND_HALF_UP, Decimal
+from typing import NamedTuple
+
+CURRENCY_SYMBOLS = {"£": "GBP", "€": "EUR", "$": "USD"}
+SYMBOLS_BY_CURRENCY = {code: symbol for symbol, code in CURRENCY_SYMBOLS.items()}
+
+# Units of GBP per unit of each currency; cases and customers are quoted in
+# EUR, quotes and the pricing files in GBP
+FX_RATES_TO_GBP = {
+    "GBP": 1.0,
+    "EUR": 0.85,
+    "USD": 0.78,
+}
+
+_SCALES = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
+_MONEY = re.compile(r"^\s*([£€$]|[A-Z]{3})?\s*(-?[\d,]*\.?\d+)\s*([KMB]?)\s*$", re.IGNORECASE)
+
+MINUTES_PER_UNIT = {
+    "minute": 1,
+    "min": 1,
+    "hour": 60,
+    "hr": 60,
+    "day": 1440,
+    "week": 10080,
+}
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-z]+?)s?\s*$", re.IGNORECASE)
+
+
+class Money(NamedTuple):
+    """An amount in integer minor units of an ISO currency"""
+    minor: int
+    currency: str
+
+    @property
+    def major(self):
+        return self.minor / 100
+
+    def to(self, currency, rates=FX_RATES_TO_GBP):
+        """Convert to another currency through the FX table"""
+        if currency == self.currency:
+            return self
+        rate = rates[self.currency] / rates[currency]
+        return Money(round(self.minor * rate), currency)
+
+    def format(self, decimals=0):
+        symbol = SYMBOLS_BY_CURRENCY.get(self.currency, self.currency + " ")
+        return f"{symbol}{self.major:,.{decimals}f}"
+
+
+def parse_money(text, default_currency="GBP"):
+    """Parse '€147,987', '£1.2M' or 'EUR 45,000' into Money; None if unparseable"""
+    if isinstance(text, (int, float)) and not isinstance(text, bool):
+        return Money(round(text * 100), default_currency)
+    if not isinstance(text, str):
+        return None
+    match = _MONEY.match(text)
+    if not match:
+        return None
+    prefix, number, scale = match.groups()
+    currency = CURRENCY_SYMBOLS.get(prefix, prefix.upper() if prefix else default_currency)
+    # Decimal rather than float so '€8.5M' is exactly 850,000,000 cents
+    amount = Decimal(number.replace(",", "")) * _SCALES[scale.upper()] * 100
+    return Money(int(amount.to_integral_value(ROUND_HALF_UP)), currency)
+
+
+def parse_minutes(text):
+    """Parse '36 minutes', '7 hours' or '89 days' into integer minutes; None if unparseable"""
+    if isinstance(text, int) and not isinstance(text, bool):
+        return text
+    if not isinstance(text, str):
+        return None
+    match = _DURATION.match(text)
+    if not match:
+        return None
+    number, unit = match.groups()
+    factor = MINUTES_PER_UNIT.get(unit.lower())
+    if factor is None:
+        return None
+    return round(float(number) * factor)
+
+
+def parse_hours(text):
+    """Duration string as integer hours, rounding partial hours up"""
+    minutes = parse_minutes(text)
+    return None if minutes is None else -(-minutes // 60)
+
+
+def sum_money(amounts, currency="GBP", rates=FX_RATES_TO_GBP):
+    """Total of mixed-currency amounts in one currency, skipping None"""
+    return Money(sum(amount.to(currency, rates).minor for amount in amounts if amount is not None), currency)
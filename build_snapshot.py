@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+BH Worldwide Dashboard Data Snapshot Builder
+Compiles the BH_Worldwide_Logistics JSON tree into one memory-mapped snapshot
+so the dashboard starts without parsing JSON
+"""
+
+import sys
+
+from bh_engine.snapshot import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,686 @@
+"""
+🎯 Competitive Intelligence page
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+import datetime
+
+from bh_dashboard import get_dashboard, profiled_tabs
+
+
+def render(dashboard):
+    # Professional Header
+    st.markdown('<h1 class="main-header">🎯 Competitive Intelligence & Market Analysis Platform</h1>', unsafe_allow_html=True)
+    st.markdown("*Enterprise-grade competitive intelligence and strategic market analysis*")
+    
+    # Executive Intelligence Summary Cards
+    st.markdown("### 📊 Strategic Intelligence Overview")
+    intel_col1, intel_col2, intel_col3, intel_col4, intel_col5 = st.columns(5)
+    
+    with intel_col1:
+        st.metric("Market Position", "#2", "+1 rank improvement")
+    with intel_col2:
+        st.metric("Competitive Score", "8.4/10", "+1.7 vs last quarter")
+    with intel_col3:
+        st.metric("Threat Level", "Medium", "🟡 Monitoring required")
+    with intel_col4:
+        st.metric("Market Growth", "14.3%", "+2.1% acceleration")
+    with intel_col5:
+        st.metric("Win Rate", "74%", "+12% vs competitors")
+    
+    # Advanced Competitive Intelligence Tabs
+    intel_tab1, intel_tab2, intel_tab3, intel_tab4, intel_tab5 = profiled_tabs([
+        "🏢 Market Landscape", "🔍 Competitor Deep Dive", "📈 Market Intelligence", 
+        "🎯 Strategic Positioning", "🚨 Competitive Alerts"
+    ])
+    
+    with intel_tab1:
+        st.markdown("### 🏢 Market Landscape Dashboard")
+        
+        # Competitive positioning matrix
+        st.markdown("#### Competitive Positioning Matrix")
+        competitors_data = {
+            'Company': ['BH Worldwide', 'DHL Aviation', 'AAR Corp', 'Lufthansa Technik', 'StandardAero', 'HAECO', 'ST Engineering'],
+            'Market Share (%)': [18.5, 24.2, 15.8, 16.3, 12.1, 8.7, 4.4],
+            'Growth Rate (%)': [14.3, 8.7, 11.2, 6.9, 15.8, 12.4, 18.2],
+            'Service Quality': [8.7, 8.9, 7.8, 9.2, 8.1, 7.6, 7.3],
+            'Innovation Score': [9.1, 7.8, 7.2, 8.5, 7.9, 6.8, 8.8],
+            'Threat Level': ['Medium', 'High', 'Medium', 'High', 'Low', 'Low', 'Low']
+        }
+        comp_matrix_df = pd.DataFrame(competitors_data)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Bubble chart for competitive positioning
+            colors = {'High': 'red', 'Medium': 'orange', 'Low': 'green'}
+            color_map = [colors[threat] for threat in comp_matrix_df['Threat Level']]
+            
+            fig = px.scatter(
+                comp_matrix_df, 
+                x='Market Share (%)', 
+                y='Growth Rate (%)',
+                size='Service Quality',
+                color='Threat Level',
+                hover_data=['Innovation Score'],
+                title="Competitive Positioning Matrix",
+                color_discrete_map=colors
+            )
+            
+            for i, company in enumerate(comp_matrix_df['Company']):
+                fig.add_annotation(
+                    x=comp_matrix_df['Market Share (%)'][i],
+                    y=comp_matrix_df['Growth Rate (%)'][i],
+                    text=company,
+                    showarrow=False,
+                    yshift=10
+                )
+            
+            fig.update_layout(height=500)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            # Threat assessment radar
+            st.markdown("#### Competitive Threat Assessment")
+            
+            threat_metrics = ['Market Share', 'Innovation', 'Pricing', 'Service Quality', 'Global Reach', 'Financial Strength']
+            competitors_radar = {
+                'DHL Aviation': [9, 7, 8, 9, 9, 9],
+                'Lufthansa Technik': [8, 8, 7, 9, 8, 9],
+                'AAR Corp': [7, 7, 6, 7, 7, 8],
+                'BH Worldwide': [7, 9, 8, 8, 6, 7]
+            }
+            
+            fig = go.Figure()
+            
+            for competitor, values in competitors_radar.items():
+                fig.add_trace(go.Scatterpolar(
+                    r=values,
+                    theta=threat_metrics,
+                    fill='toself',
+                    name=competitor,
+                    opacity=0.6
+                ))
+            
+            fig.update_layout(
+                polar=dict(
+                    radialaxis=dict(
+                        visible=True,
+                        range=[0, 10]
+                    )),
+                showlegend=True,
+                title="Competitive Threat Analysis",
+                height=500
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Market trend indicators
+        st.markdown("#### Market Trend Indicators & Momentum Analysis")
+        
+        trend_col1, trend_col2, trend_col3 = st.columns(3)
+        
+        with trend_col1:
+            # Market momentum
+            momentum_data = {
+                'Metric': ['Digital Transformation', 'Sustainability Focus', 'AI Adoption', 'Supply Chain Resilience', 'Customer Experience'],
+                'Current Level': [7.2, 6.8, 8.1, 7.9, 8.3],
+                'Projected Growth': [15.2, 22.1, 28.5, 12.7, 18.9]
+            }
+            momentum_df = pd.DataFrame(momentum_data)
+            
+            fig = px.bar(
+                momentum_df, 
+                x='Projected Growth', 
+                y='Metric',
+                orientation='h',
+                title="Market Momentum Analysis (%)",
+                color='Projected Growth',
+                color_continuous_scale='viridis'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with trend_col2:
+            # Industry benchmarks
+            benchmark_data = {
+                'KPI': ['Response Time', 'Cost Efficiency', 'Service Quality', 'Innovation Index', 'Customer Satisfaction'],
+                'BH Worldwide': [8.7, 8.2, 8.7, 9.1, 8.9],
+                'Industry Average': [6.8, 7.1, 7.4, 6.9, 7.6],
+                'Best in Class': [9.2, 9.1, 9.4, 9.3, 9.5]
+            }
+            benchmark_df = pd.DataFrame(benchmark_data)
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatterpolar(r=benchmark_df['BH Worldwide'], theta=benchmark_df['KPI'], name='BH Worldwide', fill='toself'))
+            fig.add_trace(go.Scatterpolar(r=benchmark_df['Industry Average'], theta=benchmark_df['KPI'], name='Industry Average', fill='toself'))
+            fig.add_trace(go.Scatterpolar(r=benchmark_df['Best in Class'], theta=benchmark_df['KPI'], name='Best in Class', fill='toself'))
+            
+            fig.update_layout(
+                polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+                title="Industry Benchmark Comparison",
+                height=400
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with trend_col3:
+            # Market share evolution
+            years = ['2022', '2023', '2024', '2025E', '2026E']
+            market_evolution = {
+                'BH Worldwide': [15.2, 16.8, 18.5, 20.1, 22.3],
+                'DHL Aviation': [26.1, 25.3, 24.2, 23.1, 22.0],
+                'Lufthansa Technik': [17.8, 17.1, 16.3, 15.8, 15.2],
+                'Others': [40.9, 40.8, 41.0, 41.0, 40.5]
+            }
+            
+            fig = go.Figure()
+            for company, values in market_evolution.items():
+                fig.add_trace(go.Scatter(x=years, y=values, mode='lines+markers', name=company, stackgroup='one'))
+            
+            fig.update_layout(
+                title="Market Share Evolution",
+                xaxis_title="Year",
+                yaxis_title="Market Share (%)",
+                hovermode='x unified'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with intel_tab2:
+        st.markdown("### 🔍 Competitor Deep Dive Analysis")
+        
+        # Competitor selection
+        selected_competitor = st.selectbox(
+            "Select Competitor for Deep Analysis",
+            ['DHL Aviation', 'Lufthansa Technik', 'AAR Corp', 'StandardAero', 'HAECO', 'ST Engineering']
+        )
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # SWOT Analysis
+            st.markdown(f"#### SWOT Analysis - {selected_competitor}")
+            
+            if selected_competitor == 'DHL Aviation':
+                swot_data = {
+                    'Strengths': ['Market leader position', 'Global logistics network', 'Brand recognition', 'Financial resources'],
+                    'Weaknesses': ['High cost structure', 'Slow innovation', 'Limited AI adoption', 'Complex processes'],
+                    'Opportunities': ['Digital transformation', 'Emerging markets', 'Sustainability services', 'Strategic partnerships'],
+                    'Threats': ['New entrants', 'Technology disruption', 'Economic downturns', 'Regulatory changes']
+                }
+            else:
+                swot_data = {
+                    'Strengths': ['Technical expertise', 'Quality reputation', 'Strong partnerships', 'Regional presence'],
+                    'Weaknesses': ['Limited scale', 'Higher pricing', 'Slower response', 'Legacy systems'],
+                    'Opportunities': ['Technology adoption', 'Market expansion', 'Service diversification', 'Cost optimization'],
+                    'Threats': ['Competitive pressure', 'Market consolidation', 'Price wars', 'Customer switching']
+                }
+            
+            for category, items in swot_data.items():
+                st.markdown(f"**{category}:**")
+                for item in items:
+                    st.markdown(f"• {item}")
+                st.markdown("")
+        
+        with col2:
+            # Competitive pricing analysis
+            st.markdown("#### Competitive Pricing Analysis")
+            
+            pricing_data = {
+                'Service Type': ['Emergency AOG', 'Scheduled Maintenance', 'Parts Supply', 'Technical Support', 'Logistics'],
+                'BH Worldwide': [2650, 1280, 485, 190, 105],
+                selected_competitor: [2800, 1350, 520, 200, 110] if selected_competitor == 'DHL Aviation' else [2900, 1400, 540, 210, 115],
+                'Market Average': [2750, 1320, 500, 195, 108]
+            }
+            pricing_df = pd.DataFrame(pricing_data)
+            
+            fig = px.bar(
+                pricing_df.melt(id_vars=['Service Type'], var_name='Company', value_name='Price'),
+                x='Service Type',
+                y='Price',
+                color='Company',
+                barmode='group',
+                title="Pricing Comparison Analysis"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Service capability comparison
+        st.markdown("#### Service Capability Comparison Matrix")
+        
+        capabilities = ['Global Coverage', 'Response Time', 'Technical Expertise', 'Digital Tools', 'Cost Efficiency', 'Innovation']
+        capability_scores = {
+            'BH Worldwide': [7, 9, 8, 9, 8, 9],
+            'DHL Aviation': [9, 7, 8, 6, 6, 6],
+            'Lufthansa Technik': [8, 7, 9, 7, 7, 7],
+            'AAR Corp': [7, 6, 7, 6, 7, 6]
+        }
+        
+        capability_df = pd.DataFrame({
+            'Capability': capabilities * len(capability_scores),
+            'Company': [company for company in capability_scores.keys() for _ in capabilities],
+            'Score': [score for scores in capability_scores.values() for score in scores]
+        })
+        
+        fig = px.bar(
+            capability_df,
+            x='Capability',
+            y='Score',
+            color='Company',
+            barmode='group',
+            title="Service Capability Matrix"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Win/Loss analysis
+        st.markdown("#### Customer Win/Loss Analysis")
+        
+        winloss_col1, winloss_col2 = st.columns(2)
+        
+        with winloss_col1:
+            win_reasons = ['Superior Technology', 'Better Pricing', 'Faster Response', 'Service Quality', 'Innovation']
+            win_percentages = [35, 25, 20, 15, 5]
+            
+            fig = px.pie(
+                values=win_percentages,
+                names=win_reasons,
+                title="Reasons for Winning Against Competitors"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with winloss_col2:
+            loss_reasons = ['Price Sensitivity', 'Incumbent Advantage', 'Specification Mismatch', 'Geographic Limitations', 'Brand Preference']
+            loss_percentages = [40, 25, 15, 12, 8]
+            
+            fig = px.pie(
+                values=loss_percentages,
+                names=loss_reasons,
+                title="Reasons for Losing to Competitors"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    with intel_tab3:
+        st.markdown("### 📈 Market Intelligence Hub")
+        
+        # Industry growth projections
+        st.markdown("#### Industry Growth Projections & Market Size Analysis")
+        
+        growth_col1, growth_col2 = st.columns(2)
+        
+        with growth_col1:
+            # Market size projection
+            years = list(range(2022, 2031))
+            total_market = [18.2, 20.1, 22.8, 26.1, 29.8, 34.2, 39.1, 44.8, 51.2, 58.6]  # Billions USD
+            aog_segment = [2.1, 2.3, 2.8, 3.2, 3.8, 4.1, 4.6, 5.2, 5.8, 6.4]  # Billions USD
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=years, y=total_market, mode='lines+markers', name='Total Market', line=dict(width=3)))
+            fig.add_trace(go.Scatter(x=years, y=aog_segment, mode='lines+markers', name='AOG Segment', line=dict(width=3)))
+            
+            fig.update_layout(
+                title="Global Aviation MRO Market Size (USD Billions)",
+                xaxis_title="Year",
+                yaxis_title="Market Size (USD Billions)",
+                hovermode='x unified'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with growth_col2:
+            # Technology adoption curves
+            technologies = ['AI/ML', 'IoT Sensors', 'Blockchain', 'AR/VR', 'Predictive Analytics', 'Digital Twins']
+            adoption_2024 = [35, 48, 12, 28, 52, 31]
+            adoption_2027 = [78, 85, 45, 67, 89, 71]
+            
+            tech_df = pd.DataFrame({
+                'Technology': technologies,
+                '2024 Adoption (%)': adoption_2024,
+                '2027 Projected (%)': adoption_2027
+            })
+            
+            fig = px.bar(
+                tech_df.melt(id_vars=['Technology'], var_name='Period', value_name='Adoption Rate'),
+                x='Technology',
+                y='Adoption Rate',
+                color='Period',
+                barmode='group',
+                title="Technology Adoption Curves"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Regulatory environment analysis
+        st.markdown("#### Regulatory Environment Impact Analysis")
+        
+        reg_col1, reg_col2 = st.columns(2)
+        
+        with reg_col1:
+            regulatory_impacts = {
+                'Regulation': ['EASA Part 145', 'FAA Part 145', 'IATA Standards', 'Environmental Regulations', 'Safety Protocols'],
+                'Compliance Cost (M£)': [2.1, 1.8, 0.9, 3.2, 1.5],
+                'Business Impact': ['Medium', 'Medium', 'Low', 'High', 'Medium'],
+                'Timeline': ['2024', '2025', '2024', '2026', '2025']
+            }
+            reg_df = pd.DataFrame(regulatory_impacts)
+            
+            fig = px.bar(
+                reg_df,
+                x='Regulation',
+                y='Compliance Cost (M£)',
+                color='Business Impact',
+                title="Regulatory Compliance Cost Analysis"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with reg_col2:
+            # Customer switching behavior
+            switch_reasons = ['Better Service', 'Lower Cost', 'Technology', 'Relationship Issues', 'Geographic Coverage']
+            switch_frequency = [28, 35, 18, 12, 7]
+            
+            fig = px.pie(
+                values=switch_frequency,
+                names=switch_reasons,
+                title="Customer Switching Behavior Patterns"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Market sentiment analysis
+        st.markdown("#### Market Sentiment & Customer Insights")
+        
+        sentiment_data = {
+            'Metric': ['Service Quality', 'Innovation Leadership', 'Cost Competitiveness', 'Reliability', 'Customer Support'],
+            'Q1 2024': [7.2, 8.1, 6.8, 8.5, 7.9],
+            'Q2 2024': [7.5, 8.3, 7.1, 8.7, 8.2],
+            'Q3 2024': [7.8, 8.6, 7.4, 8.9, 8.5],
+            'Q4 2024': [8.1, 8.9, 7.7, 9.1, 8.8]
+        }
+        sentiment_df = pd.DataFrame(sentiment_data)
+        
+        fig = px.line(
+            sentiment_df.melt(id_vars=['Metric'], var_name='Quarter', value_name='Score'),
+            x='Quarter',
+            y='Score',
+            color='Metric',
+            title="Market Sentiment Evolution (Customer Satisfaction Scores)",
+            markers=True
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with intel_tab4:
+        st.markdown("### 🎯 Strategic Positioning Intelligence")
+        
+        # Blue Ocean strategy opportunities
+        st.markdown("#### Blue Ocean Strategy Opportunities")
+        
+        blue_ocean_col1, blue_ocean_col2 = st.columns(2)
+        
+        with blue_ocean_col1:
+            # Strategy canvas
+            factors = ['Price', 'Response Time', 'Technology', 'Global Coverage', 'Sustainability', 'AI Integration', 'Customer Experience']
+            industry_avg = [5, 5, 5, 5, 3, 2, 5]
+            bh_current = [7, 9, 8, 6, 6, 9, 8]
+            bh_future = [8, 9, 9, 8, 9, 10, 9]
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatterpolar(r=industry_avg, theta=factors, name='Industry Average', fill='toself'))
+            fig.add_trace(go.Scatterpolar(r=bh_current, theta=factors, name='BH Current', fill='toself'))
+            fig.add_trace(go.Scatterpolar(r=bh_future, theta=factors, name='BH Future Strategy', fill='toself'))
+            
+            fig.update_layout(
+                polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+                title="Strategic Canvas - Blue Ocean Analysis"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with blue_ocean_col2:
+            # Market gap analysis
+            st.markdown("#### Market Gap Analysis")
+            
+            gaps_data = {
+                'Gap Area': ['Predictive Maintenance', 'Sustainable Solutions', 'Real-time Collaboration', 'AI-Driven Optimization', 'Digital Twins'],
+                'Market Need (1-10)': [9, 8, 7, 9, 8],
+                'Current Supply (1-10)': [4, 3, 5, 3, 2],
+                'Opportunity Size (M£)': [145, 89, 67, 178, 123]
+            }
+            gaps_df = pd.DataFrame(gaps_data)
+            
+            fig = px.scatter(
+                gaps_df,
+                x='Current Supply (1-10)',
+                y='Market Need (1-10)',
+                size='Opportunity Size (M£)',
+                hover_data=['Gap Area'],
+                title="Market Gap Opportunity Matrix"
+            )
+            
+            # Add quadrant lines
+            fig.add_hline(y=6.5, line_dash="dash", line_color="gray")
+            fig.add_vline(x=6.5, line_dash="dash", line_color="gray")
+            
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Competitive advantage analysis
+        st.markdown("#### Competitive Advantage Analysis & Recommendations")
+        
+        advantage_col1, advantage_col2 = st.columns(2)
+        
+        with advantage_col1:
+            # Porter's Five Forces
+            forces_data = {
+                'Force': ['Threat of New Entrants', 'Bargaining Power of Suppliers', 'Bargaining Power of Buyers', 'Threat of Substitutes', 'Competitive Rivalry'],
+                'Current Level': [3, 4, 6, 2, 8],
+                'Projected Level': [4, 5, 7, 3, 9]
+            }
+            forces_df = pd.DataFrame(forces_data)
+            
+            fig = px.bar(
+                forces_df.melt(id_vars=['Force'], var_name='Period', value_name='Intensity'),
+                x='Force',
+                y='Intensity',
+                color='Period',
+                barmode='group',
+                title="Porter's Five Forces Analysis"
+            )
+            fig.update_layout(xaxis_tickangle=45)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with advantage_col2:
+            # Strategic moves simulation
+            st.markdown("#### Strategic Moves Simulation")
+            
+            moves = ['AI Investment', 'Geographic Expansion', 'Partnership Strategy', 'Service Innovation', 'Cost Leadership']
+            impact_scores = [8.5, 7.2, 6.8, 9.1, 5.9]
+            risk_scores = [4.2, 6.8, 3.1, 5.5, 7.2]
+            
+            fig = px.scatter(
+                x=risk_scores,
+                y=impact_scores,
+                text=moves,
+                title="Strategic Options: Impact vs Risk"
+            )
+            fig.update_traces(textposition="top center")
+            fig.update_layout(
+                xaxis_title="Risk Level",
+                yaxis_title="Impact Potential",
+                height=400
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Strategic recommendations
+        st.markdown("#### Strategic Recommendations")
+        
+        recommendations = [
+            {
+                'Priority': 'High',
+                'Initiative': 'AI-Powered Predictive Maintenance Platform',
+                'Investment': '£12M',
+                'Timeline': '18 months',
+                'Expected ROI': '340%',
+                'Strategic Value': 'Market differentiation and competitive moat'
+            },
+            {
+                'Priority': 'High',
+                'Initiative': 'Sustainability-First Service Portfolio',
+                'Investment': '£8M',
+                'Timeline': '12 months',
+                'Expected ROI': '225%',
+                'Strategic Value': 'First-mover advantage in green aviation'
+            },
+            {
+                'Priority': 'Medium',
+                'Initiative': 'Asia-Pacific Market Expansion',
+                'Investment': '£15M',
+                'Timeline': '24 months',
+                'Expected ROI': '180%',
+                'Strategic Value': 'Geographic diversification and growth'
+            }
+        ]
+        
+        rec_df = pd.DataFrame(recommendations)
+        
+        # Display recommendations as cards
+        for _, rec in rec_df.iterrows():
+            with st.container():
+                st.markdown(f"""
+                <div class="quote-card">
+                    <h4>🎯 {rec['Initiative']} ({rec['Priority']} Priority)</h4>
+                    <p><strong>Investment:</strong> {rec['Investment']} | <strong>Timeline:</strong> {rec['Timeline']} | <strong>ROI:</strong> {rec['Expected ROI']}</p>
+                    <p><strong>Strategic Value:</strong> {rec['Strategic Value']}</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    with intel_tab5:
+        st.markdown("### 🚨 Competitive Alerts & Monitoring")
+        
+        # Real-time alerts dashboard
+        st.markdown("#### Real-time Competitive Alerts")
+        
+        alerts_col1, alerts_col2 = st.columns(2)
+        
+        with alerts_col1:
+            # Critical alerts
+            st.markdown("##### 🔴 Critical Alerts")
+            
+            critical_alerts = [
+                "DHL Aviation announced AI partnership with Google Cloud",
+                "Lufthansa Technik reducing prices by 15% in European market",
+                "New entrant 'SkyMRO' securing major airline contracts"
+            ]
+            
+            for alert in critical_alerts:
+                st.markdown(f"""
+                <div class="alert-critical">
+                    <strong>⚠️ CRITICAL:</strong> {alert}
+                    <br><small>📅 {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}</small>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with alerts_col2:
+            # Medium priority alerts
+            st.markdown("##### 🟡 Medium Priority Alerts")
+            
+            medium_alerts = [
+                "AAR Corp expanding Middle East operations",
+                "Industry average response time improved by 8%",
+                "New regulatory requirements published by EASA"
+            ]
+            
+            for alert in medium_alerts:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #fdcb6e 0%, #e17055 100%); padding: 1rem; border-radius: 10px; color: white; margin: 1rem 0;">
+                    <strong>📊 MONITOR:</strong> {alert}
+                    <br><small>📅 {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}</small>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Market entry threat assessment
+        st.markdown("#### Market Entry Threat Assessment")
+        
+        threat_col1, threat_col2 = st.columns(2)
+        
+        with threat_col1:
+            # Threat matrix
+            threats_data = {
+                'Company': ['Amazon Logistics', 'Tesla Services', 'SpaceX', 'Chinese MRO Providers', 'Tech Startups'],
+                'Entry Probability (%)': [25, 15, 35, 60, 45],
+                'Potential Impact': [8, 6, 7, 9, 6],
+                'Timeline': ['3-5 years', '5+ years', '2-3 years', '1-2 years', '2-4 years']
+            }
+            threats_df = pd.DataFrame(threats_data)
+            
+            fig = px.scatter(
+                threats_df,
+                x='Entry Probability (%)',
+                y='Potential Impact',
+                text='Company',
+                title="Market Entry Threat Matrix",
+                size=[50]*len(threats_df)
+            )
+            fig.update_traces(textposition="top center")
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with threat_col2:
+            # Pricing pressure indicators
+            pricing_pressure = {
+                'Region': ['North America', 'Europe', 'Asia-Pacific', 'Middle East', 'Latin America'],
+                'Pressure Level': [6, 7, 8, 5, 6],
+                'Trend': ['Stable', 'Increasing', 'High', 'Stable', 'Increasing']
+            }
+            pressure_df = pd.DataFrame(pricing_pressure)
+            
+            colors = {'Stable': 'green', 'Increasing': 'orange', 'High': 'red'}
+            color_map = [colors[trend] for trend in pressure_df['Trend']]
+            
+            fig = px.bar(
+                pressure_df,
+                x='Region',
+                y='Pressure Level',
+                color='Trend',
+                title="Regional Pricing Pressure Indicators",
+                color_discrete_map=colors
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Customer satisfaction benchmarking
+        st.markdown("#### Customer Satisfaction Benchmarking")
+        
+        satisfaction_data = {
+            'Metric': ['Overall Satisfaction', 'Service Quality', 'Response Time', 'Cost Value', 'Innovation', 'Support Quality'],
+            'BH Worldwide': [8.7, 8.9, 9.2, 8.1, 9.0, 8.8],
+            'DHL Aviation': [8.2, 8.5, 7.8, 7.9, 7.2, 8.1],
+            'Lufthansa Technik': [8.8, 9.1, 8.1, 7.5, 7.8, 8.9],
+            'Industry Average': [7.8, 8.0, 7.5, 7.6, 6.9, 7.7]
+        }
+        
+        satisfaction_df = pd.DataFrame(satisfaction_data)
+        
+        fig = go.Figure()
+        for column in satisfaction_df.columns[1:]:
+            fig.add_trace(go.Scatterpolar(
+                r=satisfaction_df[column],
+                theta=satisfaction_df['Metric'],
+                fill='toself',
+                name=column,
+                opacity=0.7
+            ))
+        
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True, range=[0, 10])),
+            title="Customer Satisfaction Benchmarking",
+            height=500
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Competitive activity tracking
+        st.markdown("#### Recent Competitive Activity")
+        
+        activity_data = {
+            'Date': ['2024-12-10', '2024-12-08', '2024-12-05', '2024-12-03', '2024-12-01'],
+            'Competitor': ['DHL Aviation', 'Lufthansa Technik', 'AAR Corp', 'StandardAero', 'HAECO'],
+            'Activity': ['New AI partnership', 'Price reduction announcement', 'Service expansion', 'Technology upgrade', 'Market entry'],
+            'Impact Level': ['High', 'Medium', 'Medium', 'Low', 'Medium'],
+            'Our Response': ['Monitor closely', 'Price analysis', 'Counter-expansion', 'Assess technology', 'Competitive response']
+        }
+        
+        activity_df = pd.DataFrame(activity_data)
+        st.dataframe(activity_df, use_container_width=True)
+
+
+render(get_dashboard())
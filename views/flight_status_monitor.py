@@ -0,0 +1,352 @@
+"""
+✈️ Flight Status Monitor page
+"""
+
+import streamlit as st
+import pandas as pd
+
+from bh_dashboard import get_dashboard
+from bh_engine.profiler import section
+
+
+def render(dashboard):
+    st.markdown('<h1 class="main-header">🛩️ United Airlines Operations Control Center</h1>', unsafe_allow_html=True)
+    st.markdown("*AI-Powered Airline Operations Intelligence - Real-time Decision Support for Flight Operations*")
+    
+    # Executive Operations Dashboard
+    st.markdown("### 🎯 Operations Command Center")
+    ops_col1, ops_col2, ops_col3, ops_col4, ops_col5 = st.columns(5)
+    
+    with ops_col1:
+        st.metric("Active Flights", "847", "+23 vs yesterday")
+    with ops_col2:
+        st.metric("On-Time Performance", "87.4%", "+2.1% vs avg")
+    with ops_col3:
+        st.metric("Aircraft Utilization", "11.2 hrs", "+0.8 hrs")
+    with ops_col4:
+        st.metric("Revenue at Risk", "$2.8M", "-$450K vs forecast")
+    with ops_col5:
+        st.metric("Operations Score", "94.2", "+1.8 pts")
+    
+    # === 1. PREDICTIVE FLIGHT ANALYTICS ===
+    section("Predictive Flight Analytics")
+    st.markdown("---")
+    st.markdown("## 🔮 Predictive Flight Analytics")
+    
+    predict_col1, predict_col2 = st.columns([1, 1])
+    
+    with predict_col1:
+        st.markdown("### ⚠️ Delay Risk Predictions")
+        
+        delay_predictions = [
+            {"flight": "UA1247", "route": "ORD-LAX", "delay_risk": 87, "primary_factor": "Weather - Thunderstorms", "estimated_delay": "45-60 min", "confidence": 94},
+            {"flight": "UA892", "route": "SFO-NRT", "delay_risk": 72, "primary_factor": "Aircraft Maintenance", "estimated_delay": "25-40 min", "confidence": 89},
+            {"flight": "UA156", "route": "EWR-LHR", "delay_risk": 68, "primary_factor": "ATC Flow Control", "estimated_delay": "20-35 min", "confidence": 91},
+            {"flight": "UA2134", "route": "DEN-MIA", "delay_risk": 45, "primary_factor": "Crew Scheduling", "estimated_delay": "10-20 min", "confidence": 86},
+            {"flight": "UA567", "route": "IAH-FRA", "delay_risk": 38, "primary_factor": "Ground Traffic", "estimated_delay": "5-15 min", "confidence": 82}
+        ]
+        
+        for pred in delay_predictions:
+            risk_color = "#ff4444" if pred['delay_risk'] > 70 else "#ff8800" if pred['delay_risk'] > 50 else "#44ff44"
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, {risk_color}20 0%, {risk_color}10 100%); padding: 15px; border-radius: 10px; margin: 10px 0; border-left: 4px solid {risk_color};">
+                <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 10px;">
+                    <div><strong>{pred['flight']}</strong><br><small>{pred['route']}</small></div>
+                    <div><strong>{pred['delay_risk']}% Risk</strong><br><small>{pred['estimated_delay']}</small></div>
+                    <div><strong>{pred['primary_factor']}</strong><br><small>{pred['confidence']}% confidence</small></div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with predict_col2:
+        st.markdown("### 🌩️ Weather Impact Analysis")
+        
+        weather_data = {
+            "Hub": ["ORD Chicago", "DEN Denver", "SFO San Francisco", "EWR Newark", "IAH Houston"],
+            "Current Conditions": ["Thunderstorms", "Clear", "Fog", "Rain", "Clear"],
+            "Delay Impact": ["High", "None", "Medium", "Low", "None"],
+            "Affected Flights": [47, 0, 23, 12, 0],
+            "Avg Delay": ["42 min", "0 min", "18 min", "8 min", "0 min"]
+        }
+        
+        weather_df = pd.DataFrame(weather_data)
+        st.dataframe(weather_df, use_container_width=True)
+        
+        st.markdown("### 📊 Cancellation Risk Matrix")
+        
+        cancel_risk_data = {
+            "Risk Level": ["High Risk", "Medium Risk", "Low Risk", "Minimal Risk"],
+            "Flight Count": [8, 23, 67, 749],
+            "Probability": ["85-95%", "45-65%", "15-25%", "<5%"],
+            "Action Required": ["Immediate", "Monitor", "Standby", "Normal"]
+        }
+        
+        cancel_df = pd.DataFrame(cancel_risk_data)
+        st.dataframe(cancel_df, use_container_width=True)
+    
+    # === 2. AIRCRAFT HEALTH MONITORING ===
+    section("Aircraft Health Monitoring")
+    st.markdown("---")
+    st.markdown("## 🔧 Aircraft Health Monitoring")
+    
+    health_col1, health_col2 = st.columns([1, 1])
+    
+    with health_col1:
+        st.markdown("### 🚨 Critical Aircraft Alerts")
+        
+        aircraft_alerts = [
+            {"aircraft": "N12345 (B777-200)", "alert": "Engine Oil Pressure Low", "severity": "Critical", "eta_maintenance": "2.5 hrs", "affected_flights": 3},
+            {"aircraft": "N67890 (A320-200)", "alert": "Hydraulic System Warning", "severity": "High", "eta_maintenance": "4.2 hrs", "affected_flights": 2},
+            {"aircraft": "N24681 (B737-800)", "alert": "APU Performance Degraded", "severity": "Medium", "eta_maintenance": "Next C-Check", "affected_flights": 0},
+            {"aircraft": "N13579 (A350-900)", "alert": "Cabin Pressure Sensor", "severity": "Low", "eta_maintenance": "Tonight", "affected_flights": 0}
+        ]
+        
+        for alert in aircraft_alerts:
+            severity_color = "#ff0000" if alert['severity'] == 'Critical' else "#ff8800" if alert['severity'] == 'High' else "#ffaa00" if alert['severity'] == 'Medium' else "#44aa44"
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, {severity_color}15 0%, {severity_color}05 100%); padding: 15px; border-radius: 10px; margin: 8px 0; border-left: 4px solid {severity_color};">
+                <h4 style="margin: 0; color: {severity_color};">{alert['aircraft']}</h4>
+                <p style="margin: 5px 0;"><strong>{alert['alert']}</strong> - {alert['severity']}</p>
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; font-size: 14px;">
+                    <div>Maintenance ETA: {alert['eta_maintenance']}</div>
+                    <div>Affected Flights: {alert['affected_flights']}</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with health_col2:
+        st.markdown("### 📈 Fleet Health Overview")
+        
+        fleet_health = {
+            "Aircraft Type": ["Boeing 777", "Airbus A320", "Boeing 737", "Airbus A350", "Boeing 787"],
+            "Fleet Size": [67, 142, 89, 34, 45],
+            "Available": [64, 138, 86, 33, 44],
+            "Maintenance": [2, 3, 2, 1, 1],
+            "AOG": [1, 1, 1, 0, 0],
+            "Health Score": [94.2, 96.8, 93.5, 97.1, 95.6]
+        }
+        
+        fleet_df = pd.DataFrame(fleet_health)
+        st.dataframe(fleet_df, use_container_width=True)
+        
+        st.markdown("### ⚡ Maintenance Predictions")
+        
+        maint_pred = {
+            "Aircraft": ["N45678", "N78901", "N23456", "N89012"],
+            "Next Check": ["A-Check", "C-Check", "B-Check", "A-Check"],
+            "Days Until Due": [12, 28, 7, 19],
+            "Probability Early": ["23%", "67%", "8%", "34%"],
+            "Recommended Action": ["Schedule", "Plan Early", "Monitor", "Schedule"]
+        }
+        
+        maint_df = pd.DataFrame(maint_pred)
+        st.dataframe(maint_df, use_container_width=True)
+    
+    # === 3. ROUTE INTELLIGENCE ===
+    section("Route Intelligence")
+    st.markdown("---")
+    st.markdown("## 🗺️ Route Intelligence & Optimization")
+    
+    route_col1, route_col2 = st.columns([1, 1])
+    
+    with route_col1:
+        st.markdown("### 🛣️ Optimal Routing Suggestions")
+        
+        route_opts = [
+            {"flight": "UA1247 ORD-LAX", "current_route": "Direct", "optimal_route": "Via DEN", "fuel_savings": "890 lbs", "time_impact": "+12 min", "cost_savings": "$1,240"},
+            {"flight": "UA892 SFO-NRT", "current_route": "Polar Route", "optimal_route": "Pacific Route", "fuel_savings": "1,450 lbs", "time_impact": "-8 min", "cost_savings": "$2,180"},
+            {"flight": "UA156 EWR-LHR", "current_route": "North Atlantic", "optimal_route": "Optimized NAT", "fuel_savings": "650 lbs", "time_impact": "-5 min", "cost_savings": "$980"},
+            {"flight": "UA567 IAH-FRA", "current_route": "Direct", "optimal_route": "Via YYZ", "fuel_savings": "720 lbs", "time_impact": "+18 min", "cost_savings": "$1,090"}
+        ]
+        
+        for route in route_opts:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #0066cc20 0%, #0066cc10 100%); padding: 15px; border-radius: 10px; margin: 10px 0; border-left: 4px solid #0066cc;">
+                <h4 style="margin: 0; color: #0066cc;">{route['flight']}</h4>
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-top: 8px;">
+                    <div><strong>Current:</strong> {route['current_route']}</div>
+                    <div><strong>Optimal:</strong> {route['optimal_route']}</div>
+                    <div><strong>Fuel Savings:</strong> {route['fuel_savings']}</div>
+                    <div><strong>Time Impact:</strong> {route['time_impact']}</div>
+                </div>
+                <div style="text-align: center; margin-top: 10px; font-weight: bold; color: #00aa00;">Cost Savings: {route['cost_savings']}</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with route_col2:
+        st.markdown("### ⛽ Fuel Efficiency Tracking")
+        
+        fuel_data = {
+            "Route Category": ["Domestic Short", "Domestic Long", "International", "Transpacific", "Transatlantic"],
+            "Avg Consumption": ["2,840 lbs", "8,920 lbs", "15,670 lbs", "28,450 lbs", "21,230 lbs"],
+            "vs Target": ["-2.3%", "+1.2%", "-1.8%", "-3.1%", "+0.7%"],
+            "Monthly Savings": ["$89K", "$156K", "$234K", "$445K", "$278K"],
+            "Efficiency Score": [97.7, 98.8, 101.8, 103.1, 99.3]
+        }
+        
+        fuel_df = pd.DataFrame(fuel_data)
+        st.dataframe(fuel_df, use_container_width=True)
+        
+        st.markdown("### 🎯 Performance Targets")
+        
+        perf_col1, perf_col2, perf_col3 = st.columns(3)
+        
+        with perf_col1:
+            st.metric("Fuel Efficiency", "97.2%", "+1.8% vs target")
+        with perf_col2:
+            st.metric("Route Optimization", "94.7%", "+2.3%")
+        with perf_col3:
+            st.metric("On-Time Arrival", "87.4%", "+0.9%")
+    
+    # === 4. CUSTOMER IMPACT ANALYSIS ===
+    section("Customer Impact Analysis")
+    st.markdown("---")
+    st.markdown("## 👥 Customer Impact Analysis")
+    
+    customer_col1, customer_col2 = st.columns([1, 1])
+    
+    with customer_col1:
+        st.markdown("### 📊 Passenger Impact Assessment")
+        
+        impact_analysis = [
+            {"scenario": "UA1247 Delay (45 min)", "passengers": 284, "connections_missed": 67, "hotels_needed": 23, "compensation_est": "$47,800", "satisfaction_impact": "-12 pts"},
+            {"scenario": "UA892 Maintenance AOG", "passengers": 359, "connections_missed": 124, "hotels_needed": 89, "compensation_est": "$156,700", "satisfaction_impact": "-28 pts"},
+            {"scenario": "Weather ORD Hub", "passengers": 1847, "connections_missed": 445, "hotels_needed": 167, "compensation_est": "$389,200", "satisfaction_impact": "-18 pts"}
+        ]
+        
+        for impact in impact_analysis:
+            st.markdown(f"""
+            <div style="background: linear-gradient(135deg, #ff666620 0%, #ff666610 100%); padding: 15px; border-radius: 10px; margin: 10px 0; border-left: 4px solid #ff6666;">
+                <h4 style="margin: 0; color: #ff6666;">{impact['scenario']}</h4>
+                <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 10px; margin-top: 8px; font-size: 14px;">
+                    <div><strong>Passengers:</strong> {impact['passengers']}</div>
+                    <div><strong>Missed Connections:</strong> {impact['connections_missed']}</div>
+                    <div><strong>Hotels Needed:</strong> {impact['hotels_needed']}</div>
+                </div>
+                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin-top: 8px;">
+                    <div><strong>Est. Compensation:</strong> {impact['compensation_est']}</div>
+                    <div><strong>NPS Impact:</strong> {impact['satisfaction_impact']}</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    with customer_col2:
+        st.markdown("### 🔄 Rebooking Strategies")
+        
+        rebooking_data = {
+            "Strategy": ["Same Day Recovery", "Next Day Rebooking", "Partner Airlines", "Refund/Voucher", "Upgrade Recovery"],
+            "Success Rate": ["87%", "94%", "67%", "89%", "78%"],
+            "Avg Cost": ["$245", "$380", "$420", "$290", "$125"],
+            "Customer Satisfaction": [8.2, 6.4, 7.8, 5.9, 9.1],
+            "Implementation Time": ["15 min", "45 min", "30 min", "10 min", "20 min"]
+        }
+        
+        rebooking_df = pd.DataFrame(rebooking_data)
+        st.dataframe(rebooking_df, use_container_width=True)
+        
+        st.markdown("### 💡 AI Rebooking Recommendations")
+        
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #00aa0020 0%, #00aa0010 100%); padding: 15px; border-radius: 10px; border-left: 4px solid #00aa00;">
+            <h4 style="margin: 0; color: #00aa00;">Optimal Strategy: Same Day Recovery + Upgrades</h4>
+            <ul style="margin: 10px 0;">
+                <li>Rebook 67% on same-day flights with upgrade incentives</li>
+                <li>Partner airline solution for 23% (Star Alliance priority)</li>
+                <li>Next-day premium rebooking for remaining 10%</li>
+            </ul>
+            <p style="margin: 5px 0; font-weight: bold;">Expected outcome: 92% customer retention, $156K cost savings</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # === 5. OPERATIONS OPTIMIZATION ===
+    section("Operations Optimization")
+    st.markdown("---")
+    st.markdown("## ⚙️ Operations Optimization")
+    
+    ops_col1, ops_col2, ops_col3 = st.columns(3)
+    
+    with ops_col1:
+        st.markdown("### 🚪 Gate Management")
+        
+        gate_data = {
+            "Terminal": ["Terminal 1", "Terminal 2", "Terminal 3", "Concourse B", "Concourse C"],
+            "Utilization": ["94%", "87%", "91%", "89%", "85%"],
+            "Available Gates": [2, 5, 3, 4, 6],
+            "Peak Congestion": ["14:30-16:00", "12:00-14:30", "15:00-17:30", "13:30-15:00", "16:00-18:00"]
+        }
+        
+        gate_df = pd.DataFrame(gate_data)
+        st.dataframe(gate_df, use_container_width=True)
+    
+    with ops_col2:
+        st.markdown("### 👨‍✈️ Crew Scheduling")
+        
+        crew_data = {
+            "Base": ["ORD Chicago", "SFO San Fran", "EWR Newark", "DEN Denver", "IAH Houston"],
+            "Available Crews": [23, 18, 15, 12, 19],
+            "On Duty": [67, 45, 38, 34, 41],
+            "Reserve Status": [12, 8, 9, 7, 11],
+            "Overtime Risk": ["Medium", "Low", "High", "Low", "Medium"]
+        }
+        
+        crew_df = pd.DataFrame(crew_data)
+        st.dataframe(crew_df, use_container_width=True)
+    
+    with ops_col3:
+        st.markdown("### 🔧 Maintenance Windows")
+        
+        maint_windows = {
+            "Aircraft": ["N12345", "N67890", "N24681", "N13579", "N98765"],
+            "Check Type": ["A-Check", "C-Check", "Line Maint", "B-Check", "Inspection"],
+            "Window Start": ["23:45", "22:30", "21:15", "00:30", "23:00"],
+            "Est Duration": ["4.5 hrs", "18 hrs", "2 hrs", "12 hrs", "3 hrs"],
+            "Completion %": ["85%", "34%", "100%", "67%", "92%"]
+        }
+        
+        maint_df = pd.DataFrame(maint_windows)
+        st.dataframe(maint_df, use_container_width=True)
+    
+    # Performance Summary
+    st.markdown("---")
+    st.markdown("### 🎯 United Airlines Operations Excellence Summary")
+    
+    summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
+    
+    with summary_col1:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #0066cc 0%, #004499 100%); padding: 20px; border-radius: 15px; color: white; text-align: center;">
+            <h3>Operational Efficiency</h3>
+            <h2>94.2%</h2>
+            <p>+1.8 pts vs industry avg</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with summary_col2:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #00aa00 0%, #008800 100%); padding: 20px; border-radius: 15px; color: white; text-align: center;">
+            <h3>Customer Satisfaction</h3>
+            <h2>87.4%</h2>
+            <p>+2.1% vs last quarter</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with summary_col3:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #ff6600 0%, #cc5500 100%); padding: 20px; border-radius: 15px; color: white; text-align: center;">
+            <h3>Cost Optimization</h3>
+            <h2>$2.4M</h2>
+            <p>Monthly savings achieved</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with summary_col4:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #9933cc 0%, #663399 100%); padding: 20px; border-radius: 15px; color: white; text-align: center;">
+            <h3>AI Impact Score</h3>
+            <h2>96.8</h2>
+            <p>Predictive accuracy rate</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+render(get_dashboard())